@@ -0,0 +1,45 @@
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+
+from . import bench_imports, bench_pagination, bench_parsing, bench_registration, bench_serialization
+
+SUITES = {
+    "imports": bench_imports,
+    "pagination": bench_pagination,
+    "parsing": bench_parsing,
+    "serialization": bench_serialization,
+    "registration": bench_registration,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Run the bigmarker performance benchmarks and emit JSON results.")
+    parser.add_argument("--only", choices=sorted(SUITES), action="append", help="run only the named suite(s)")
+    parser.add_argument("--quick", action="store_true", help="smaller workloads for a fast smoke run")
+    parser.add_argument("--output", help="write results to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    results = []
+    for name in args.only or SUITES:
+        results.extend(SUITES[name].run(quick=args.quick))
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        sys.stdout.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = {
+    "imports.bigmarker": "import bigmarker",
+    "imports.client": "from bigmarker import BigMarkerClient",
+    "imports.client_construct": "from bigmarker import BigMarkerClient; BigMarkerClient(token='benchmark')",
+    "imports.register_user": "from bigmarker import BigMarkerClient; from bigmarker.types import UserRegistrant; "
+                             "BigMarkerClient(token='benchmark')",
+    "imports.async_client": "from bigmarker import AsyncBigMarkerClient",
+    "imports.types": "from bigmarker.types import *",
+}
+
+# Modules a cold start must not pull in; the clients only import models in the methods that use them
+UNLOADED = {
+    "imports.bigmarker": ("bigmarker.models", "email_validator"),
+    "imports.client": ("bigmarker.models", "email_validator"),
+    "imports.client_construct": ("bigmarker.models", "email_validator"),
+    "imports.register_user": ("bigmarker.models.conference", "bigmarker.models.attendees", "email_validator"),
+    "imports.async_client": ("bigmarker.models", "email_validator"),
+}
+
+WATCHED = ("requests", "httpx", "phonenumbers", "email_validator", "bigmarker.models")
+
+SCRIPT = """
+import time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+import sys
+print(elapsed, *(module for module in sorted(sys.modules) if module.startswith({watched})))
+"""
+
+
+def cold_import(statement: str) -> tuple[float, list[str]]:
+    output = subprocess.run([sys.executable, "-c", SCRIPT.format(statement=statement, watched=WATCHED)],
+                            check=True, capture_output=True, text=True).stdout.split()
+    return float(output[0]), output[1:]
+
+
+def unexpected(name: str, loaded: list[str]) -> list[str]:
+    forbidden = UNLOADED.get(name, ())
+    return [module for module in loaded
+            if any(module == prefix or module.startswith(prefix + ".") for prefix in forbidden)]
+
+
+def run(quick: bool = False) -> list[dict]:
+    repeat = 3 if quick else 7
+    results = []
+    for name, statement in STATEMENTS.items():
+        timings = []
+        for _ in range(repeat):
+            elapsed, loaded = cold_import(statement)
+            timings.append(elapsed)
+        assert not unexpected(name, loaded), f"{name} imported {', '.join(unexpected(name, loaded))}"
+        results.append({
+            "name": name,
+            "params": {"statement": statement,
+                       "loads": [module for module in ("requests", "httpx", "phonenumbers", "email_validator")
+                                 if module in loaded]},
+            "repeat": repeat,
+            "operations": 1,
+            "min_s": min(timings),
+            "median_s": statistics.median(timings),
+            "ops_per_s": 1 / min(timings),
+        })
+    return results
@@ -0,0 +1,117 @@
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from bigmarker import BigMarkerClient, SingleFlight, Transport, TransportConfig, RecordingTransport, ReplayTransport
+from bigmarker.mock_server import MockBigMarkerServer, MockDataset
+
+from .harness import measure
+
+PAGE_COUNTS = (1, 10, 50)
+PAGE_WORKERS = (1, 8)
+PER_PAGE = 25
+FAN_OUT_CONFERENCES = 20
+FAN_OUT_PAGES = 4
+DECODE_PROCESSES = (0, 4)
+HERD_CALLERS = 20
+LOOKUP_IDS = 200
+
+
+def run(quick: bool = False) -> list[dict]:
+    results = []
+    with MockBigMarkerServer(latency=0.005) as server:
+        for total_pages in PAGE_COUNTS[:2] if quick else PAGE_COUNTS:
+            server.dataset = MockDataset(conferences=total_pages * PER_PAGE, per_page=PER_PAGE)
+            for page_workers in PAGE_WORKERS:
+                client = BigMarkerClient(token="benchmark",
+                                         page_workers=page_workers,
+                                         transport=Transport(TransportConfig(base_url=server.base_url)))
+                params = {"pages": total_pages, "per_page": PER_PAGE, "page_workers": page_workers}
+                results.append(measure("pagination.pages",
+                                       lambda: list(client._pages("conferences")),
+                                       operations=total_pages,
+                                       repeat=3,
+                                       params=params))
+                results.append(measure("pagination.conferences",
+                                       lambda: list(client._conferences()),
+                                       operations=total_pages,
+                                       repeat=3,
+                                       params=params))
+                client.close()
+
+        server.dataset = dataset = MockDataset(conferences=LOOKUP_IDS,
+                                               registrations=FAN_OUT_PAGES * PER_PAGE,
+                                               attendees=FAN_OUT_PAGES * PER_PAGE,
+                                               per_page=PER_PAGE)
+        conference_ids = [dataset.conference_id(i) for i in range(FAN_OUT_CONFERENCES)]
+        client = BigMarkerClient(token="benchmark", transport=Transport(TransportConfig(base_url=server.base_url)))
+        params = {"conferences": FAN_OUT_CONFERENCES, "pages": FAN_OUT_PAGES, "per_page": PER_PAGE}
+        results.append(measure("pagination.attendees_loop",
+                               lambda: [client.get_attendees(conference_id) for conference_id in conference_ids],
+                               operations=FAN_OUT_CONFERENCES * FAN_OUT_PAGES,
+                               repeat=3,
+                               params=params))
+        results.append(measure("pagination.attendees_for",
+                               lambda: client.get_attendees_for(conference_ids, workers=8),
+                               operations=FAN_OUT_CONFERENCES * FAN_OUT_PAGES,
+                               repeat=3,
+                               params=params | {"workers": 8}))
+        client.close()
+
+        lookup_ids = [dataset.conference_id(i) for i in range(LOOKUP_IDS)]
+        client = BigMarkerClient(token="benchmark", transport=Transport(TransportConfig(base_url=server.base_url)))
+        params = {"ids": LOOKUP_IDS}
+        results.append(measure("pagination.conference_lookup_loop",
+                               lambda: [client.get_conference(conference_id) for conference_id in lookup_ids],
+                               operations=LOOKUP_IDS,
+                               repeat=3,
+                               params=params))
+        results.append(measure("pagination.conference_lookup_batched",
+                               lambda: client.get_conferences(lookup_ids),
+                               operations=LOOKUP_IDS,
+                               repeat=3,
+                               params=params))
+        client.close()
+
+        for single_flight in (None, SingleFlight()):
+            client = BigMarkerClient(token="benchmark",
+                                     single_flight=single_flight,
+                                     transport=Transport(TransportConfig(base_url=server.base_url)))
+            with ThreadPoolExecutor(max_workers=HERD_CALLERS) as callers:
+                results.append(measure("pagination.registrations_herd",
+                                       lambda: list(callers.map(client.get_registrations,
+                                                                [conference_ids[0]] * HERD_CALLERS)),
+                                       operations=HERD_CALLERS,
+                                       repeat=3,
+                                       params={"callers": HERD_CALLERS, "pages": FAN_OUT_PAGES,
+                                               "single_flight": single_flight is not None}))
+            client.close()
+
+        server.dataset = dataset = MockDataset(conferences=1, registrations=5000, per_page=500)
+        conference_id = dataset.conference_id(0)
+        params = {"registrations": dataset.registrations, "per_page": dataset.per_page}
+        for decode_processes in DECODE_PROCESSES:
+            client = BigMarkerClient(token="benchmark",
+                                     page_workers=8,
+                                     decode_processes=decode_processes,
+                                     transport=Transport(TransportConfig(base_url=server.base_url)))
+            results.append(measure("pagination.registrations_decode",
+                                   lambda: client.get_registrations(conference_id),
+                                   operations=dataset.registrations,
+                                   repeat=3,
+                                   params=params | {"decode_processes": decode_processes}))
+            client.close()
+
+        with tempfile.TemporaryDirectory() as directory:
+            cassette = os.path.join(directory, "registrations.bmc")
+            with BigMarkerClient(token="benchmark",
+                                 transport=RecordingTransport(cassette,
+                                                              TransportConfig(base_url=server.base_url))) as client:
+                client.get_registrations(conference_id)
+            with BigMarkerClient(token="benchmark", page_workers=8, transport=ReplayTransport(cassette)) as client:
+                results.append(measure("pagination.registrations_replay",
+                                       lambda: client.get_registrations(conference_id),
+                                       operations=dataset.registrations,
+                                       repeat=3,
+                                       params=params))
+    return results
@@ -0,0 +1,62 @@
+import json
+
+from bigmarker.decoding import decode, model_page, records_adapter
+from bigmarker.models.attendees import Attendee
+from bigmarker.models.conference import Conference, ConferenceSummary
+from bigmarker.models.fields import RAW_PHONE_NUMBERS, format_phone_number
+from bigmarker.models.registrations import Registration, CompactRegistration
+
+from .harness import measure
+from .fixtures import load_payload
+
+
+def run(quick: bool = False) -> list[dict]:
+    count = 200 if quick else 2000
+    conference = load_payload("conference")
+    registration = load_payload("registration")
+    attendee = load_payload("attendee")
+    body = json.dumps({"registrations": [registration] * (count // 4), "current_page": 1, "total_pages": 1}).encode()
+    registrations = model_page("registrations", Registration)
+    compact_registrations = model_page("registrations", CompactRegistration)
+    records = [registration] * (count // 4)
+    conferences = [conference] * (count // 10)
+    return [
+        measure("parsing.registration_records_loop",
+                lambda: [Registration(**record) for record in records],
+                operations=len(records)),
+        measure("parsing.registration_records_adapter",
+                lambda: records_adapter(Registration).validate_python(records),
+                operations=len(records)),
+        measure("parsing.registration_page_stdlib",
+                lambda: registrations(json.loads(body)),
+                operations=count // 4),
+        measure("parsing.registration_page_decode",
+                lambda: registrations(decode(body)),
+                operations=count // 4),
+        measure("parsing.registration_page_json",
+                lambda: registrations.from_json(body),
+                operations=count // 4),
+        measure("parsing.registration_page_compact",
+                lambda: compact_registrations.from_json(body),
+                operations=count // 4),
+        measure("parsing.conference",
+                lambda: [Conference(**conference) for _ in range(count // 10)],
+                operations=count // 10),
+        measure("parsing.conference_uncached_phone_numbers",
+                lambda: [format_phone_number.cache_clear() or Conference.model_validate(record)
+                         for record in conferences],
+                operations=count // 10),
+        measure("parsing.conference_raw_phone_numbers",
+                lambda: records_adapter(Conference).validate_python(conferences,
+                                                                    context={RAW_PHONE_NUMBERS: True}),
+                operations=count // 10),
+        measure("parsing.conference_summary",
+                lambda: [ConferenceSummary(**conference) for _ in range(count)],
+                operations=count),
+        measure("parsing.registration",
+                lambda: [Registration(**registration) for _ in range(count)],
+                operations=count),
+        measure("parsing.attendee",
+                lambda: [Attendee(**attendee) for _ in range(count)],
+                operations=count),
+    ]
@@ -0,0 +1,26 @@
+from bigmarker import BigMarkerClient, Transport, TransportConfig
+from bigmarker.mock_server import MockBigMarkerServer, MockDataset
+from bigmarker.models.registrations import UserRegistrant
+
+from .harness import measure
+
+WORKERS = (1, 8)
+
+
+def run(quick: bool = False) -> list[dict]:
+    count = 100 if quick else 1000
+    dataset = MockDataset(conferences=1)
+    registrants = [UserRegistrant(id=dataset.conference_id(0), first_name="Jane", last_name=f"Doe {i}")
+                   for i in range(count)]
+    results = []
+    with MockBigMarkerServer(dataset, latency=0.002) as server:
+        for workers in WORKERS:
+            client = BigMarkerClient(token="benchmark",
+                                     transport=Transport(TransportConfig(base_url=server.base_url)))
+            results.append(measure("registration.register_users",
+                                   lambda: client.register_users(registrants, workers=workers),
+                                   operations=count,
+                                   repeat=3,
+                                   params={"workers": workers}))
+            client.close()
+    return results
@@ -0,0 +1,24 @@
+from datetime import datetime, timezone
+
+from bigmarker.models.conference import ConferenceCreate
+
+from .harness import measure
+
+
+def run(quick: bool = False) -> list[dict]:
+    count = 500 if quick else 5000
+    conference = ConferenceCreate(channel_id="principal",
+                                  title="Quarterly Product Update",
+                                  time_zone="Central Time (US & Canada)",
+                                  schedule_type="one_time",
+                                  start_time=datetime(2024, 1, 1, 10, tzinfo=timezone.utc),
+                                  duration_minutes=60,
+                                  privacy="public",
+                                  webinar_format="webinar",
+                                  webhook_url="https://hooks.example.com/bigmarker",
+                                  webinar_tags={"team": "product"})
+    return [
+        measure("serialization.conference_create_json",
+                lambda: [conference.model_dump_json(exclude_none=True) for _ in range(count)],
+                operations=count),
+    ]
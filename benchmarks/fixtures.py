@@ -0,0 +1,9 @@
+import json
+from pathlib import Path
+
+PAYLOADS = Path(__file__).parent / "payloads"
+
+
+def load_payload(name: str) -> dict:
+    with open(PAYLOADS / f"{name}.json") as payload:
+        return json.load(payload)
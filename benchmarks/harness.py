@@ -0,0 +1,26 @@
+import statistics
+import time
+from typing import Callable, Optional
+
+
+def measure(name: str,
+            func: Callable[[], object],
+            operations: int,
+            repeat: int = 5,
+            params: Optional[dict] = None) -> dict:
+    func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    return {
+        "name": name,
+        "params": params or {},
+        "repeat": repeat,
+        "operations": operations,
+        "min_s": best,
+        "median_s": statistics.median(timings),
+        "ops_per_s": operations / best if best else None,
+    }
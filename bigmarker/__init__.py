@@ -1 +1,64 @@
-from .client import BigMarkerClient
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Static view of the lazy exports below, so type checkers and IDEs resolve them without importing at runtime
+    from .aio import AsyncBigMarkerClient
+    from .cache import ResponseCache, CacheBackend, LRUCacheBackend, SQLiteCacheBackend, CacheStats
+    from .cassette import Cassette, ReplayConfig
+    from .client import BigMarkerClient
+    from .export import ColumnarExport, RecordBatches
+    from .hooks import Hook, RequestEvent
+    from .index import LocalIndex
+    from .metrics import MetricsCollector, MetricsExporter, JSONLinesExporter, OpenTelemetryHook
+    from .ratelimit import TokenBucket, SharedTokenBucket, RetryPolicy
+    from .singleflight import SingleFlight
+    from .sync import ConferenceSync, ConferenceChange
+    from .transport import Transport, RecordingTransport, ReplayTransport
+    from .transport_config import TransportConfig
+
+_EXPORTS = {
+    "BigMarkerClient": ".client",
+    "AsyncBigMarkerClient": ".aio",
+    "Transport": ".transport",
+    "TransportConfig": ".transport_config",
+    "RecordingTransport": ".transport",
+    "ReplayTransport": ".transport",
+    "Cassette": ".cassette",
+    "ReplayConfig": ".cassette",
+    "ResponseCache": ".cache",
+    "CacheBackend": ".cache",
+    "LRUCacheBackend": ".cache",
+    "SQLiteCacheBackend": ".cache",
+    "CacheStats": ".cache",
+    "TokenBucket": ".ratelimit",
+    "SharedTokenBucket": ".ratelimit",
+    "RetryPolicy": ".ratelimit",
+    "SingleFlight": ".singleflight",
+    "Hook": ".hooks",
+    "RequestEvent": ".hooks",
+    "MetricsCollector": ".metrics",
+    "MetricsExporter": ".metrics",
+    "JSONLinesExporter": ".metrics",
+    "OpenTelemetryHook": ".metrics",
+    "ConferenceSync": ".sync",
+    "ConferenceChange": ".sync",
+    "LocalIndex": ".index",
+    "ColumnarExport": ".export",
+    "RecordBatches": ".export",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    # PEP 562: submodules (and requests/httpx/pydantic behind them) load on first attribute access
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,23 @@
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import AsyncBigMarkerClient
+    from .transport import AsyncTransport, AsyncRecordingTransport, AsyncReplayTransport
+
+_EXPORTS = {
+    "AsyncBigMarkerClient": ".client",
+    "AsyncTransport": ".transport",
+    "AsyncRecordingTransport": ".transport",
+    "AsyncReplayTransport": ".transport",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, AsyncIterator, Iterable
+
+from .base import AsyncBaseClient
+
+if TYPE_CHECKING:
+    from bigmarker.models.attendees import Attendee, CompactAttendee
+
+
+class AsyncAttendeeClient(AsyncBaseClient):
+    def _attendees(self, conference_id: str, model: type):
+        return self._pages(f"{conference_id}/attendees/", parse=self._model_page('attendees', model))
+
+    def iter_attendees(self,
+                       conference_id: str,
+                       compact: bool = False) -> AsyncIterator[Attendee | CompactAttendee]:
+        """``compact=True`` yields slotted ``CompactAttendee`` records instead of pydantic models"""
+        from bigmarker.models.attendees import Attendee, CompactAttendee
+
+        model = CompactAttendee if compact else Attendee
+        return self._iter_models(self._attendees(conference_id, model), 'attendees')
+
+    async def get_attendees(self,
+                            conference_id: str,
+                            compact: bool = False) -> list[Attendee] | list[CompactAttendee]:
+        return await self._coalesced(("get_attendees", conference_id, compact),
+                                     lambda: self._collect(self.iter_attendees(conference_id, compact)))
+
+    def iter_attendees_for(self,
+                           conference_ids: Iterable[str],
+                           workers: int = 8) -> AsyncIterator[tuple[str, Attendee]]:
+        from bigmarker.models.attendees import Attendee
+
+        return self._fan_out(conference_ids, lambda conference_id: f"{conference_id}/attendees/",
+                             'attendees', workers,
+                             parse=self._model_page('attendees', Attendee))
+
+    def iter_attendee_records_for(self,
+                                  conference_ids: Iterable[str],
+                                  workers: int = 8) -> AsyncIterator[tuple[str, dict]]:
+        """``iter_attendees_for`` yielding attendees as the API returns them, as plain dicts"""
+        return self._fan_out(conference_ids, lambda conference_id: f"{conference_id}/attendees/",
+                             'attendees', workers)
+
+    async def get_attendees_for(self, conference_ids: Iterable[str], workers: int = 8) -> list[tuple[str, Attendee]]:
+        return [a async for a in self.iter_attendees_for(conference_ids, workers)]
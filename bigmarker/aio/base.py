@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Optional, Iterable, AsyncIterable, AsyncIterator, Callable, Awaitable
+
+from bigmarker.cache import ResponseCache, MISSING
+from bigmarker.clients.core import ClientCore, FanOutPlan, Model, T
+from bigmarker.decoding import ModelPage, parse_page
+from bigmarker.error.token import IncompleteLoginSetupException
+from bigmarker.hooks import Hook, endpoint_template
+from bigmarker.ratelimit import TokenBucket, RetryPolicy
+from bigmarker.singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    import httpx
+    from pydantic import EmailStr
+    from bigmarker.aio.transport import AsyncTransport
+
+
+async def _resolved(value: T | Awaitable[T]) -> T:
+    return await value if inspect.isawaitable(value) else value
+
+
+class AsyncBaseClient(ClientCore):
+    def __init__(self,
+                 token: Optional[str] = None,
+                 email: Optional[EmailStr] = None,
+                 password: Optional[str] = None,
+                 page_workers: Optional[int] = None,
+                 ordered_pages: bool = True,
+                 transport: Optional[AsyncTransport] = None,
+                 cache: Optional[ResponseCache] = None,
+                 rate_limiter: Optional[TokenBucket] = None,
+                 retry: Optional[RetryPolicy] = None,
+                 hooks: Optional[list[Hook]] = None,
+                 raw_phone_numbers: bool = False,
+                 decode_processes: int = 0,
+                 single_flight: Optional[SingleFlight] = None):
+        if token is None and not (email and password is not None):
+            raise IncompleteLoginSetupException("API token or username and password must be provided")
+        if transport is None:
+            from bigmarker.aio.transport import AsyncTransport
+            transport = AsyncTransport()
+        self._transport = transport
+        super().__init__(page_workers, ordered_pages, cache, rate_limiter, retry, hooks, raw_phone_numbers,
+                         decode_processes, single_flight)
+        self._email = email
+        self._password = password
+        self._headers: Optional[dict] = {'API-KEY': token} if token is not None else None
+        self._login_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self):
+        await self._transport.aclose()
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _auth_headers(self) -> dict:
+        if self._headers is not None:
+            return self._headers
+        async with self._login_lock:
+            if self._headers is None:
+                res = await self._transport.request("GET",
+                                                    "members/login",
+                                                    content=f"email={self._email}&password={self._password}")
+                if res.status_code != 200:
+                    raise IncompleteLoginSetupException(f"Response from logging into BigMarker: {res.text}")
+                self._headers = res.json()
+        return self._headers
+
+    async def _request(self, method: str, path: str, headers: Optional[dict] = None, **kwargs) -> httpx.Response:
+        headers = await self._auth_headers() | (headers or {})
+        attempt = 0
+        res = error = None
+        timed = bool(self._instrumentation)
+        started = self._request_started(method, path, kwargs)
+        try:
+            while True:
+                if self._rate_limiter is not None:
+                    await self._rate_limiter.acquire_async()
+                res = None
+                try:
+                    res = await self._transport.request(method, path, timed=timed, headers=headers, **kwargs)
+                except self._transport.network_errors:
+                    delay = self._backoff(method, None, attempt)
+                    if delay is None:
+                        raise
+                else:
+                    delay = self._backoff(method, res, attempt)
+                    if delay is None:
+                        return self._accepted(res, attempt)
+                await asyncio.sleep(delay)
+                attempt += 1
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self._request_finished(method, path, res, attempt, started, kwargs, error)
+
+    async def _cached(self, endpoint: str, identifier: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        if self._cache is None:
+            return await fetch()
+        value = self._cache.get(endpoint, identifier)
+        if value is MISSING:
+            value = await fetch()
+            if value is not None:
+                self._cache.set(endpoint, identifier, value)
+        return value
+
+    async def _coalesced(self, key: tuple, fetch: Callable[[], Awaitable[T]]) -> T:
+        if self._single_flight is None:
+            return await fetch()
+        return await self._single_flight.do_async(key, fetch)
+
+    async def _conditional_get(self,
+                               endpoint: str,
+                               identifier: str,
+                               path: str,
+                               parse: Callable[[httpx.Response], T | Awaitable[T]],
+                               **kwargs) -> T:
+        if self._cache is None:
+            return await _resolved(parse(await self._request("GET", path, **kwargs)))
+        entry = self._cache.lookup(endpoint, identifier)
+        if entry is not None and entry.fresh:
+            return entry.value
+        res = await self._request("GET", path, headers=self._validators(entry), **kwargs)
+        if self._not_modified(endpoint, identifier, entry, res):
+            return entry.value
+        return self._store(endpoint, identifier, res, await _resolved(parse(res)))
+
+    async def _page(self,
+                    url: str,
+                    params: dict,
+                    data: Optional[dict],
+                    endpoint: Optional[str] = None,
+                    parse: Optional[Callable[[dict], dict]] = None) -> dict:
+        timed_parse = self._timed_parse(endpoint_template(url), parse)
+        if endpoint is None:
+            return await _resolved(timed_parse(await self._request("GET", url, params=params, data=data)))
+        return await self._conditional_get(endpoint, self._page_identifier(url, params, data, parse), url,
+                                           timed_parse, params=params, data=data)
+
+    def _timed_parse(self,
+                     endpoint: str,
+                     parse: Optional[Callable] = None) -> Callable[[httpx.Response], Any | Awaitable[dict]]:
+        if self._process_pool is None or not isinstance(parse, ModelPage):
+            return super()._timed_parse(endpoint, parse)
+
+        async def in_process(res: httpx.Response) -> dict:
+            with self._instrumentation.timed(endpoint, "validation"):
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._process_pool, parse_page, res.content, parse.key, parse.model, self._validation_context)
+
+        return in_process
+
+    async def _pages(self,
+                     url: str,
+                     params: Optional[dict] = None,
+                     data: Optional[dict] = None,
+                     endpoint: Optional[str] = None,
+                     parse: Optional[Callable[[dict], dict]] = None):
+        params = params or {}
+        first_page = await self._page(url, params, data, endpoint, parse)
+        yield first_page
+
+        remaining = range(2, first_page['total_pages'] + 1)
+        if not self._concurrent_pages(remaining):
+            for page in remaining:
+                yield await self._page(url, params | {'page': page}, data, endpoint, parse)
+            return
+
+        semaphore = asyncio.Semaphore(self._page_workers)
+
+        async def bounded_page(page: int) -> dict:
+            async with semaphore:
+                return await self._page(url, params | {'page': page}, data, endpoint, parse)
+
+        pages = iter(remaining)
+        pending: list[asyncio.Task] = []
+        try:
+            while True:
+                for page in islice(pages, self._page_window - len(pending)):
+                    pending.append(asyncio.ensure_future(bounded_page(page)))
+                if not pending:
+                    return
+                if self._ordered_pages:
+                    task = pending[0]
+                else:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    task = next(iter(done))
+                pending.remove(task)
+                yield await task
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _fan_out(self,
+                       conference_ids: Iterable[str],
+                       url: Callable[[str], str],
+                       key: str,
+                       workers: int = 8,
+                       endpoint: Optional[str] = None,
+                       parse: Optional[Callable[[dict], dict]] = None) -> AsyncIterator[tuple[str, Model | dict]]:
+        """Yield ``(conference_id, record)`` for the ``key`` records of every conference, parsed by ``parse``; with
+        no ``parse`` the records are the API's plain dicts"""
+        semaphore = asyncio.Semaphore(workers)
+        plan = FanOutPlan(conference_ids, window=workers * 2)
+        pending: dict[asyncio.Task, tuple[str, int]] = {}
+
+        async def bounded_page(conference_id: str, page: int) -> dict:
+            async with semaphore:
+                return await self._page(url(conference_id), {'page': page} if page > 1 else {}, None, endpoint, parse)
+
+        try:
+            while True:
+                for conference_id, page in plan.jobs(len(pending)):
+                    pending[asyncio.ensure_future(bounded_page(conference_id, page))] = (conference_id, page)
+                if not pending:
+                    return
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    conference_id, page_number = pending.pop(task)
+                    page = task.result()
+                    if page_number == 1:
+                        plan.add_pages(conference_id, page['total_pages'])
+                    for record in page[key]:
+                        yield conference_id, record
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    async def _collect(records: AsyncIterable[T]) -> list[T]:
+        return [record async for record in records]
+
+    @staticmethod
+    async def _iter_models(pages: AsyncIterable[dict], key: str) -> AsyncIterator[Model]:
+        async for page in pages:
+            for record in page[key]:
+                yield record
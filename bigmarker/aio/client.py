@@ -0,0 +1,7 @@
+from bigmarker.aio.attendees import AsyncAttendeeClient
+from bigmarker.aio.conference import AsyncConferenceClient
+from bigmarker.aio.registrations import AsyncRegistrationClient
+
+
+class AsyncBigMarkerClient(AsyncConferenceClient, AsyncAttendeeClient, AsyncRegistrationClient):
+    pass
@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional, Literal, AsyncIterator, Iterable
+
+from pydantic import NonNegativeInt, HttpUrl
+
+from .base import AsyncBaseClient
+from bigmarker.clients.conference import CONFERENCE_ID_CHUNK, search_form, cached_conferences, record_found, \
+    conference_form, upload_file_form
+
+if TYPE_CHECKING:
+    from bigmarker.models.conference import Conference, ConferenceSummary, FileStatus, UploadFileStatus, HandoutItem, \
+        HandoutUpload
+    from bigmarker.models.fields import TimeZone
+
+
+class AsyncConferenceClient(AsyncBaseClient):
+    def _conferences(self,
+                     url: str = "conferences",
+                     start_time: NonNegativeInt = 0,
+                     model: Optional[type] = None):
+        params: dict = {
+            'type': 'all',
+            'start_time': start_time
+        }
+        return self._pages(url, params=params, parse=self._model_page('conferences', model) if model else None)
+
+    def _conferences_search(self, search_params: dict, model: type):
+        params: dict = {
+            'type': 'all',
+        }
+        url = "conferences/search/"
+        return self._pages(url, params=params, data=search_params, parse=self._model_page('conferences', model))
+
+    def iter_all_conferences(self, summary: bool = False) -> AsyncIterator[Conference | ConferenceSummary]:
+        from bigmarker.models.conference import Conference, ConferenceSummary
+
+        model = ConferenceSummary if summary else Conference
+        return self._iter_models(self._conferences(model=model), 'conferences')
+
+    async def get_all_conferences(self, summary: bool = False) -> list[Conference] | list[ConferenceSummary]:
+        return [c async for c in self.iter_all_conferences(summary)]
+
+    def iter_conferences_from_timeframe(self,
+                                        start_time: datetime,
+                                        summary: bool = False) -> AsyncIterator[Conference | ConferenceSummary]:
+        from bigmarker.models.conference import Conference, ConferenceSummary
+
+        model = ConferenceSummary if summary else Conference
+        return self._iter_models(self._conferences(start_time=int(start_time.timestamp()), model=model),
+                                 'conferences')
+
+    async def get_conferences_from_timeframe(self,
+                                             start_time: datetime,
+                                             summary: bool = False) -> list[Conference] | list[ConferenceSummary]:
+        return [c async for c in self.iter_conferences_from_timeframe(start_time, summary)]
+
+    def iter_conference_records(self, start_time: Optional[datetime] = None) -> AsyncIterator[dict]:
+        """Conferences starting after ``start_time`` as the API returns them, as plain dicts with no validation"""
+        return self._iter_models(self._conferences(start_time=int(start_time.timestamp()) if start_time else 0),
+                                 'conferences')
+
+    async def get_conference(self, conference_id: str) -> Optional[Conference]:
+        from bigmarker.models.conference import Conference
+
+        return await self._coalesced(("get_conference", conference_id),
+                                     lambda: self._conditional_get("get_conference",
+                                                                   conference_id,
+                                                                   f"conferences/{conference_id}",
+                                                                   self._parse_record("conferences/{id}", Conference)))
+
+    async def get_conferences(self,
+                              conference_ids: Iterable[str],
+                              chunk_size: int = CONFERENCE_ID_CHUNK,
+                              workers: int = 8) -> dict[str, Optional[Conference]]:
+        """Look up many conferences at once, keyed by id in request order; ids the API does not return map to None
+
+        Ids with a fresh ``get_conference`` cache entry are answered from the cache. The rest are resolved through
+        ``search_conference`` in chunks of ``chunk_size`` ids, up to ``workers`` chunks at a time, and the
+        conferences found are cached for ``get_conference``.
+        """
+        found, missing = cached_conferences(self._cache, conference_ids)
+        semaphore = asyncio.Semaphore(workers)
+
+        async def search(chunk: list[str]):
+            async with semaphore:
+                record_found(self._cache, found, await self.search_conference(conference_ids=chunk))
+
+        await asyncio.gather(*(search(missing[i:i + chunk_size]) for i in range(0, len(missing), chunk_size)))
+        return found
+
+    async def search_conference(self,
+                                title: Optional[str] = None,
+                                start_time: Optional[str] = None,
+                                end_time: Optional[str] = None,
+                                conference_ids: Optional[list[str]] = None,
+                                presenter_member_ids: Optional[list[str]] = None,
+                                role: Optional[Literal['hosting', 'attending', 'all']] = None,
+                                summary: bool = False) -> list[Conference] | list[ConferenceSummary]:
+        from bigmarker.models.conference import Conference, ConferenceSummary
+
+        search_parameters = search_form(title, start_time, end_time, conference_ids, presenter_member_ids, role)
+        model = ConferenceSummary if summary else Conference
+        return [c async for c in self._iter_models(self._conferences_search(search_parameters, model), 'conferences')]
+
+    async def get_associated_conferences(self, conference_id: str) -> list[Conference]:
+        return await self._coalesced(("get_associated_conferences", conference_id),
+                                     lambda: self._cached("get_associated_conferences",
+                                                          conference_id,
+                                                          lambda: self._get_associated_conferences(conference_id)))
+
+    async def _get_associated_conferences(self, conference_id: str) -> list[Conference]:
+        from bigmarker.models.conference import Conference
+
+        return [c async for c in self._iter_models(self._conferences(
+            url=f"conferences/get_associated_sessions/{conference_id}", model=Conference),
+            'conferences')]
+
+    async def get_recurring_conferences(self, conference_id: str) -> list[Conference]:
+        return await self._coalesced(("get_recurring_conferences", conference_id),
+                                     lambda: self._cached("get_recurring_conferences",
+                                                          conference_id,
+                                                          lambda: self._get_recurring_conferences(conference_id)))
+
+    async def _get_recurring_conferences(self, conference_id: str) -> list[Conference]:
+        from bigmarker.models.conference import Conference
+
+        return [c async for c in self._iter_models(self._conferences(
+            url=f"conferences/recurring/{conference_id}", model=Conference),
+            'conferences')]
+
+    async def create_conference(self,
+                                channel_id: str,
+                                title: str,
+                                conference_copy_id: Optional[str] = None,
+                                presenter_exit_url: Optional[HttpUrl] = None,
+                                sub_url: Optional[HttpUrl] = None,
+                                enable_dial_in: Optional[bool] = None,
+                                purpose: Optional[str] = None,
+                                time_zone: Optional[TimeZone] = None,
+                                room_logo: Optional[HttpUrl] = None,
+                                conference_logo: Optional[HttpUrl] = None,
+                                apply_conference_logo_to_channel: Optional[bool] = None,
+                                room_sub_title: Optional[str] = None,
+                                schedule_type: Optional[Literal["24_hour_room", "one_time"]] = None,
+                                start_time: datetime = None,
+                                recurring_start_times: list[datetime] = None,
+                                webcast_mode: Optional[Literal["automatic", "required", "optional"]] = None,
+                                duration_minutes: Optional[int] = None,
+                                who_can_watch_recording: Optional[
+                                    Literal[
+                                        "everyone", "channel_admin_only", "channel_subscribers", "attendees", "attendees_registrants"]] = None,
+                                presenter_advanced_enter_time: Optional[Literal["60", "120", "180"]] = None,
+                                attendee_advanced_enter_time: Optional[Literal["15", "30"]] = None,
+                                privacy: Optional[Literal["private", "public"]] = None,
+                                webinar_format: Optional[Literal["webinar", "livestream", "on_demand"]] = None,
+                                ondemand_video_url: Optional[HttpUrl] = None,
+                                enable_knock_to_enter: Optional[bool] = None,
+                                registration_conf_emails: Optional[bool] = None,
+                                send_notification_emails_to_presenters: Optional[bool] = None,
+                                send_reminder_emails_to_presenters: Optional[bool] = None,
+                                show_reviews: Optional[bool] = None,
+                                review_emails: Optional[bool] = None,
+                                poll_results: Optional[bool] = None,
+                                enable_ie_safari: Optional[bool] = None,
+                                enable_twitter: Optional[bool] = None,
+                                send_cancellation_email: Optional[bool] = None,
+                                webhook_url: Optional[HttpUrl] = None,
+                                exit_url: Optional[HttpUrl] = None,
+                                enable_create_webinar_reg_webhook: Optional[bool] = None,
+                                enable_new_reg_webhook: Optional[bool] = None,
+                                new_reg_webhook_url: Optional[HttpUrl] = None,
+                                enable_webinar_start_webhook: Optional[bool] = None,
+                                webinar_start_webhook_url: Optional[HttpUrl] = None,
+                                enable_waiting_room_open_webhook: Optional[bool] = None,
+                                waiting_room_open_webhook_url: Optional[HttpUrl] = None,
+                                enable_webinar_end_webhook: Optional[bool] = None,
+                                webinar_end_webhook_url: Optional[HttpUrl] = None,
+                                enable_live_attendee_data_webhook: Optional[bool] = None,
+                                live_attendee_data_webhook_url: Optional[HttpUrl] = None,
+                                enable_on_demand_viewer_webhook: Optional[bool] = None,
+                                on_demand_viewer_webhook_url: Optional[HttpUrl] = None,
+                                registration_required_to_view_recording: Optional[bool] = None,
+                                channel_admin_id: Optional[str] = None,
+                                background_image_url: Optional[HttpUrl] = None,
+                                room_type: Optional[Literal["1", "attendee_as_presenter", "attendee_mic_and_cam"]] = None,
+                                display_language: Optional[str] = None,
+                                show_handout_on_page: Optional[bool] = None,
+                                banner_filter_percentage: Optional[float] = None,
+                                icon: Optional[HttpUrl] = None,
+                                webinar_tags: Optional[dict[str, str]] = None) -> Conference:
+        from bigmarker.models.conference import Conference, ConferenceCreate
+
+        res = await self._request("POST",
+                                  "conferences",
+                                  json=conference_form(ConferenceCreate, locals()))
+        if res.status_code != 201:
+            raise Exception(res.text)
+        return Conference(**res.json())
+
+    async def update_conference(self,
+                                conference_id: str,
+                                title: str,
+                                presenter_exit_url: Optional[HttpUrl] = None,
+                                sub_url: Optional[HttpUrl] = None,
+                                enable_dial_in: Optional[bool] = None,
+                                purpose: Optional[str] = None,
+                                time_zone: Optional[TimeZone] = None,
+                                room_logo: Optional[HttpUrl] = None,
+                                conference_logo: Optional[HttpUrl] = None,
+                                apply_conference_logo_to_channel: Optional[bool] = None,
+                                room_sub_title: Optional[str] = None,
+                                schedule_type: Optional[Literal["24_hour_room", "one_time"]] = None,
+                                start_time: datetime = None,
+                                recurring_start_times: list[datetime] = None,
+                                webcast_mode: Optional[Literal["automatic", "required", "optional"]] = None,
+                                duration_minutes: Optional[int] = None,
+                                who_can_watch_recording: Optional[
+                                    Literal[
+                                        "everyone", "channel_admin_only", "channel_subscribers", "attendees", "attendees_registrants"]] = None,
+                                presenter_advanced_enter_time: Optional[Literal["60", "120", "180"]] = None,
+                                attendee_advanced_enter_time: Optional[Literal["15", "30"]] = None,
+                                privacy: Optional[Literal["private", "public"]] = None,
+                                webinar_format: Optional[Literal["webinar", "livestream", "on_demand"]] = None,
+                                ondemand_video_url: Optional[HttpUrl] = None,
+                                enable_knock_to_enter: Optional[bool] = None,
+                                registration_conf_emails: Optional[bool] = None,
+                                send_notification_emails_to_presenters: Optional[bool] = None,
+                                send_reminder_emails_to_presenters: Optional[bool] = None,
+                                show_reviews: Optional[bool] = None,
+                                review_emails: Optional[bool] = None,
+                                poll_results: Optional[bool] = None,
+                                enable_ie_safari: Optional[bool] = None,
+                                enable_twitter: Optional[bool] = None,
+                                send_cancellation_email: Optional[bool] = None,
+                                webhook_url: Optional[HttpUrl] = None,
+                                exit_url: Optional[HttpUrl] = None,
+                                enable_create_webinar_reg_webhook: Optional[bool] = None,
+                                enable_new_reg_webhook: Optional[bool] = None,
+                                new_reg_webhook_url: Optional[HttpUrl] = None,
+                                enable_webinar_start_webhook: Optional[bool] = None,
+                                webinar_start_webhook_url: Optional[HttpUrl] = None,
+                                enable_waiting_room_open_webhook: Optional[bool] = None,
+                                waiting_room_open_webhook_url: Optional[HttpUrl] = None,
+                                enable_webinar_end_webhook: Optional[bool] = None,
+                                webinar_end_webhook_url: Optional[HttpUrl] = None,
+                                enable_live_attendee_data_webhook: Optional[bool] = None,
+                                live_attendee_data_webhook_url: Optional[HttpUrl] = None,
+                                enable_on_demand_viewer_webhook: Optional[bool] = None,
+                                on_demand_viewer_webhook_url: Optional[HttpUrl] = None,
+                                registration_required_to_view_recording: Optional[bool] = None,
+                                channel_admin_id: Optional[str] = None,
+                                background_image_url: Optional[HttpUrl] = None,
+                                room_type: Optional[Literal["1", "attendee_as_presenter", "attendee_mic_and_cam"]] = None,
+                                display_language: Optional[str] = None,
+                                show_handout_on_page: Optional[bool] = None,
+                                banner_filter_percentage: Optional[float] = None,
+                                icon: Optional[HttpUrl] = None,
+                                webinar_tags: Optional[dict[str, str]] = None) -> Conference:
+        from bigmarker.models.conference import Conference, ConferenceUpdate
+
+        res = await self._request("PUT",
+                                  f"conferences/{conference_id}",
+                                  json=conference_form(ConferenceUpdate, locals()))
+        self._invalidate_conference(conference_id)
+        if res.status_code != 201:
+            raise Exception(res.text)
+        return Conference(**res.json())
+
+    async def upload_preloaded_file(self,
+                                    conference_id: str,
+                                    file_url: HttpUrl,
+                                    autoplay: Optional[bool] = None) -> UploadFileStatus:
+        from bigmarker.models.conference import UploadFileStatus
+
+        res = await self._request("PUT",
+                                  f"conferences/{conference_id}/upload_file",
+                                  data=upload_file_form(file_url, autoplay))
+        self._invalidate_conference(conference_id)
+
+        if res.status_code != 201:
+            return UploadFileStatus(
+                success=False,
+                message=res.json()["error"]
+            )
+
+        return UploadFileStatus(
+            success=True,
+            message=res.json()['success'],
+            id=res.json()['id'],
+            type=res.json()['file_type']
+        )
+
+    async def delete_preloaded_file(self,
+                                    conference_id: str,
+                                    file_id: str) -> FileStatus:
+        from bigmarker.models.conference import FileStatus
+
+        res = await self._request("PUT", f"conferences/{conference_id}/upload_file/delete_file/{file_id}")
+        self._invalidate_conference(conference_id)
+
+        if res.status_code != 201:
+            return FileStatus(
+                success=False,
+                message=res.json()["error"]
+            )
+
+        return FileStatus(
+            success=True,
+            message=res.json()['success']
+        )
+
+    async def upload_handout(self, conference_id: str, handout: HandoutUpload) -> HandoutItem:
+        from bigmarker.models.conference import HandoutItem
+
+        res = await self._request("POST",
+                                  f"conferences/{conference_id}/add_handout_with_url",
+                                  json=handout.model_dump(mode="json", exclude_none=True))
+        self._invalidate_conference(conference_id)
+        if res.status_code == 201:
+            return HandoutItem(**res.json())
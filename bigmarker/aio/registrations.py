@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, AsyncIterator, AsyncIterable, Iterable, Optional
+
+from pydantic import HttpUrl
+
+from .base import AsyncBaseClient
+from bigmarker.checkpoint import RegistrationCheckpoint
+from bigmarker.clients.regirstrations import REGISTRATION_ERRORS, registration_result
+
+if TYPE_CHECKING:
+    from bigmarker.models.registrations import Registration, CompactRegistration, UserRegistrant, RegistrationResult
+
+
+class AsyncRegistrationClient(AsyncBaseClient):
+    def _registrations(self, conference_id: str, model: type, keyword: str = "registrations"):
+        return self._pages(f"conferences/{keyword}/{conference_id}",
+                           endpoint=f"get_{keyword}",
+                           parse=self._model_page('registrations', model))
+
+    def iter_registrations(self,
+                           conference_id: str,
+                           compact: bool = False) -> AsyncIterator[Registration | CompactRegistration]:
+        """``compact=True`` yields slotted ``CompactRegistration`` records instead of pydantic models"""
+        from bigmarker.models.registrations import Registration, CompactRegistration
+
+        model = CompactRegistration if compact else Registration
+        return self._iter_models(self._registrations(conference_id, model), 'registrations')
+
+    async def get_registrations(self,
+                                conference_id: str,
+                                compact: bool = False) -> list[Registration] | list[CompactRegistration]:
+        return await self._coalesced(("get_registrations", conference_id, compact),
+                                     lambda: self._collect(self.iter_registrations(conference_id, compact)))
+
+    def iter_registrations_for(self,
+                               conference_ids: Iterable[str],
+                               workers: int = 8) -> AsyncIterator[tuple[str, Registration]]:
+        from bigmarker.models.registrations import Registration
+
+        return self._fan_out(conference_ids, lambda conference_id: f"conferences/registrations/{conference_id}",
+                             'registrations', workers,
+                             endpoint="get_registrations",
+                             parse=self._model_page('registrations', Registration))
+
+    def iter_registration_records_for(self,
+                                      conference_ids: Iterable[str],
+                                      workers: int = 8) -> AsyncIterator[tuple[str, dict]]:
+        """``iter_registrations_for`` yielding registrations as the API returns them, as plain dicts"""
+        return self._fan_out(conference_ids, lambda conference_id: f"conferences/registrations/{conference_id}",
+                             'registrations', workers, endpoint="get_registrations")
+
+    async def get_registrations_for(self,
+                                    conference_ids: Iterable[str],
+                                    workers: int = 8) -> list[tuple[str, Registration]]:
+        return [r async for r in self.iter_registrations_for(conference_ids, workers)]
+
+    def iter_checked_in_registrations(self, conference_id: str) -> AsyncIterator[Registration]:
+        from bigmarker.models.registrations import Registration
+
+        return self._iter_models(self._registrations(conference_id, Registration, "checked_in_registrations"),
+                                 'registrations')
+
+    async def get_checked_in_registrations(self, conference_id: str) -> list[Registration]:
+        return await self._coalesced(("get_checked_in_registrations", conference_id),
+                                     lambda: self._collect(self.iter_checked_in_registrations(conference_id)))
+
+    async def _put_registrant(self, registrant: UserRegistrant):
+        return await self._request("PUT",
+                                   "conferences/register",
+                                   json=registrant.model_dump(mode="json",
+                                                              by_alias=True,
+                                                              exclude_none=True))
+
+    async def register_user(self, registrant: UserRegistrant) -> HttpUrl | str:
+        response = await self._put_registrant(registrant)
+        if response.status_code in REGISTRATION_ERRORS:
+            return REGISTRATION_ERRORS[response.status_code]
+
+        return response.json()["conference_url"]
+
+    async def _register_row(self, index: int, registrant: UserRegistrant) -> RegistrationResult:
+        from bigmarker.models.registrations import RegistrationResult
+
+        try:
+            return registration_result(index, registrant, await self._put_registrant(registrant))
+        except Exception as e:
+            return RegistrationResult(index, registrant.conference_id, error=f"{type(e).__name__}: {e}")
+
+    @staticmethod
+    async def _enumerate(registrants: Iterable[UserRegistrant] | AsyncIterable[UserRegistrant]):
+        if isinstance(registrants, AsyncIterable):
+            index = 0
+            async for registrant in registrants:
+                yield index, registrant
+                index += 1
+        else:
+            for index, registrant in enumerate(registrants):
+                yield index, registrant
+
+    @staticmethod
+    def _completed(tasks: Iterable[asyncio.Task], progress: Optional[RegistrationCheckpoint]):
+        for task in tasks:
+            result = task.result()
+            if progress is not None and result.ok:
+                progress.record(result.index, result.url)
+            yield result
+
+    async def iter_register_users(self,
+                                  registrants: Iterable[UserRegistrant] | AsyncIterable[UserRegistrant],
+                                  workers: int = 8,
+                                  checkpoint: Optional[str] = None) -> AsyncIterator[RegistrationResult]:
+        with RegistrationCheckpoint(checkpoint) if checkpoint else nullcontext() as progress:
+            pending: set[asyncio.Task] = set()
+            try:
+                async for index, registrant in self._enumerate(registrants):
+                    if progress is not None and index in progress:
+                        continue
+                    if len(pending) >= workers:
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for result in self._completed(done, progress):
+                            yield result
+                    pending.add(asyncio.ensure_future(self._register_row(index, registrant)))
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for result in self._completed(done, progress):
+                        yield result
+            finally:
+                for task in pending:
+                    task.cancel()
+
+    async def register_users(self,
+                             registrants: Iterable[UserRegistrant] | AsyncIterable[UserRegistrant],
+                             workers: int = 8,
+                             checkpoint: Optional[str] = None) -> list[RegistrationResult]:
+        return sorted([r async for r in self.iter_register_users(registrants, workers, checkpoint)])
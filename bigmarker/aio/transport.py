@@ -0,0 +1,108 @@
+import asyncio
+import time
+from typing import Optional
+
+import httpx
+
+from bigmarker.cassette import CassetteRecorder, Cassette, Replay, ReplayConfig
+from bigmarker.hooks import RequestTimings
+from bigmarker.transport_config import TransportConfig
+
+TIMED_PHASES = {
+    "connection.connect_tcp": "connect",
+    "connection.start_tls": "connect",
+    "http11.send_request_headers": "ttfb",
+    "http11.receive_response_headers": "ttfb",
+    "http2.send_request_headers": "ttfb",
+    "http2.receive_response_headers": "ttfb",
+    "http11.receive_response_body": "body",
+    "http2.receive_response_body": "body",
+}
+
+
+class AsyncTransport:
+    network_errors = (httpx.TransportError,)
+
+    def __init__(self,
+                 config: Optional[TransportConfig] = None,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.config = config or TransportConfig()
+        limits = httpx.Limits(max_connections=self.config.max_connections,
+                              max_keepalive_connections=self.config.pool_maxsize if self.config.keep_alive else 0,
+                              keepalive_expiry=self.config.keepalive_expiry)
+        self.session = httpx.AsyncClient(limits=limits,
+                                         timeout=httpx.Timeout(self.config.read_timeout,
+                                                               connect=self.config.connect_timeout),
+                                         headers={} if self.config.keep_alive else {'Connection': 'close'},
+                                         transport=transport)
+
+    async def request(self, method: str, path: str, timed: bool = False, **kwargs) -> httpx.Response:
+        """Send a request; ``timed`` traces it and attaches connect/ttfb/body ``timings`` to the response"""
+        if not timed:
+            return await self.session.request(method, self.config.url(path), **kwargs)
+        timings = RequestTimings()
+        started: dict[str, float] = {}
+
+        async def trace(event: str, info: dict):
+            name, _, state = event.rpartition(".")
+            phase = TIMED_PHASES.get(name)
+            if phase is None:
+                return
+            if state == "started":
+                started[name] = time.perf_counter()
+            elif state == "complete" and name in started:
+                elapsed = time.perf_counter() - started.pop(name)
+                setattr(timings, phase, (getattr(timings, phase) or 0.0) + elapsed)
+
+        res = await self.session.request(method, self.config.url(path), extensions={"trace": trace}, **kwargs)
+        res.timings = timings
+        return res
+
+    async def aclose(self):
+        await self.session.aclose()
+
+
+class AsyncRecordingTransport(AsyncTransport):
+    """An ``AsyncTransport`` that also writes every response to a cassette at ``path`` for replay"""
+
+    def __init__(self,
+                 path: str,
+                 config: Optional[TransportConfig] = None,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        super().__init__(config, transport)
+        self.recorder = CassetteRecorder(path)
+
+    async def request(self, method: str, path: str, timed: bool = False, **kwargs) -> httpx.Response:
+        res = await super().request(method, path, timed, **kwargs)
+        self.recorder.record(method, path, kwargs, res.status_code, res.headers, res.content)
+        return res
+
+    async def aclose(self):
+        await super().aclose()
+        self.recorder.close()
+
+
+class AsyncReplayTransport:
+    """Serve requests from a recorded cassette, with the latency, throughput and faults set in ``replay``"""
+    network_errors = AsyncTransport.network_errors
+
+    def __init__(self,
+                 cassette: str | Cassette,
+                 config: Optional[TransportConfig] = None,
+                 replay: Optional[ReplayConfig] = None):
+        self.config = config or TransportConfig()
+        self.replay = Replay(cassette, replay)
+
+    async def request(self, method: str, path: str, timed: bool = False, **kwargs) -> httpx.Response:
+        replayed = self.replay.respond(method, path, kwargs)
+        await asyncio.sleep(replayed.ttfb + replayed.body)
+        res = httpx.Response(replayed.status_code,
+                             headers=replayed.headers,
+                             content=replayed.content,
+                             request=httpx.Request(method, self.config.url(path)))
+        res.timings = RequestTimings()
+        res.timings.ttfb, res.timings.body = replayed.ttfb, replayed.body
+        return res
+
+    async def aclose(self):
+        self.replay.close()
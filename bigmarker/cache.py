@@ -0,0 +1,197 @@
+import pickle
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional
+
+MISSING = object()
+
+CONFERENCE_ENDPOINTS = ("get_conference", "get_associated_conferences", "get_recurring_conferences")
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    expires_at: Optional[float]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires_at is None or self.expires_at > time.time()
+
+    @property
+    def validators(self) -> dict[str, str]:
+        headers = {}
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class CacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._lock = threading.Lock()
+
+    def record(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def reset(self):
+        with self._lock:
+            self.hits = self.misses = self.revalidations = 0
+
+    def __repr__(self):
+        return f"CacheStats(hits={self.hits}, misses={self.misses}, revalidations={self.revalidations})"
+
+
+class CacheBackend(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry):
+        ...
+
+    @abstractmethod
+    def delete(self, key: str):
+        ...
+
+    @abstractmethod
+    def clear(self):
+        ...
+
+
+class LRUCacheBackend(CacheBackend):
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCacheBackend(CacheBackend):
+    def __init__(self, path: str = "bigmarker-cache.sqlite3", maxsize: int = 100_000):
+        import sqlite3
+
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS cache ("
+                                 "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL, "
+                                 "etag TEXT, last_modified TEXT, accessed_at REAL NOT NULL)")
+        self._connection.commit()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._connection.execute("SELECT value, expires_at, etag, last_modified FROM cache WHERE key = ?",
+                                           (key,)).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._connection.commit()
+        return CacheEntry(pickle.loads(row[0]), *row[1:])
+
+    def set(self, key: str, entry: CacheEntry):
+        value = pickle.dumps(entry.value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._connection.execute("INSERT OR REPLACE INTO cache (key, value, expires_at, etag, last_modified, "
+                                     "accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                                     (key, value, entry.expires_at, entry.etag, entry.last_modified, time.time()))
+            self._connection.execute("DELETE FROM cache WHERE key IN ("
+                                     "SELECT key FROM cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                                     (self.maxsize,))
+            self._connection.commit()
+
+    def delete(self, key: str):
+        with self._lock:
+            self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._connection.commit()
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM cache")
+            self._connection.commit()
+
+    def close(self):
+        self._connection.close()
+
+
+class ResponseCache:
+    def __init__(self,
+                 backend: Optional[CacheBackend] = None,
+                 ttl: Optional[float] = 60.0,
+                 ttls: Optional[dict[str, Optional[float]]] = None):
+        self.backend = backend or LRUCacheBackend()
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.stats = CacheStats()
+
+    @staticmethod
+    def key(endpoint: str, identifier: str) -> str:
+        return f"{endpoint}:{identifier}"
+
+    def lookup(self, endpoint: str, identifier: str) -> Optional[CacheEntry]:
+        key = self.key(endpoint, identifier)
+        entry = self.backend.get(key)
+        if entry is not None and not entry.fresh and not entry.validators:
+            self.backend.delete(key)
+            entry = None
+        self.stats.record('hits' if entry is not None and entry.fresh else 'misses')
+        return entry
+
+    def get(self, endpoint: str, identifier: str) -> Any:
+        entry = self.lookup(endpoint, identifier)
+        if entry is None or not entry.fresh:
+            return MISSING
+        return entry.value
+
+    def set(self,
+            endpoint: str,
+            identifier: str,
+            value: Any,
+            etag: Optional[str] = None,
+            last_modified: Optional[str] = None):
+        self.backend.set(self.key(endpoint, identifier),
+                         CacheEntry(value, self._expires_at(endpoint), etag, last_modified))
+
+    def revalidated(self, endpoint: str, identifier: str, entry: CacheEntry):
+        self.stats.record('revalidations')
+        self.backend.set(self.key(endpoint, identifier), entry._replace(expires_at=self._expires_at(endpoint)))
+
+    def _expires_at(self, endpoint: str) -> Optional[float]:
+        ttl = self.ttls.get(endpoint, self.ttl)
+        return time.time() + ttl if ttl is not None else None
+
+    def invalidate_conference(self, conference_id: str):
+        for endpoint in CONFERENCE_ENDPOINTS:
+            self.backend.delete(self.key(endpoint, conference_id))
+
+    def clear(self):
+        self.backend.clear()
@@ -0,0 +1,188 @@
+import hashlib
+import json
+import mmap
+import random
+import struct
+import threading
+import zlib
+from typing import NamedTuple, Optional
+from urllib.parse import urlencode
+
+from pydantic import BaseModel, NonNegativeFloat, NonNegativeInt, PositiveFloat, confloat
+
+from bigmarker.error.cassette import CassetteMissException
+from bigmarker.ratelimit import TokenBucket
+
+MAGIC = b"BMCASS01"
+FOOTER = struct.Struct("<QQ")
+# Requests whose bodies carry credentials, and response headers that carry session state, are never written out
+UNRECORDED_PATHS = ("members/login",)
+UNRECORDED_HEADERS = frozenset({"set-cookie", "content-encoding", "content-length", "transfer-encoding"})
+
+
+def request_key(method: str, path: str, kwargs: dict) -> str:
+    """Identify a request by method, path, query and a digest of its body; auth headers are not part of it"""
+    key = f"{method.upper()} {path}"
+    params = kwargs.get("params")
+    if params:
+        key += f"?{urlencode(sorted(params.items()))}"
+    body = kwargs.get("data") or kwargs.get("content")
+    if kwargs.get("json") is not None:
+        body = json.dumps(kwargs["json"], sort_keys=True)
+    elif isinstance(body, dict):
+        body = urlencode(sorted(body.items()))
+    if body:
+        key += f"#{hashlib.blake2b(body if isinstance(body, bytes) else body.encode(), digest_size=8).hexdigest()}"
+    return key
+
+
+class CassetteEntry(NamedTuple):
+    status_code: int
+    headers: dict[str, str]
+    offset: int
+    length: int
+
+
+class CassetteRecorder:
+    """Append responses to a cassette file
+
+    Bodies are zlib-compressed one by one (identical bodies are stored once) so the replaying side can decompress any
+    single response straight out of a memory map; the index of keys to responses is written on ``close``.
+    """
+
+    def __init__(self, path: str, level: int = 6):
+        self.level = level
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+        self._index: dict[str, list[CassetteEntry]] = {}
+        self._blobs: dict[bytes, tuple[int, int]] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def record(self, method: str, path: str, kwargs: dict, status_code: int, headers, body: bytes):
+        if path.startswith(UNRECORDED_PATHS):
+            return
+        key = request_key(method, path, kwargs)
+        headers = {name: value for name, value in headers.items() if name.lower() not in UNRECORDED_HEADERS}
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        with self._lock:
+            if digest not in self._blobs:
+                blob = zlib.compress(body, self.level)
+                self._blobs[digest] = (self._file.tell(), len(blob))
+                self._file.write(blob)
+            offset, length = self._blobs[digest]
+            self._index.setdefault(key, []).append(CassetteEntry(status_code, headers, offset, length))
+
+    def close(self):
+        with self._lock:
+            if self._file.closed:
+                return
+            index = zlib.compress(json.dumps(self._index, separators=(',', ':')).encode(), self.level)
+            offset = self._file.tell()
+            self._file.write(index)
+            self._file.write(FOOTER.pack(offset, len(index)))
+            self._file.close()
+
+
+class Cassette:
+    """Read-only, memory-mapped view of a recorded cassette"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a bigmarker cassette")
+        offset, length = FOOTER.unpack(self._map[-FOOTER.size:])
+        index = json.loads(zlib.decompress(self._map[offset:offset + length]))
+        self.index: dict[str, list[CassetteEntry]] = {key: [CassetteEntry(*entry) for entry in entries]
+                                                      for key, entries in index.items()}
+
+    def __len__(self) -> int:
+        return sum(map(len, self.index.values()))
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+
+    def body(self, entry: CassetteEntry) -> bytes:
+        return zlib.decompress(self._map[entry.offset:entry.offset + entry.length])
+
+    def close(self):
+        self._map.close()
+
+
+class ReplayConfig(BaseModel):
+    latency: NonNegativeFloat = 0.0
+    jitter: NonNegativeFloat = 0.0
+    bandwidth: Optional[PositiveFloat] = None
+    requests_per_second: Optional[PositiveFloat] = None
+    rate_limit_rate: confloat(ge=0, le=1) = 0.0
+    error_rate: confloat(ge=0, le=1) = 0.0
+    error_statuses: tuple[int, ...] = (500, 502, 503, 504)
+    retry_after: NonNegativeInt = 1
+    seed: Optional[int] = 0
+
+
+class ReplayedResponse(NamedTuple):
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    ttfb: float
+    body: float
+
+
+class Replay:
+    """Pick what a replayed request returns and how long it takes
+
+    Each key replays its recorded responses in order and then keeps returning the last one. ``latency`` (plus up to
+    ``jitter``) is the time to first byte, ``bandwidth`` in bytes per second stretches the body, and
+    ``requests_per_second`` queues requests behind a token bucket. ``rate_limit_rate`` and ``error_rate`` replace that
+    fraction of responses with a 429 (with ``Retry-After``) or one of ``error_statuses`` without using up a recorded
+    response; with a fixed ``seed`` the same run produces the same faults.
+    """
+
+    def __init__(self, cassette: str | Cassette, config: Optional[ReplayConfig] = None):
+        self.cassette = Cassette(cassette) if isinstance(cassette, str) else cassette
+        self.config = config or ReplayConfig()
+        self._random = random.Random(self.config.seed)
+        self._positions: dict[str, int] = {}
+        self._bucket = (TokenBucket(self.config.requests_per_second, capacity=1, adaptive=False)
+                        if self.config.requests_per_second else None)
+        self._lock = threading.Lock()
+
+    def respond(self, method: str, path: str, kwargs: dict) -> ReplayedResponse:
+        key = request_key(method, path, kwargs)
+        entries = self.cassette.index.get(key)
+        if not entries:
+            raise CassetteMissException(f"No recorded response for {key}")
+        config = self.config
+        with self._lock:
+            roll = self._random.random()
+            ttfb = config.latency + self._random.uniform(0, config.jitter)
+            error_status = self._random.choice(config.error_statuses) if config.error_statuses else 500
+            faulted = roll < config.rate_limit_rate + config.error_rate
+            position = self._positions.get(key, 0)
+            # An injected fault stands in for the recorded response, so the retry gets the same entry
+            if not faulted:
+                self._positions[key] = min(position + 1, len(entries) - 1)
+        if self._bucket is not None:
+            ttfb += self._bucket.reserve()
+
+        if roll < config.rate_limit_rate:
+            return ReplayedResponse(429, {"Retry-After": str(config.retry_after)},
+                                    b'{"error": "Rate limit exceeded"}', ttfb, 0.0)
+        if faulted:
+            return ReplayedResponse(error_status, {}, b'{"error": "Injected server error"}', ttfb, 0.0)
+        entry = entries[position]
+        content = self.cassette.body(entry)
+        return ReplayedResponse(entry.status_code, entry.headers, content, ttfb,
+                                len(content) / config.bandwidth if config.bandwidth else 0.0)
+
+    def close(self):
+        self.cassette.close()
@@ -0,0 +1,45 @@
+import json
+import os
+from typing import Optional
+
+
+class RegistrationCheckpoint:
+    def __init__(self, path: str):
+        self.path = path
+        self.completed: set[int] = set()
+        if os.path.exists(path):
+            self._load()
+        self._file = None
+
+    def _load(self):
+        with open(self.path, "rb+") as checkpoint:
+            lines = checkpoint.readlines()
+            for number, line in enumerate(lines, 1):
+                if not line.strip():
+                    continue
+                try:
+                    self.completed.add(json.loads(line)["index"])
+                except ValueError:
+                    if number < len(lines):
+                        raise
+                    # A crash part way through ``record`` leaves a torn last line: drop it and redo that row
+                    checkpoint.truncate(checkpoint.tell() - len(line))
+                    return
+            if lines and not lines[-1].endswith(b"\n"):
+                checkpoint.write(b"\n")
+
+    def __enter__(self):
+        self._file = open(self.path, "a")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._file.close()
+        self._file = None
+
+    def __contains__(self, index: int) -> bool:
+        return index in self.completed
+
+    def record(self, index: int, url: Optional[str]):
+        self.completed.add(index)
+        self._file.write(json.dumps({"index": index, "url": url}) + "\n")
+        self._file.flush()
@@ -1,12 +1,43 @@
-from typing import Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Iterator, Iterable
 
 from .base import BaseClient
-from bigmarker.models.attendees import Attendee
+
+if TYPE_CHECKING:
+    from bigmarker.models.attendees import Attendee, CompactAttendee
 
 
 class AttendeeClient(BaseClient):
-    def _attendees(self, conference_id: str):
-        return self._pages(f"https://www.bigmarker.com/api/v1/{conference_id}/attendees/")
+    def _attendees(self, conference_id: str, model: type):
+        return self._pages(f"{conference_id}/attendees/", parse=self._model_page('attendees', model))
+
+    def iter_attendees(self, conference_id: str, compact: bool = False) -> Iterator[Attendee | CompactAttendee]:
+        """``compact=True`` yields slotted ``CompactAttendee`` records instead of pydantic models"""
+        from bigmarker.models.attendees import Attendee, CompactAttendee
+
+        model = CompactAttendee if compact else Attendee
+        return self._iter_models(self._attendees(conference_id, model), 'attendees')
+
+    def get_attendees(self,
+                      conference_id: str,
+                      compact: bool = False) -> Optional[list[Attendee] | list[CompactAttendee]]:
+        return self._coalesced(("get_attendees", conference_id, compact),
+                               lambda: list(self.iter_attendees(conference_id, compact)))
+
+    def iter_attendees_for(self, conference_ids: Iterable[str], workers: int = 8) -> Iterator[tuple[str, Attendee]]:
+        from bigmarker.models.attendees import Attendee
+
+        return self._fan_out(conference_ids, lambda conference_id: f"{conference_id}/attendees/",
+                             'attendees', workers,
+                             parse=self._model_page('attendees', Attendee))
+
+    def iter_attendee_records_for(self,
+                                  conference_ids: Iterable[str],
+                                  workers: int = 8) -> Iterator[tuple[str, dict]]:
+        """``iter_attendees_for`` yielding attendees as the API returns them, as plain dicts"""
+        return self._fan_out(conference_ids, lambda conference_id: f"{conference_id}/attendees/",
+                             'attendees', workers)
 
-    def get_attendees(self, conference_id: str) -> Optional[list[Attendee]]:
-        return [Attendee(**a) for a in self._attendees(conference_id)]
+    def get_attendees_for(self, conference_ids: Iterable[str], workers: int = 8) -> list[tuple[str, Attendee]]:
+        return list(self.iter_attendees_for(conference_ids, workers))
@@ -1,32 +1,216 @@
-from typing import Optional
+from __future__ import annotations
 
-import requests
-from pydantic import EmailStr
+import time
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from itertools import islice
+from typing import TYPE_CHECKING, Optional, Iterable, Iterator, Callable
 
+from bigmarker.cache import ResponseCache, MISSING
+from bigmarker.decoding import ModelPage, parse_page
 from bigmarker.error.token import IncompleteLoginSetupException
+from bigmarker.hooks import Hook, endpoint_template
+from bigmarker.ratelimit import TokenBucket, RetryPolicy
+from bigmarker.singleflight import SingleFlight
+from .core import ClientCore, FanOutPlan, Model, T
 
+if TYPE_CHECKING:
+    import requests
+    from pydantic import EmailStr
+    from bigmarker.transport import Transport
 
-class BaseClient:
-    def __init__(self, token: Optional[str] = None, email: Optional[EmailStr] = None, password: Optional[str] = None):
-        self._session = requests.session()
+
+class BaseClient(ClientCore):
+    def __init__(self,
+                 token: Optional[str] = None,
+                 email: Optional[EmailStr] = None,
+                 password: Optional[str] = None,
+                 page_workers: Optional[int] = None,
+                 ordered_pages: bool = True,
+                 transport: Optional[Transport] = None,
+                 cache: Optional[ResponseCache] = None,
+                 rate_limiter: Optional[TokenBucket] = None,
+                 retry: Optional[RetryPolicy] = None,
+                 hooks: Optional[list[Hook]] = None,
+                 raw_phone_numbers: bool = False,
+                 decode_processes: int = 0,
+                 single_flight: Optional[SingleFlight] = None):
+        if transport is None:
+            from bigmarker.transport import Transport
+            transport = Transport()
+        self._transport = transport
+        super().__init__(page_workers, ordered_pages, cache, rate_limiter, retry, hooks, raw_phone_numbers,
+                         decode_processes, single_flight)
         if token is not None:
             self._headers = {
                 'API-KEY': token
             }
         elif email and password is not None:
-            res = self._session.get(url="https://www.bigmarker.com/api/v1/members/login",
-                                    data=f"email={email}&password={password}")
+            res = self._transport.request("GET",
+                                          "members/login",
+                                          data=f"email={email}&password={password}")
             if res.status_code != 200:
                 raise IncompleteLoginSetupException(f"Response from logging into BigMarker: {res.text}")
             self._headers = res.json()
         else:
             raise IncompleteLoginSetupException("API token or username and password must be provided")
 
-    def _pages(self, url: str):
-        first_page = self._session.get(url, headers=self._headers).json()
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self._transport.close()
+        if self._process_pool is not None:
+            self._process_pool.shutdown(cancel_futures=True)
+
+    def _request(self, method: str, path: str, headers: Optional[dict] = None, **kwargs) -> requests.Response:
+        headers = self._headers | (headers or {})
+        attempt = 0
+        res = error = None
+        timed = bool(self._instrumentation)
+        started = self._request_started(method, path, kwargs)
+        try:
+            while True:
+                if self._rate_limiter is not None:
+                    self._rate_limiter.acquire()
+                res = None
+                try:
+                    res = self._transport.request(method, path, timed=timed, headers=headers, **kwargs)
+                except self._transport.network_errors:
+                    delay = self._backoff(method, None, attempt)
+                    if delay is None:
+                        raise
+                else:
+                    delay = self._backoff(method, res, attempt)
+                    if delay is None:
+                        return self._accepted(res, attempt)
+                time.sleep(delay)
+                attempt += 1
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self._request_finished(method, path, res, attempt, started, kwargs, error)
+
+    def _cached(self, endpoint: str, identifier: str, fetch: Callable[[], T]) -> T:
+        if self._cache is None:
+            return fetch()
+        value = self._cache.get(endpoint, identifier)
+        if value is MISSING:
+            value = fetch()
+            if value is not None:
+                self._cache.set(endpoint, identifier, value)
+        return value
+
+    def _coalesced(self, key: tuple, fetch: Callable[[], T]) -> T:
+        if self._single_flight is None:
+            return fetch()
+        return self._single_flight.do(key, fetch)
+
+    def _conditional_get(self,
+                         endpoint: str,
+                         identifier: str,
+                         path: str,
+                         parse: Callable[[requests.Response], T],
+                         **kwargs) -> T:
+        if self._cache is None:
+            return parse(self._request("GET", path, **kwargs))
+        entry = self._cache.lookup(endpoint, identifier)
+        if entry is not None and entry.fresh:
+            return entry.value
+        res = self._request("GET", path, headers=self._validators(entry), **kwargs)
+        if self._not_modified(endpoint, identifier, entry, res):
+            return entry.value
+        return self._store(endpoint, identifier, res, parse(res))
+
+    def _page(self,
+              url: str,
+              params: dict,
+              data: Optional[dict],
+              endpoint: Optional[str] = None,
+              parse: Optional[Callable[[dict], dict]] = None) -> dict:
+        timed_parse = self._timed_parse(endpoint_template(url), parse)
+        if endpoint is None:
+            return timed_parse(self._request("GET", url, params=params, data=data))
+        return self._conditional_get(endpoint, self._page_identifier(url, params, data, parse), url, timed_parse,
+                                     params=params, data=data)
+
+    def _from_json(self, parse: ModelPage, content: bytes) -> dict:
+        if self._process_pool is None:
+            return parse.from_json(content, self._validation_context)
+        # The calling page thread blocks here while a worker process decodes and validates the body
+        return self._process_pool.submit(parse_page, content, parse.key, parse.model,
+                                         self._validation_context).result()
+
+    def _pages(self,
+               url: str,
+               params: Optional[dict] = None,
+               data: Optional[dict] = None,
+               endpoint: Optional[str] = None,
+               parse: Optional[Callable[[dict], dict]] = None):
+        params = params or {}
+        first_page = self._page(url, params, data, endpoint, parse)
         yield first_page
-        num_pages = first_page['total_pages']
 
-        for page in range(2, num_pages + 1):
-            next_page = self._session.get(url, params={'page': page}).json()
-            yield next_page
\ No newline at end of file
+        remaining = range(2, first_page['total_pages'] + 1)
+        if not self._concurrent_pages(remaining):
+            for page in remaining:
+                yield self._page(url, params | {'page': page}, data, endpoint, parse)
+            return
+
+        pages = iter(remaining)
+        pending: list[Future] = []
+        executor = ThreadPoolExecutor(max_workers=min(self._page_workers, len(remaining)))
+        try:
+            while True:
+                for page in islice(pages, self._page_window - len(pending)):
+                    pending.append(executor.submit(self._page, url, params | {'page': page}, data, endpoint, parse))
+                if not pending:
+                    return
+                if self._ordered_pages:
+                    future = pending[0]
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    future = next(iter(done))
+                pending.remove(future)
+                yield future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fan_out(self,
+                 conference_ids: Iterable[str],
+                 url: Callable[[str], str],
+                 key: str,
+                 workers: int = 8,
+                 endpoint: Optional[str] = None,
+                 parse: Optional[Callable[[dict], dict]] = None) -> Iterator[tuple[str, Model | dict]]:
+        """Yield ``(conference_id, record)`` for the ``key`` records of every conference, parsed by ``parse``; with
+        no ``parse`` the records are the API's plain dicts"""
+        executor = ThreadPoolExecutor(max_workers=workers)
+        plan = FanOutPlan(conference_ids, window=workers * 2)
+        pending: dict[Future, tuple[str, int]] = {}
+        try:
+            while True:
+                for conference_id, page in plan.jobs(len(pending)):
+                    future = executor.submit(self._page, url(conference_id), {'page': page} if page > 1 else {},
+                                             None, endpoint, parse)
+                    pending[future] = (conference_id, page)
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    conference_id, page_number = pending.pop(future)
+                    page = future.result()
+                    if page_number == 1:
+                        plan.add_pages(conference_id, page['total_pages'])
+                    for record in page[key]:
+                        yield conference_id, record
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _iter_models(pages: Iterable[dict], key: str) -> Iterator[Model]:
+        for page in pages:
+            yield from page[key]
@@ -1,90 +1,196 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Literal
+from typing import TYPE_CHECKING, Optional, Literal, Iterator, Iterable
 
-import requests
 from pydantic import NonNegativeInt, HttpUrl
 
 from .base import BaseClient
-from bigmarker.models.conference import Conference, ConferenceCreate, FileStatus, UploadFileStatus, HandoutItem, \
-    HandoutUpload
+from bigmarker.cache import ResponseCache, MISSING
+
+if TYPE_CHECKING:
+    from bigmarker.models.conference import Conference, ConferenceSummary, ConferenceCreate, FileStatus, \
+        UploadFileStatus, HandoutItem, HandoutUpload
+    from bigmarker.models.fields import TimeZone
+
+
+CONFERENCE_ID_CHUNK = 100
+
+
+def search_form(title: Optional[str] = None,
+                start_time: Optional[str] = None,
+                end_time: Optional[str] = None,
+                conference_ids: Optional[list[str]] = None,
+                presenter_member_ids: Optional[list[str]] = None,
+                role: Optional[str] = None) -> dict:
+    all_search_params: dict = {
+        'title': title,
+        'start_time': start_time,
+        'end_time': end_time,
+        'conference_ids': ",".join(conference_ids) if conference_ids else None,
+        'presenter_ids': ",".join(presenter_member_ids) if presenter_member_ids else None,
+        'role': role
+    }
+    return {k: v for k, v in all_search_params.items() if v is not None}
+
+
+def cached_conferences(cache: Optional[ResponseCache],
+                       conference_ids: Iterable[str]) -> tuple[dict[str, Optional[Conference]], list[str]]:
+    """Fill what ``get_conference`` has cached and fresh into ``{id: None}`` and list the ids still to look up"""
+    found: dict[str, Optional[Conference]] = dict.fromkeys(conference_ids)
+    if cache is None:
+        return found, list(found)
+    missing = []
+    for conference_id in found:
+        conference = cache.get("get_conference", conference_id)
+        if conference is MISSING:
+            missing.append(conference_id)
+        else:
+            found[conference_id] = conference
+    return found, missing
+
+
+def record_found(cache: Optional[ResponseCache],
+                 found: dict[str, Optional[Conference]],
+                 conferences: list[Conference]):
+    for conference in conferences:
+        if conference.id in found:
+            found[conference.id] = conference
+            if cache is not None:
+                cache.set("get_conference", conference.id, conference)
+
+
+def conference_form(model: type[ConferenceCreate], arguments: dict) -> dict:
+    """JSON body for ``create_conference``/``update_conference``, validated by ``model``
+
+    ``arguments`` is the calling method's ``locals()``; entries that are not fields of ``model`` (``self``,
+    ``conference_id``) are left out, as are fields left at None.
+    """
+    conference = model(**{name: value for name, value in arguments.items() if name in model.model_fields})
+    return conference.model_dump(mode="json", exclude_none=True)
+
+
+def upload_file_form(file_url: HttpUrl, autoplay: Optional[bool]) -> dict:
+    form = {"file_url": str(file_url)}
+    if autoplay is not None:
+        form["autoplay"] = autoplay
+    return form
 
 
 class ConferenceClient(BaseClient):
     def _conferences(self,
-                     url: HttpUrl = "https://www.bigmarker.com/api/v1/conferences",
-                     start_time: NonNegativeInt = 0):
+                     url: str = "conferences",
+                     start_time: NonNegativeInt = 0,
+                     model: Optional[type] = None):
         params: dict = {
             'type': 'all',
             'start_time': start_time
         }
-        url = url
-        first_page = self._session.get(url,
-                                       headers=self._headers,
-                                       params=params).json()
-        yield first_page
-        num_pages = first_page['total_pages']
-
-        for page in range(2, num_pages + 1):
-            next_page = self._session.get(url,
-                                          params=params | {'page': page}).json()
-            yield next_page
-
-    def _conferences_search(self, search_params: dict):
+        return self._pages(url, params=params, parse=self._model_page('conferences', model) if model else None)
+
+    def _conferences_search(self, search_params: dict, model: type):
         params: dict = {
             'type': 'all',
         }
-        url = f"https://www.bigmarker.com/api/v1/conferences/search/"
-        first_page = self._session.get(url,
-                                       headers=self._headers,
-                                       params=params,
-                                       data={k: v for k, v in search_params.items() if v is not None}).json()
-        yield first_page
-        num_pages = first_page['total_pages']
-
-        for page in range(2, num_pages + 1):
-            next_page = self._session.get(url,
-                                          params=params | {'page': page},
-                                          data=search_params).json()
-            yield next_page
-
-    def get_all_conferences(self) -> list[Conference]:
-        return [Conference(**c) for c in self._conferences()]
-
-    def get_conferences_from_timeframe(self, start_time: datetime):
-        return [Conference(**c) for c in self._conferences(start_time.timestamp())]
+        url = "conferences/search/"
+        return self._pages(url, params=params, data=search_params, parse=self._model_page('conferences', model))
+
+    def iter_all_conferences(self, summary: bool = False) -> Iterator[Conference | ConferenceSummary]:
+        from bigmarker.models.conference import Conference, ConferenceSummary
+
+        model = ConferenceSummary if summary else Conference
+        return self._iter_models(self._conferences(model=model), 'conferences')
+
+    def get_all_conferences(self, summary: bool = False) -> list[Conference] | list[ConferenceSummary]:
+        return list(self.iter_all_conferences(summary))
+
+    def iter_conferences_from_timeframe(self,
+                                        start_time: datetime,
+                                        summary: bool = False) -> Iterator[Conference | ConferenceSummary]:
+        from bigmarker.models.conference import Conference, ConferenceSummary
+
+        model = ConferenceSummary if summary else Conference
+        return self._iter_models(self._conferences(start_time=int(start_time.timestamp()), model=model),
+                                 'conferences')
+
+    def get_conferences_from_timeframe(self,
+                                       start_time: datetime,
+                                       summary: bool = False) -> list[Conference] | list[ConferenceSummary]:
+        return list(self.iter_conferences_from_timeframe(start_time, summary))
+
+    def iter_conference_records(self, start_time: Optional[datetime] = None) -> Iterator[dict]:
+        """Conferences starting after ``start_time`` as the API returns them, as plain dicts with no validation"""
+        return self._iter_models(self._conferences(start_time=int(start_time.timestamp()) if start_time else 0),
+                                 'conferences')
 
     def get_conference(self, conference_id: str) -> Optional[Conference]:
-        res = requests.get(f"https://www.bigmarker.com/api/v1/conferences/{conference_id}",
-                           headers=self._headers)
-        if res.status_code != 200:
-            return None
-        return Conference(**res.json())
+        from bigmarker.models.conference import Conference
+
+        return self._coalesced(("get_conference", conference_id),
+                               lambda: self._conditional_get("get_conference",
+                                                             conference_id,
+                                                             f"conferences/{conference_id}",
+                                                             self._parse_record("conferences/{id}", Conference)))
+
+    def get_conferences(self,
+                        conference_ids: Iterable[str],
+                        chunk_size: int = CONFERENCE_ID_CHUNK,
+                        workers: int = 8) -> dict[str, Optional[Conference]]:
+        """Look up many conferences at once, keyed by id in request order; ids the API does not return map to None
+
+        Ids with a fresh ``get_conference`` cache entry are answered from the cache. The rest are resolved through
+        ``search_conference`` in chunks of ``chunk_size`` ids, up to ``workers`` chunks at a time, and the
+        conferences found are cached for ``get_conference``.
+        """
+        found, missing = cached_conferences(self._cache, conference_ids)
+        chunks = [missing[i:i + chunk_size] for i in range(0, len(missing), chunk_size)]
+        if not chunks:
+            return found
+        with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            for conferences in executor.map(lambda chunk: self.search_conference(conference_ids=chunk), chunks):
+                record_found(self._cache, found, conferences)
+        return found
 
     def search_conference(self,
                           title: Optional[str] = None,
                           start_time: Optional[str] = None,
                           end_time: Optional[str] = None,
                           conference_ids: Optional[list[str]] = None,
-                          presenter_member_ids: Optional[str] = None,
-                          role: Optional[Literal['hosting', 'attending', 'all']] = None) -> Optional[list[Conference]]:
-        all_search_params: dict = {
-            'title': title,
-            'start_time': start_time,
-            'end_time': end_time,
-            'conference_ids': ",".join(conference_ids) if conference_ids else None,
-            'presenter_ids': ",".join(presenter_member_ids) if presenter_member_ids else None,
-            'role': role
-        }
-        search_parameters: dict = {k: v for k, v in all_search_params.items() if v is not None}
-        return [Conference(**c) for c in self._conferences_search(search_parameters)]
+                          presenter_member_ids: Optional[list[str]] = None,
+                          role: Optional[Literal['hosting', 'attending', 'all']] = None,
+                          summary: bool = False) -> list[Conference] | list[ConferenceSummary]:
+        from bigmarker.models.conference import Conference, ConferenceSummary
+
+        search_parameters = search_form(title, start_time, end_time, conference_ids, presenter_member_ids, role)
+        model = ConferenceSummary if summary else Conference
+        return list(self._iter_models(self._conferences_search(search_parameters, model), 'conferences'))
 
     def get_associated_conferences(self, conference_id: str) -> list[Conference]:
-        return [Conference(**c) for c in self._conferences(
-            url=f"https://www.bigmarker.com/api/v1/conferences/get_associated_sessions/{conference_id}")]
+        return self._coalesced(("get_associated_conferences", conference_id),
+                               lambda: self._cached("get_associated_conferences",
+                                                    conference_id,
+                                                    lambda: self._get_associated_conferences(conference_id)))
+
+    def _get_associated_conferences(self, conference_id: str) -> list[Conference]:
+        from bigmarker.models.conference import Conference
+
+        return list(self._iter_models(self._conferences(
+            url=f"conferences/get_associated_sessions/{conference_id}", model=Conference),
+            'conferences'))
 
     def get_recurring_conferences(self, conference_id: str) -> list[Conference]:
-        return [Conference(**c) for c in self._conferences(
-            url=f"https://www.bigmarker.com/api/v1/conferences/recurring/{conference_id}")]
+        return self._coalesced(("get_recurring_conferences", conference_id),
+                               lambda: self._cached("get_recurring_conferences",
+                                                    conference_id,
+                                                    lambda: self._get_recurring_conferences(conference_id)))
+
+    def _get_recurring_conferences(self, conference_id: str) -> list[Conference]:
+        from bigmarker.models.conference import Conference
+
+        return list(self._iter_models(self._conferences(
+            url=f"conferences/recurring/{conference_id}", model=Conference),
+            'conferences'))
 
     def create_conference(self,
                           channel_id: str,
@@ -94,151 +200,7 @@ class ConferenceClient(BaseClient):
                           sub_url: Optional[HttpUrl] = None,
                           enable_dial_in: Optional[bool] = None,
                           purpose: Optional[str] = None,
-                          time_zone: Optional[Literal[
-                              "International Date Line West",
-                              "Midway Island",
-                              "American Samoa",
-                              "Hawaii",
-                              "Alaska",
-                              "Pacific Time (US & Canada)",
-                              "Tijuana",
-                              "Mountain Time (US & Canada)",
-                              "Arizona",
-                              "Chihuahua",
-                              "Mazatlan",
-                              "Central Time (US & Canada)",
-                              "Saskatchewan",
-                              "Guadalajara",
-                              "Mexico City",
-                              "Monterrey",
-                              "Central America",
-                              "Eastern Time (US & Canada)",
-                              "Indiana (East)",
-                              "Bogota",
-                              "Lima",
-                              "Quito",
-                              "Atlantic Time (Canada)",
-                              "Caracas",
-                              "La Paz",
-                              "Santiago",
-                              "Newfoundland",
-                              "Brasilia",
-                              "Buenos Aires",
-                              "Georgetown",
-                              "Greenland",
-                              "Mid-Atlantic",
-                              "Azores",
-                              "Cape Verde Is.",
-                              "Dublin",
-                              "Edinburgh",
-                              "Lisbon",
-                              "London",
-                              "Casablanca",
-                              "Monrovia",
-                              "UTC",
-                              "Belgrade",
-                              "Bratislava",
-                              "Budapest",
-                              "Ljubljana",
-                              "Prague",
-                              "Sarajevo",
-                              "Skopje",
-                              "Warsaw",
-                              "Zagreb",
-                              "Brussels",
-                              "Copenhagen",
-                              "Madrid",
-                              "Paris",
-                              "Amsterdam",
-                              "Berlin",
-                              "Bern",
-                              "Rome",
-                              "Stockholm",
-                              "Vienna",
-                              "West Central Africa",
-                              "Bucharest",
-                              "Cairo",
-                              "Helsinki",
-                              "Kyiv",
-                              "Riga",
-                              "Sofia",
-                              "Tallinn",
-                              "Vilnius",
-                              "Athens",
-                              "Istanbul",
-                              "Minsk",
-                              "Jerusalem",
-                              "Harare",
-                              "Pretoria",
-                              "Moscow",
-                              "St. Petersburg",
-                              "Volgograd",
-                              "Kuwait",
-                              "Riyadh",
-                              "Nairobi",
-                              "Baghdad",
-                              "Tehran",
-                              "Abu Dhabi",
-                              "Muscat",
-                              "Baku",
-                              "Tbilisi",
-                              "Yerevan",
-                              "Kabul",
-                              "Ekaterinburg",
-                              "Islamabad",
-                              "Karachi",
-                              "Tashkent",
-                              "Chennai",
-                              "Kolkata",
-                              "Mumbai",
-                              "New Delhi",
-                              "Kathmandu",
-                              "Astana",
-                              "Dhaka",
-                              "Sri Jayawardenepura",
-                              "Almaty",
-                              "Novosibirsk",
-                              "Rangoon",
-                              "Bangkok",
-                              "Hanoi",
-                              "Jakarta",
-                              "Krasnoyarsk",
-                              "Beijing",
-                              "Chongqing",
-                              "Hong Kong",
-                              "Urumqi",
-                              "Kuala Lumpur",
-                              "Singapore",
-                              "Taipei",
-                              "Perth",
-                              "Irkutsk",
-                              "Ulaan Bataar",
-                              "Seoul",
-                              "Osaka",
-                              "Sapporo",
-                              "Tokyo",
-                              "Yakutsk",
-                              "Darwin",
-                              "Adelaide",
-                              "Canberra",
-                              "Melbourne",
-                              "Sydney",
-                              "Brisbane",
-                              "Hobart",
-                              "Vladivostok",
-                              "Guam",
-                              "Port Moresby",
-                              "Magadan",
-                              "Solomon Is.",
-                              "New Caledonia",
-                              "Fiji",
-                              "Kamchatka",
-                              "Marshall Is.",
-                              "Auckland",
-                              "Wellington",
-                              "Nuku'alofa",
-                              "Tokelau Is.",
-                              "Samoa"]] = None,
+                          time_zone: Optional[TimeZone] = None,
                           room_logo: Optional[HttpUrl] = None,
                           conference_logo: Optional[HttpUrl] = None,
                           apply_conference_logo_to_channel: Optional[bool] = None,
@@ -287,75 +249,17 @@ class ConferenceClient(BaseClient):
                           room_type: Optional[Literal["1", "attendee_as_presenter", "attendee_mic_and_cam"]] = None,
                           display_language: Optional[str] = None,
                           show_handout_on_page: Optional[bool] = None,
-                          banner_filter_percentage: Optional[int] = None,
+                          banner_filter_percentage: Optional[float] = None,
                           icon: Optional[HttpUrl] = None,
                           webinar_tags: Optional[dict[str, str]] = None) -> Conference:
+        from bigmarker.models.conference import Conference, ConferenceCreate
 
-        conference = ConferenceCreate(
-            channel_id=channel_id,
-            title=title,
-            conference_copy_id=conference_copy_id,
-            presenter_exit_url=presenter_exit_url,
-            sub_url=sub_url,
-            enable_dial_in=enable_dial_in,
-            purpose=purpose,
-            time_zone=time_zone,
-            room_logo=room_logo,
-            conference_logo=conference_logo,
-            apply_conference_logo_to_channel=apply_conference_logo_to_channel,
-            room_sub_title=room_sub_title,
-            schedule_type=schedule_type,
-            start_time=start_time,
-            recurring_start_times=recurring_start_times,
-            webcast_mode=webcast_mode,
-            duration_minutes=duration_minutes,
-            who_can_watch_recording=who_can_watch_recording,
-            presenter_advanced_enter_time=presenter_advanced_enter_time,
-            attendee_advanced_enter_time=attendee_advanced_enter_time,
-            privacy=privacy,
-            webinar_format=webinar_format,
-            ondemand_video_url=ondemand_video_url,
-            enable_knock_to_enter=enable_knock_to_enter,
-            registration_conf_emails=registration_conf_emails,
-            send_notification_emails_to_presenters=send_notification_emails_to_presenters,
-            send_reminder_emails_to_presenters=send_reminder_emails_to_presenters,
-            show_reviews=show_reviews,
-            review_emails=review_emails,
-            poll_results=poll_results,
-            enable_ie_safari=enable_ie_safari,
-            enable_twitter=enable_twitter,
-            send_cancellation_email=send_cancellation_email,
-            webhook_url=webhook_url,
-            exit_url=exit_url,
-            enable_create_webinar_reg_webhook=enable_create_webinar_reg_webhook,
-            enable_new_reg_webhook=enable_new_reg_webhook,
-            new_reg_webhook_url=new_reg_webhook_url,
-            enable_webinar_start_webhook=enable_webinar_start_webhook,
-            webinar_start_webhook_url=webinar_start_webhook_url,
-            enable_waiting_room_open_webhook=enable_waiting_room_open_webhook,
-            waiting_room_open_webhook_url=waiting_room_open_webhook_url,
-            enable_webinar_end_webhook=enable_webinar_end_webhook,
-            webinar_end_webhook_url=webinar_end_webhook_url,
-            enable_live_attendee_data_webhook=enable_live_attendee_data_webhook,
-            live_attendee_data_webhook_url=live_attendee_data_webhook_url,
-            enable_on_demand_viewer_webhook=enable_on_demand_viewer_webhook,
-            on_demand_viewer_webhook_url=on_demand_viewer_webhook_url,
-            registration_required_to_view_recording=registration_required_to_view_recording,
-            channel_admin_id=channel_admin_id,
-            background_image_url=background_image_url,
-            room_type=room_type,
-            display_language=display_language,
-            show_handout_on_page=show_handout_on_page,
-            banner_filter_percentage=banner_filter_percentage,
-            icon=icon,
-            webinar_tags=webinar_tags
-        )
-        res = self._session.post(f"https://www.bigmarker.com/api/v1/conferences",
-                                 headers=self._headers,
-                                 json=conference.model_dump_json(exclude_none=True)).json()
+        res = self._request("POST",
+                            "conferences",
+                            json=conference_form(ConferenceCreate, locals()))
         if res.status_code != 201:
             raise Exception(res.text)
-        return Conference(**res)
+        return Conference(**res.json())
 
     def update_conference(self,
                           conference_id: str,
@@ -364,151 +268,7 @@ class ConferenceClient(BaseClient):
                           sub_url: Optional[HttpUrl] = None,
                           enable_dial_in: Optional[bool] = None,
                           purpose: Optional[str] = None,
-                          time_zone: Optional[Literal[
-                              "International Date Line West",
-                              "Midway Island",
-                              "American Samoa",
-                              "Hawaii",
-                              "Alaska",
-                              "Pacific Time (US & Canada)",
-                              "Tijuana",
-                              "Mountain Time (US & Canada)",
-                              "Arizona",
-                              "Chihuahua",
-                              "Mazatlan",
-                              "Central Time (US & Canada)",
-                              "Saskatchewan",
-                              "Guadalajara",
-                              "Mexico City",
-                              "Monterrey",
-                              "Central America",
-                              "Eastern Time (US & Canada)",
-                              "Indiana (East)",
-                              "Bogota",
-                              "Lima",
-                              "Quito",
-                              "Atlantic Time (Canada)",
-                              "Caracas",
-                              "La Paz",
-                              "Santiago",
-                              "Newfoundland",
-                              "Brasilia",
-                              "Buenos Aires",
-                              "Georgetown",
-                              "Greenland",
-                              "Mid-Atlantic",
-                              "Azores",
-                              "Cape Verde Is.",
-                              "Dublin",
-                              "Edinburgh",
-                              "Lisbon",
-                              "London",
-                              "Casablanca",
-                              "Monrovia",
-                              "UTC",
-                              "Belgrade",
-                              "Bratislava",
-                              "Budapest",
-                              "Ljubljana",
-                              "Prague",
-                              "Sarajevo",
-                              "Skopje",
-                              "Warsaw",
-                              "Zagreb",
-                              "Brussels",
-                              "Copenhagen",
-                              "Madrid",
-                              "Paris",
-                              "Amsterdam",
-                              "Berlin",
-                              "Bern",
-                              "Rome",
-                              "Stockholm",
-                              "Vienna",
-                              "West Central Africa",
-                              "Bucharest",
-                              "Cairo",
-                              "Helsinki",
-                              "Kyiv",
-                              "Riga",
-                              "Sofia",
-                              "Tallinn",
-                              "Vilnius",
-                              "Athens",
-                              "Istanbul",
-                              "Minsk",
-                              "Jerusalem",
-                              "Harare",
-                              "Pretoria",
-                              "Moscow",
-                              "St. Petersburg",
-                              "Volgograd",
-                              "Kuwait",
-                              "Riyadh",
-                              "Nairobi",
-                              "Baghdad",
-                              "Tehran",
-                              "Abu Dhabi",
-                              "Muscat",
-                              "Baku",
-                              "Tbilisi",
-                              "Yerevan",
-                              "Kabul",
-                              "Ekaterinburg",
-                              "Islamabad",
-                              "Karachi",
-                              "Tashkent",
-                              "Chennai",
-                              "Kolkata",
-                              "Mumbai",
-                              "New Delhi",
-                              "Kathmandu",
-                              "Astana",
-                              "Dhaka",
-                              "Sri Jayawardenepura",
-                              "Almaty",
-                              "Novosibirsk",
-                              "Rangoon",
-                              "Bangkok",
-                              "Hanoi",
-                              "Jakarta",
-                              "Krasnoyarsk",
-                              "Beijing",
-                              "Chongqing",
-                              "Hong Kong",
-                              "Urumqi",
-                              "Kuala Lumpur",
-                              "Singapore",
-                              "Taipei",
-                              "Perth",
-                              "Irkutsk",
-                              "Ulaan Bataar",
-                              "Seoul",
-                              "Osaka",
-                              "Sapporo",
-                              "Tokyo",
-                              "Yakutsk",
-                              "Darwin",
-                              "Adelaide",
-                              "Canberra",
-                              "Melbourne",
-                              "Sydney",
-                              "Brisbane",
-                              "Hobart",
-                              "Vladivostok",
-                              "Guam",
-                              "Port Moresby",
-                              "Magadan",
-                              "Solomon Is.",
-                              "New Caledonia",
-                              "Fiji",
-                              "Kamchatka",
-                              "Marshall Is.",
-                              "Auckland",
-                              "Wellington",
-                              "Nuku'alofa",
-                              "Tokelau Is.",
-                              "Samoa"]] = None,
+                          time_zone: Optional[TimeZone] = None,
                           room_logo: Optional[HttpUrl] = None,
                           conference_logo: Optional[HttpUrl] = None,
                           apply_conference_logo_to_channel: Optional[bool] = None,
@@ -557,84 +317,29 @@ class ConferenceClient(BaseClient):
                           room_type: Optional[Literal["1", "attendee_as_presenter", "attendee_mic_and_cam"]] = None,
                           display_language: Optional[str] = None,
                           show_handout_on_page: Optional[bool] = None,
-                          banner_filter_percentage: Optional[int] = None,
+                          banner_filter_percentage: Optional[float] = None,
                           icon: Optional[HttpUrl] = None,
                           webinar_tags: Optional[dict[str, str]] = None) -> Conference:
+        from bigmarker.models.conference import Conference, ConferenceUpdate
 
-        conference = ConferenceCreate(
-            title=title,
-            presenter_exit_url=presenter_exit_url,
-            sub_url=sub_url,
-            enable_dial_in=enable_dial_in,
-            purpose=purpose,
-            time_zone=time_zone,
-            room_logo=room_logo,
-            conference_logo=conference_logo,
-            apply_conference_logo_to_channel=apply_conference_logo_to_channel,
-            room_sub_title=room_sub_title,
-            schedule_type=schedule_type,
-            start_time=start_time,
-            recurring_start_times=recurring_start_times,
-            webcast_mode=webcast_mode,
-            duration_minutes=duration_minutes,
-            who_can_watch_recording=who_can_watch_recording,
-            presenter_advanced_enter_time=presenter_advanced_enter_time,
-            attendee_advanced_enter_time=attendee_advanced_enter_time,
-            privacy=privacy,
-            webinar_format=webinar_format,
-            ondemand_video_url=ondemand_video_url,
-            enable_knock_to_enter=enable_knock_to_enter,
-            registration_conf_emails=registration_conf_emails,
-            send_notification_emails_to_presenters=send_notification_emails_to_presenters,
-            send_reminder_emails_to_presenters=send_reminder_emails_to_presenters,
-            show_reviews=show_reviews,
-            review_emails=review_emails,
-            poll_results=poll_results,
-            enable_ie_safari=enable_ie_safari,
-            enable_twitter=enable_twitter,
-            send_cancellation_email=send_cancellation_email,
-            webhook_url=webhook_url,
-            exit_url=exit_url,
-            enable_create_webinar_reg_webhook=enable_create_webinar_reg_webhook,
-            enable_new_reg_webhook=enable_new_reg_webhook,
-            new_reg_webhook_url=new_reg_webhook_url,
-            enable_webinar_start_webhook=enable_webinar_start_webhook,
-            webinar_start_webhook_url=webinar_start_webhook_url,
-            enable_waiting_room_open_webhook=enable_waiting_room_open_webhook,
-            waiting_room_open_webhook_url=waiting_room_open_webhook_url,
-            enable_webinar_end_webhook=enable_webinar_end_webhook,
-            webinar_end_webhook_url=webinar_end_webhook_url,
-            enable_live_attendee_data_webhook=enable_live_attendee_data_webhook,
-            live_attendee_data_webhook_url=live_attendee_data_webhook_url,
-            enable_on_demand_viewer_webhook=enable_on_demand_viewer_webhook,
-            on_demand_viewer_webhook_url=on_demand_viewer_webhook_url,
-            registration_required_to_view_recording=registration_required_to_view_recording,
-            channel_admin_id=channel_admin_id,
-            background_image_url=background_image_url,
-            room_type=room_type,
-            display_language=display_language,
-            show_handout_on_page=show_handout_on_page,
-            banner_filter_percentage=banner_filter_percentage,
-            icon=icon,
-            webinar_tags=webinar_tags
-        )
-        res = self._session.put(f"https://www.bigmarker.com/api/v1/conferences/{conference_id}",
-                                headers=self._headers,
-                                json=conference.model_dump_json(exclude_none=True)).json()
+        res = self._request("PUT",
+                            f"conferences/{conference_id}",
+                            json=conference_form(ConferenceUpdate, locals()))
+        self._invalidate_conference(conference_id)
         if res.status_code != 201:
             raise Exception(res.text)
-        return Conference(**res)
+        return Conference(**res.json())
 
     def upload_preloaded_file(self,
                               conference_id: str,
                               file_url: HttpUrl,
                               autoplay: Optional[bool] = None) -> UploadFileStatus:
-        res = self._session.put(url=f"https://www.bigmarker.com/api/v1/conferences/{conference_id}/upload_file",
-                                headers=self._headers,
-                                data={
-                                    "file_url": file_url,
-                                    "autoplay": autoplay
-                                })
+        from bigmarker.models.conference import UploadFileStatus
+
+        res = self._request("PUT",
+                            f"conferences/{conference_id}/upload_file",
+                            data=upload_file_form(file_url, autoplay))
+        self._invalidate_conference(conference_id)
 
         if res.status_code != 201:
             return UploadFileStatus(
@@ -652,10 +357,10 @@ class ConferenceClient(BaseClient):
     def delete_preloaded_file(self,
                               conference_id: str,
                               file_id: str) -> FileStatus:
-        res = self._session.put(
-            url=f"https://www.bigmarker.com/api/v1/conferences/{conference_id}/upload_file/delete_file/{file_id}",
-            headers=self._headers,
-        )
+        from bigmarker.models.conference import FileStatus
+
+        res = self._request("PUT", f"conferences/{conference_id}/upload_file/delete_file/{file_id}")
+        self._invalidate_conference(conference_id)
 
         if res.status_code != 201:
             return FileStatus(
@@ -669,10 +374,11 @@ class ConferenceClient(BaseClient):
         )
 
     def upload_handout(self, conference_id: str, handout: HandoutUpload) -> HandoutItem:
-        res = self._session.post(
-            url=f"https://www.bigmarker.com/api/v1/conferences/{conference_id}/add_handout_with_url",
-            headers=self._headers,
-            json=handout.model_dump_json(exclude_none=True)
-            )
+        from bigmarker.models.conference import HandoutItem
+
+        res = self._request("POST",
+                            f"conferences/{conference_id}/add_handout_with_url",
+                            json=handout.model_dump(mode="json", exclude_none=True))
+        self._invalidate_conference(conference_id)
         if res.status_code == 201:
             return HandoutItem(**res.json())
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Optional, Callable, Iterable, Iterator, TypeVar
+from urllib.parse import urlencode
+
+from pydantic import BaseModel
+
+from bigmarker.cache import ResponseCache, CacheEntry
+from bigmarker.decoding import ModelPage, decode, model_page
+from bigmarker.error.api import RateLimitException
+from bigmarker.hooks import Hook, Instrumentation, endpoint_template
+from bigmarker.ratelimit import TokenBucket, RetryPolicy
+from bigmarker.singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    import httpx
+    import requests
+
+    Response = requests.Response | httpx.Response
+
+Model = TypeVar('Model', bound=BaseModel)
+T = TypeVar('T')
+
+
+class FanOutPlan:
+    """Which pages a multi-conference fan-out starts next
+
+    First pages are handed out one conference at a time; once a first page reports ``total_pages``, the rest of that
+    conference's pages go ahead of conferences not started yet. ``jobs`` never lets more than ``window`` pages be in
+    flight or finished but not yet consumed, so a slow consumer holds back fetching instead of piling up pages.
+    """
+
+    def __init__(self, conference_ids: Iterable[str], window: int):
+        self.window = window
+        self._conferences = iter(dict.fromkeys(conference_ids))
+        self._pages: deque[tuple[str, Iterator[int]]] = deque()
+
+    def add_pages(self, conference_id: str, total_pages: int):
+        if total_pages > 1:
+            self._pages.append((conference_id, iter(range(2, total_pages + 1))))
+
+    def jobs(self, pending: int) -> Iterator[tuple[str, int]]:
+        """``(conference_id, page)`` pairs to start now, given ``pending`` pages already started"""
+        while pending < self.window:
+            job = self._next()
+            if job is None:
+                return
+            pending += 1
+            yield job
+
+    def _next(self) -> Optional[tuple[str, int]]:
+        while self._pages:
+            conference_id, pages = self._pages[0]
+            page = next(pages, None)
+            if page is not None:
+                return conference_id, page
+            self._pages.popleft()
+        conference_id = next(self._conferences, None)
+        return (conference_id, 1) if conference_id is not None else None
+
+
+class ClientCore:
+    """Request planning, caching and validation shared by ``BaseClient`` and ``AsyncBaseClient``
+
+    Nothing here does I/O: each base sends requests and waits through its own transport, and asks these helpers how
+    to retry, what to revalidate and cache, which pages to fetch and how to validate them.
+    """
+
+    def __init__(self,
+                 page_workers: Optional[int] = None,
+                 ordered_pages: bool = True,
+                 cache: Optional[ResponseCache] = None,
+                 rate_limiter: Optional[TokenBucket] = None,
+                 retry: Optional[RetryPolicy] = None,
+                 hooks: Optional[list[Hook]] = None,
+                 raw_phone_numbers: bool = False,
+                 decode_processes: int = 0,
+                 single_flight: Optional[SingleFlight] = None):
+        self._instrumentation = Instrumentation(hooks)
+        self._cache = cache
+        self._rate_limiter = rate_limiter
+        self._single_flight = single_flight
+        self._retry = retry or RetryPolicy()
+        if page_workers is None:
+            # Decode processes only overlap with fetching when pages are fetched concurrently, so by default keep
+            # enough page workers to feed every process with one more page in flight
+            page_workers = decode_processes + 1
+        elif decode_processes > 0 and page_workers < 2:
+            raise ValueError(f"decode_processes={decode_processes} needs pages fetched concurrently, "
+                             f"but page_workers={page_workers}; leave page_workers unset or raise it")
+        self._page_workers = max(1, page_workers)
+        self._ordered_pages = ordered_pages
+        self._validation_context = None
+        if raw_phone_numbers:
+            from bigmarker.models.fields import RAW_PHONE_NUMBERS
+
+            self._validation_context = {RAW_PHONE_NUMBERS: True}
+        self._process_pool = None
+        if decode_processes > 0:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            # Spawned rather than forked: forking copies the page threads' locks and the transport's open sockets
+            self._process_pool = ProcessPoolExecutor(max_workers=decode_processes,
+                                                     mp_context=multiprocessing.get_context("spawn"))
+
+    def _request_started(self, method: str, path: str, kwargs: dict) -> float:
+        if self._instrumentation:
+            self._instrumentation.before_request(method, endpoint_template(path), kwargs)
+        return time.perf_counter()
+
+    def _request_finished(self,
+                          method: str,
+                          path: str,
+                          res: Optional[Response],
+                          attempt: int,
+                          started: float,
+                          kwargs: dict,
+                          error: Optional[BaseException]):
+        if self._instrumentation:
+            self._instrumentation.after_request(self._instrumentation.event(
+                method, path, self._transport.config.url(path), res, attempt, started, kwargs, error))
+
+    def _backoff(self, method: str, res: Optional[Response], attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying ``res`` (None for a network error), or None when it is final"""
+        if not self._retry.should_retry(method, res.status_code if res is not None else None, attempt):
+            return None
+        if res is None:
+            return self._retry.backoff(attempt)
+        delay = self._retry.backoff(attempt, res.headers.get('Retry-After'))
+        if self._rate_limiter is not None and res.status_code in (429, 503):
+            self._rate_limiter.throttled(delay)
+        return delay
+
+    def _accepted(self, res: Response, attempt: int) -> Response:
+        if res.status_code == 429:
+            raise RateLimitException(f"Rate limited by BigMarker after {attempt + 1} attempts: {res.text}", 429)
+        if self._rate_limiter is not None:
+            self._rate_limiter.succeeded()
+        return res
+
+    @staticmethod
+    def _validators(entry: Optional[CacheEntry]) -> Optional[dict]:
+        return entry.validators if entry is not None else None
+
+    def _not_modified(self, endpoint: str, identifier: str, entry: Optional[CacheEntry], res: Response) -> bool:
+        if res.status_code != 304 or entry is None:
+            return False
+        self._cache.revalidated(endpoint, identifier, entry)
+        return True
+
+    def _store(self, endpoint: str, identifier: str, res: Response, value: T) -> T:
+        if value is not None:
+            self._cache.set(endpoint, identifier, value,
+                            etag=res.headers.get('ETag'),
+                            last_modified=res.headers.get('Last-Modified'))
+        return value
+
+    def _invalidate_conference(self, conference_id: str):
+        if self._cache is not None:
+            self._cache.invalidate_conference(conference_id)
+
+    @staticmethod
+    def _page_identifier(url: str, params: dict, data: Optional[dict], parse: Optional[Callable]) -> str:
+        identifier = f"{url}?{urlencode(sorted(params.items()))}"
+        if data:
+            identifier += f"#{urlencode(sorted(data.items()))}"
+        if isinstance(parse, ModelPage):
+            # Pages validated into different record types (e.g. compact ones) must not share a cache entry
+            identifier += f"@{parse.model.__name__}"
+        return identifier
+
+    def _concurrent_pages(self, remaining: range) -> bool:
+        return self._page_workers > 1 and len(remaining) > 1
+
+    @property
+    def _page_window(self) -> int:
+        """Most pages of one listing that may be in flight or fetched but not yet read by the caller"""
+        return self._page_workers * 2
+
+    def _timed_parse(self, endpoint: str, parse: Optional[Callable] = None) -> Callable[[Response], Any]:
+        """Turn ``parse`` into a response parser whose decode and validation time is reported under ``endpoint``
+
+        ``parse`` is None to only decode the body, a ``ModelPage`` to decode and validate a page in one pass, a model
+        class to validate a single record, or a callable applied to the decoded page.
+        """
+        if isinstance(parse, type) and issubclass(parse, BaseModel):
+            model = parse
+
+            def validate(res: Response) -> BaseModel:
+                with self._instrumentation.timed(endpoint, "validation"):
+                    return model.model_validate_json(res.content, context=self._validation_context)
+
+            return validate
+
+        if not self._instrumentation:
+            if parse is None:
+                return lambda res: decode(res.content)
+            if isinstance(parse, ModelPage):
+                return lambda res: self._from_json(parse, res.content)
+            return lambda res: parse(decode(res.content))
+
+        def timed(res: Response) -> dict:
+            if isinstance(parse, ModelPage):
+                with self._instrumentation.timed(endpoint, "validation"):
+                    return self._from_json(parse, res.content)
+            with self._instrumentation.timed(endpoint, "decode"):
+                page = decode(res.content)
+            if parse is None:
+                return page
+            with self._instrumentation.timed(endpoint, "validation"):
+                return parse(page)
+
+        return timed
+
+    def _parse_record(self, endpoint: str, model: type[Model]) -> Callable[[Response], Optional[Model]]:
+        """A ``_timed_parse`` for single-record reads, where any status but 200 means there is no record"""
+        validate = self._timed_parse(endpoint, model)
+        return lambda res: validate(res) if res.status_code == 200 else None
+
+    def _from_json(self, parse: ModelPage, content: bytes) -> dict:
+        return parse.from_json(content, self._validation_context)
+
+    @staticmethod
+    def _model_page(key: str, model: type[Model]) -> ModelPage:
+        return model_page(key, model)
@@ -1,31 +1,140 @@
-import requests
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Iterator, Iterable, Optional
+
 from pydantic import HttpUrl
 
 from .base import BaseClient
-from bigmarker.models.registrations import Registration, UserRegistrant, Registered
+from bigmarker.checkpoint import RegistrationCheckpoint
+
+if TYPE_CHECKING:
+    from bigmarker.models.registrations import Registration, CompactRegistration, UserRegistrant, RegistrationResult
+
+REGISTRATION_ERRORS = {
+    401: "You do not have permission to access or modify this conference.",
+    404: "The conference you are requesting is not found.",
+}
+
+
+def registration_result(index: int, registrant: UserRegistrant, response) -> RegistrationResult:
+    from bigmarker.models.registrations import RegistrationResult
+
+    if response.status_code in REGISTRATION_ERRORS:
+        return RegistrationResult(index, registrant.conference_id, error=REGISTRATION_ERRORS[response.status_code])
+    if response.status_code >= 400:
+        return RegistrationResult(index, registrant.conference_id, error=response.text)
+    return RegistrationResult(index, registrant.conference_id, url=response.json()["conference_url"])
 
 
 class RegistrationClient(BaseClient):
-    def _registrations(self, conference_id: str, keyword: str = "registrations"):
-        return self._pages(f"https://www.bigmarker.com/api/v1/conferences/{keyword}/{conference_id}")
+    def _registrations(self, conference_id: str, model: type, keyword: str = "registrations"):
+        return self._pages(f"conferences/{keyword}/{conference_id}",
+                           endpoint=f"get_{keyword}",
+                           parse=self._model_page('registrations', model))
 
     def get_registration(self, registration_id: str) -> Registration:
         pass
 
-    def get_registrations(self, conference_id: str) -> list[Registration]:
-        return [Registration(**r) for r in self._registrations(conference_id)]
+    def iter_registrations(self,
+                           conference_id: str,
+                           compact: bool = False) -> Iterator[Registration | CompactRegistration]:
+        """``compact=True`` yields slotted ``CompactRegistration`` records instead of pydantic models"""
+        from bigmarker.models.registrations import Registration, CompactRegistration
+
+        model = CompactRegistration if compact else Registration
+        return self._iter_models(self._registrations(conference_id, model), 'registrations')
+
+    def get_registrations(self,
+                          conference_id: str,
+                          compact: bool = False) -> list[Registration] | list[CompactRegistration]:
+        return self._coalesced(("get_registrations", conference_id, compact),
+                               lambda: list(self.iter_registrations(conference_id, compact)))
+
+    def iter_registrations_for(self,
+                               conference_ids: Iterable[str],
+                               workers: int = 8) -> Iterator[tuple[str, Registration]]:
+        from bigmarker.models.registrations import Registration
+
+        return self._fan_out(conference_ids, lambda conference_id: f"conferences/registrations/{conference_id}",
+                             'registrations', workers,
+                             endpoint="get_registrations",
+                             parse=self._model_page('registrations', Registration))
+
+    def iter_registration_records_for(self,
+                                      conference_ids: Iterable[str],
+                                      workers: int = 8) -> Iterator[tuple[str, dict]]:
+        """``iter_registrations_for`` yielding registrations as the API returns them, as plain dicts"""
+        return self._fan_out(conference_ids, lambda conference_id: f"conferences/registrations/{conference_id}",
+                             'registrations', workers, endpoint="get_registrations")
+
+    def get_registrations_for(self,
+                              conference_ids: Iterable[str],
+                              workers: int = 8) -> list[tuple[str, Registration]]:
+        return list(self.iter_registrations_for(conference_ids, workers))
+
+    def iter_checked_in_registrations(self, conference_id: str) -> Iterator[Registration]:
+        from bigmarker.models.registrations import Registration
+
+        return self._iter_models(self._registrations(conference_id, Registration, "checked_in_registrations"),
+                                 'registrations')
 
     def get_checked_in_registrations(self, conference_id: str) -> list[Registration]:
-        return [Registration(**r) for r in self._registrations(conference_id, "checked_in_registrations")]
+        return self._coalesced(("get_checked_in_registrations", conference_id),
+                               lambda: list(self.iter_checked_in_registrations(conference_id)))
+
+    def _put_registrant(self, registrant: UserRegistrant):
+        return self._request("PUT",
+                             "conferences/register",
+                             json=registrant.model_dump(mode="json",
+                                                        by_alias=True,
+                                                        exclude_none=True))
 
     def register_user(self, registrant: UserRegistrant) -> HttpUrl | str:
-        response = requests.put(url=f"https://www.bigmarker.com/api/v1/conferences/register",
-                                headers=self._headers,
-                                json=registrant.model_dump_json(by_alias=True,
-                                                                exclude_none=True))
-        if response.status_code == 401:
-            return "You do not have permission to access or modify this conference."
-        elif response.status_code == 404:
-            return "The conference you are requesting is not found."
+        response = self._put_registrant(registrant)
+        if response.status_code in REGISTRATION_ERRORS:
+            return REGISTRATION_ERRORS[response.status_code]
 
         return response.json()["conference_url"]
+
+    def _register_row(self, index: int, registrant: UserRegistrant) -> RegistrationResult:
+        from bigmarker.models.registrations import RegistrationResult
+
+        try:
+            return registration_result(index, registrant, self._put_registrant(registrant))
+        except Exception as e:
+            return RegistrationResult(index, registrant.conference_id, error=f"{type(e).__name__}: {e}")
+
+    @staticmethod
+    def _completed(futures: Iterable[Future],
+                   progress: Optional[RegistrationCheckpoint]) -> Iterator[RegistrationResult]:
+        for future in futures:
+            result = future.result()
+            if progress is not None and result.ok:
+                progress.record(result.index, result.url)
+            yield result
+
+    def iter_register_users(self,
+                            registrants: Iterable[UserRegistrant],
+                            workers: int = 8,
+                            checkpoint: Optional[str] = None) -> Iterator[RegistrationResult]:
+        with ThreadPoolExecutor(max_workers=workers) as executor, \
+                (RegistrationCheckpoint(checkpoint) if checkpoint else nullcontext()) as progress:
+            pending: set[Future] = set()
+            for index, registrant in enumerate(registrants):
+                if progress is not None and index in progress:
+                    continue
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from self._completed(done, progress)
+                pending.add(executor.submit(self._register_row, index, registrant))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from self._completed(done, progress)
+
+    def register_users(self,
+                       registrants: Iterable[UserRegistrant],
+                       workers: int = 8,
+                       checkpoint: Optional[str] = None) -> list[RegistrationResult]:
+        return sorted(self.iter_register_users(registrants, workers, checkpoint))
@@ -0,0 +1,58 @@
+import json
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    loads: Callable[[bytes | str], Any] = orjson.loads
+else:
+    loads = json.loads
+
+
+def decode(content: bytes) -> Any:
+    """Decode a response body, using orjson when it is installed and the stdlib otherwise"""
+    return loads(content)
+
+
+class ModelPage:
+    """Validate the ``key`` records of a page into ``model``
+
+    Called with an already decoded page it validates the records; ``from_json`` instead hands the raw body to
+    pydantic-core so decoding and validation happen in one native pass.
+    """
+
+    def __init__(self, key: str, model: type[BaseModel]):
+        self.key = key
+        self.model = model
+        self._page = create_model(f"{model.__name__}Page",
+                                  __config__=ConfigDict(extra='allow'),
+                                  **{key: (list[model], ...)})
+
+    def __call__(self, page: dict, context: Optional[dict] = None) -> dict:
+        return page | {self.key: records_adapter(self.model).validate_python(page[self.key], context=context)}
+
+    def from_json(self, content: bytes, context: Optional[dict] = None) -> dict:
+        page = self._page.model_validate_json(content, context=context)
+        return page.model_extra | {self.key: getattr(page, self.key)}
+
+
+@lru_cache(maxsize=None)
+def records_adapter(model: type[BaseModel]) -> TypeAdapter:
+    """A ``TypeAdapter(list[model])`` built once per model and shared by every client"""
+    return TypeAdapter(list[model])
+
+
+@lru_cache(maxsize=None)
+def model_page(key: str, model: type[BaseModel]) -> ModelPage:
+    return ModelPage(key, model)
+
+
+def parse_page(content: bytes, key: str, model: type[BaseModel], context: Optional[dict] = None) -> dict:
+    """``model_page(key, model).from_json`` as a module level function, so a process pool worker can run it"""
+    return model_page(key, model).from_json(content, context)
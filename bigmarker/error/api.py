@@ -0,0 +1,8 @@
+class APIException(Exception):
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class RateLimitException(APIException):
+    pass
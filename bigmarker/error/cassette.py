@@ -0,0 +1,2 @@
+class CassetteMissException(LookupError):
+    pass
@@ -0,0 +1,139 @@
+import csv
+import json
+import typing
+from datetime import datetime
+from typing import Any, Optional, Iterable, Iterator, TextIO
+
+from pydantic import BaseModel, TypeAdapter
+
+from bigmarker.client import BigMarkerClient
+from bigmarker.models.attendees import Attendee
+from bigmarker.models.conference import ConferenceSummary
+from bigmarker.models.registrations import Registration
+
+Batch = dict[str, list]
+
+ARROW_TYPES = {bool: "bool_", int: "int64", float: "float64"}
+DATETIMES = TypeAdapter(list[Optional[datetime]])
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("Arrow and Parquet export require pyarrow: pip install pyarrow") from e
+    return pyarrow
+
+
+def _arrow_type(pa, annotation):
+    origin, args = typing.get_origin(annotation), typing.get_args(annotation)
+    if origin is list:
+        return pa.list_(_arrow_type(pa, args[0]))
+    if origin is not None:
+        return _arrow_type(pa, next(arg for arg in args if arg is not type(None)))
+    if annotation is datetime:
+        return pa.timestamp("us", tz="UTC")
+    return getattr(pa, ARROW_TYPES.get(annotation, "string"))()
+
+
+class RecordBatches:
+    """Column batches built straight from page JSON; iterate for ``{column: values}`` dicts or write them out"""
+
+    def __init__(self, rows: Iterator[dict], model: type[BaseModel], columns: list[str], batch_size: int):
+        self.model = model
+        self.columns = columns
+        self.batch_size = batch_size
+        self._rows = rows
+
+    def __iter__(self) -> Iterator[Batch]:
+        batch: Batch = {column: [] for column in self.columns}
+        size = 0
+        for row in self._rows:
+            for column in self.columns:
+                batch[column].append(row.get(column))
+            size += 1
+            if size == self.batch_size:
+                yield batch
+                batch = {column: [] for column in self.columns}
+                size = 0
+        if size:
+            yield batch
+
+    def arrow_schema(self):
+        pa = _import_pyarrow()
+        fields = self.model.model_fields
+        return pa.schema([(column, _arrow_type(pa, fields[column].annotation) if column in fields else pa.string())
+                          for column in self.columns])
+
+    def to_arrow_batches(self):
+        pa = _import_pyarrow()
+        schema = self.arrow_schema()
+        for batch in self:
+            arrays = []
+            for field in schema:
+                if pa.types.is_timestamp(field.type):
+                    # Parsed here rather than cast by pyarrow, which rejects fractional seconds and "Z" offsets
+                    arrays.append(pa.array(DATETIMES.validate_python(batch[field.name]), type=field.type))
+                else:
+                    arrays.append(pa.array(batch[field.name], type=field.type))
+            yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def to_arrow(self):
+        pa = _import_pyarrow()
+        return pa.Table.from_batches(list(self.to_arrow_batches()), schema=self.arrow_schema())
+
+    def to_parquet(self, path: str, **kwargs):
+        _import_pyarrow()
+        import pyarrow.parquet as pq
+        with pq.ParquetWriter(path, self.arrow_schema(), **kwargs) as writer:
+            for batch in self.to_arrow_batches():
+                writer.write_batch(batch)
+
+    def to_csv(self, file: str | TextIO):
+        if isinstance(file, str):
+            with open(file, "w", newline="") as stream:
+                return self.to_csv(stream)
+        writer = csv.writer(file)
+        writer.writerow(self.columns)
+        for batch in self:
+            writer.writerows(zip(*(map(self._csv_value, batch[column]) for column in self.columns)))
+
+    @staticmethod
+    def _csv_value(value: Any) -> Any:
+        if isinstance(value, (list, dict)):
+            return json.dumps(value)
+        return "" if value is None else value
+
+
+class ColumnarExport:
+    """Export registrations, attendees and conference summaries without building a pydantic object per row
+
+    ``columns`` projects the output (defaults to the model's fields); registrations and attendees are fetched with
+    the client's multi-conference fan-out and registrations get a leading ``conference_id`` column.
+    """
+
+    def __init__(self,
+                 client: BigMarkerClient,
+                 batch_size: int = 10_000,
+                 columns: Optional[list[str]] = None,
+                 workers: int = 8):
+        self.client = client
+        self.batch_size = batch_size
+        self.columns = columns
+        self.workers = workers
+
+    def _batches(self, rows: Iterator[dict], model: type[BaseModel], default_columns: list[str]) -> RecordBatches:
+        return RecordBatches(rows, model, self.columns or default_columns, self.batch_size)
+
+    def registrations(self, conference_ids: Iterable[str]) -> RecordBatches:
+        rows = self.client.iter_registration_records_for(conference_ids, self.workers)
+        return self._batches((record | {'conference_id': conference_id} for conference_id, record in rows),
+                             Registration, ['conference_id', *Registration.model_fields])
+
+    def attendees(self, conference_ids: Iterable[str]) -> RecordBatches:
+        rows = self.client.iter_attendee_records_for(conference_ids, self.workers)
+        return self._batches((record for _, record in rows), Attendee, list(Attendee.model_fields))
+
+    def conferences(self, start_time: Optional[datetime] = None) -> RecordBatches:
+        return self._batches(self.client.iter_conference_records(start_time),
+                             ConferenceSummary, list(ConferenceSummary.model_fields))
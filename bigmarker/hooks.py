@@ -0,0 +1,126 @@
+import json
+import re
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Optional, Iterable
+
+LITERAL_SEGMENTS = frozenset({
+    "api", "v1", "conferences", "search", "registrations", "checked_in_registrations", "attendees", "register",
+    "upload_file", "delete_file", "add_handout_with_url", "get_associated_sessions", "recurring", "members",
+    "login",
+})
+
+_URL_PREFIX = re.compile(r"^https?://[^/]+")
+
+
+def endpoint_template(path: str) -> str:
+    """Collapse the identifiers in a request path so timings aggregate per endpoint, not per conference"""
+    path = _URL_PREFIX.sub("", path).split("?", 1)[0]
+    segments = [segment if segment in LITERAL_SEGMENTS else "{id}" for segment in path.strip("/").split("/")]
+    while segments and segments[0] in ("api", "v1"):
+        segments.pop(0)
+    return "/".join(segments)
+
+
+class RequestTimings:
+    """Seconds spent in each phase of one request; phases that did not happen (a reused connection) stay None
+
+    ``connect`` covers name resolution, TCP and TLS together: both HTTP stacks resolve inside their connect call,
+    and timing resolution on its own would mean resolving the host a second time.
+    """
+    __slots__ = ("connect", "ttfb", "body")
+
+    def __init__(self):
+        self.connect: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self.body: Optional[float] = None
+
+
+@dataclass(slots=True)
+class RequestEvent:
+    method: str
+    endpoint: str
+    url: str
+    status_code: Optional[int] = None
+    retries: int = 0
+    connect: Optional[float] = None
+    ttfb: Optional[float] = None
+    body: Optional[float] = None
+    total: float = 0.0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    error: Optional[BaseException] = None
+
+
+class Hook:
+    """Base class for request hooks; override only the callbacks you need"""
+
+    def before_request(self, method: str, endpoint: str, kwargs: dict):
+        pass
+
+    def after_request(self, event: RequestEvent):
+        pass
+
+    def on_phase(self, endpoint: str, phase: str, seconds: float, count: int = 1):
+        """Client-side work after the response, e.g. ``decode`` or ``validation``; ``count`` is the pages or records
+        covered by ``seconds``"""
+
+
+class Instrumentation:
+    def __init__(self, hooks: Optional[Iterable[Hook]] = None):
+        self.hooks: list[Hook] = list(hooks or ())
+
+    def __bool__(self):
+        return bool(self.hooks)
+
+    def before_request(self, method: str, endpoint: str, kwargs: dict):
+        for hook in self.hooks:
+            hook.before_request(method, endpoint, kwargs)
+
+    def after_request(self, event: RequestEvent):
+        for hook in self.hooks:
+            hook.after_request(event)
+
+    def phase(self, endpoint: str, phase: str, seconds: float, count: int = 1):
+        for hook in self.hooks:
+            hook.on_phase(endpoint, phase, seconds, count)
+
+    def timed(self, endpoint: str, phase: str, count: int = 1):
+        if not self.hooks:
+            return nullcontext()
+        return self._timed(endpoint, phase, count)
+
+    @contextmanager
+    def _timed(self, endpoint: str, phase: str, count: int):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase(endpoint, phase, time.perf_counter() - start, count)
+
+    @staticmethod
+    def event(method: str, path: str, url: str, res, retries: int, started: float, kwargs: dict,
+              error: Optional[BaseException] = None) -> RequestEvent:
+        event = RequestEvent(method=method, endpoint=endpoint_template(path), url=url, retries=retries,
+                             total=time.perf_counter() - started, bytes_sent=request_size(kwargs), error=error)
+        if res is not None:
+            event.status_code = res.status_code
+            event.bytes_received = len(res.content)
+            timings = getattr(res, "timings", None)
+            if timings is not None:
+                event.connect, event.ttfb, event.body = timings.connect, timings.ttfb, timings.body
+        return event
+
+
+def request_size(kwargs: dict) -> int:
+    body = kwargs.get("content") or kwargs.get("data")
+    if body is None and kwargs.get("json") is not None:
+        return len(json.dumps(kwargs["json"]).encode())
+    if isinstance(body, str):
+        return len(body.encode())
+    if isinstance(body, bytes):
+        return len(body)
+    if isinstance(body, dict):
+        return sum(len(str(key)) + len(str(value)) + 2 for key, value in body.items())
+    return 0
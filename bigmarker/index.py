@@ -0,0 +1,200 @@
+import bisect
+import threading
+from collections import defaultdict
+from typing import Optional, Literal, Iterable
+
+from bigmarker.client import BigMarkerClient
+from bigmarker.models.attendees import Attendee
+from bigmarker.models.conference import Conference, ConferenceSummary
+from bigmarker.models.registrations import Registration
+from bigmarker.sync import ConferenceChange, ConferenceSync, utc_timestamp
+
+
+def _summary(conference: Conference | ConferenceSummary) -> ConferenceSummary:
+    if isinstance(conference, ConferenceSummary):
+        return conference
+    return ConferenceSummary(**{field: getattr(conference, field) for field in ConferenceSummary.model_fields})
+
+
+class LocalIndex:
+    """In-memory index over synced conferences, registrations and attendees
+
+    Lookups by id, channel, start time range, presenter member id, tag and email are answered from dictionaries
+    (and a sorted start time list) without touching the network. When a ``client`` is given, lookups by id that miss
+    the index fall back to the API and the results are indexed for next time. A search with no local match is an
+    answer in itself unless ``search_fallback`` is set, in which case it is repeated against the API.
+    """
+
+    def __init__(self, client: Optional[BigMarkerClient] = None, search_fallback: bool = False):
+        self.client = client
+        self.search_fallback = search_fallback
+        self._conferences: dict[str, Conference | ConferenceSummary] = {}
+        self._by_channel: defaultdict[str, set[str]] = defaultdict(set)
+        self._by_presenter: defaultdict[str, set[str]] = defaultdict(set)
+        self._by_tag: defaultdict[str, set[str]] = defaultdict(set)
+        self._start_times: list[tuple[float, str]] = []
+        self._registrations: dict[str, list[Registration]] = {}
+        self._attendees: dict[str, list[Attendee]] = {}
+        self._registrations_by_email: defaultdict[str, list[tuple[str, Registration]]] = defaultdict(list)
+        self._attendees_by_email: defaultdict[str, list[Attendee]] = defaultdict(list)
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._conferences)
+
+    def __contains__(self, conference_id: str) -> bool:
+        return conference_id in self._conferences
+
+    def add_conference(self, conference: Conference | ConferenceSummary):
+        with self._lock:
+            self.remove_conference(conference.id, keep_people=True)
+            self._conferences[conference.id] = conference
+            if conference.channel_id is not None:
+                self._by_channel[conference.channel_id].add(conference.id)
+            for presenter in getattr(conference, 'presenters', None) or ():
+                self._by_presenter[presenter.member_id].add(conference.id)
+            for tag in conference.tags or ():
+                self._by_tag[tag].add(conference.id)
+            bisect.insort(self._start_times, (utc_timestamp(conference.start_time), conference.id))
+
+    def add_conferences(self, conferences: Iterable[Conference | ConferenceSummary]):
+        for conference in conferences:
+            self.add_conference(conference)
+
+    def remove_conference(self, conference_id: str, keep_people: bool = False):
+        with self._lock:
+            conference = self._conferences.pop(conference_id, None)
+            if conference is None:
+                return
+            self._by_channel.get(conference.channel_id, set()).discard(conference_id)
+            for presenter in getattr(conference, 'presenters', None) or ():
+                self._by_presenter.get(presenter.member_id, set()).discard(conference_id)
+            for tag in conference.tags or ():
+                self._by_tag.get(tag, set()).discard(conference_id)
+            entry = (utc_timestamp(conference.start_time), conference_id)
+            position = bisect.bisect_left(self._start_times, entry)
+            if position < len(self._start_times) and self._start_times[position] == entry:
+                del self._start_times[position]
+            if not keep_people:
+                self.add_registrations(conference_id, [])
+                self.add_attendees(conference_id, [])
+
+    def add_registrations(self, conference_id: str, registrations: Iterable[Registration]):
+        with self._lock:
+            for registration in self._registrations.pop(conference_id, ()):
+                by_email = self._registrations_by_email[registration.email.lower()]
+                by_email[:] = [entry for entry in by_email if entry[0] != conference_id]
+            registrations = list(registrations)
+            if registrations:
+                self._registrations[conference_id] = registrations
+            for registration in registrations:
+                self._registrations_by_email[registration.email.lower()].append((conference_id, registration))
+
+    def add_attendees(self, conference_id: str, attendees: Iterable[Attendee]):
+        with self._lock:
+            for attendee in self._attendees.pop(conference_id, ()):
+                by_email = self._attendees_by_email[attendee.email.lower()]
+                by_email[:] = [entry for entry in by_email if entry.conference_id != conference_id]
+            attendees = list(attendees)
+            if attendees:
+                self._attendees[conference_id] = attendees
+            for attendee in attendees:
+                self._attendees_by_email[attendee.email.lower()].append(attendee)
+
+    def load(self, sync: ConferenceSync):
+        self.add_conferences(sync.conferences())
+
+    def apply(self, changes: Iterable[ConferenceChange]):
+        for change in changes:
+            if change.kind == 'removed':
+                self.remove_conference(change.conference_id)
+            else:
+                self.add_conference(change.conference)
+
+    def index_people(self, conference_id: str):
+        """Fetch and index the registrations and attendees of one conference"""
+        self.add_registrations(conference_id, self.client.iter_registrations(conference_id))
+        self.add_attendees(conference_id, self.client.iter_attendees(conference_id))
+
+    def get_conference(self, conference_id: str) -> Optional[Conference | ConferenceSummary]:
+        conference = self._conferences.get(conference_id)
+        if conference is None and self.client is not None:
+            conference = self.client.get_conference(conference_id)
+            if conference is not None:
+                self.add_conference(conference)
+        return conference
+
+    def search_conference(self,
+                          title: Optional[str] = None,
+                          start_time: Optional[str] = None,
+                          end_time: Optional[str] = None,
+                          conference_ids: Optional[list[str]] = None,
+                          presenter_member_ids: Optional[list[str]] = None,
+                          role: Optional[Literal['hosting', 'attending', 'all']] = None,
+                          summary: bool = False,
+                          channel_id: Optional[str] = None,
+                          tags: Optional[list[str]] = None) -> list[Conference] | list[ConferenceSummary]:
+        """Same filters as ``BigMarkerClient.search_conference``, plus ``channel_id`` and ``tags``
+
+        ``role`` depends on the account's relationship to each conference, which the index does not hold, so any
+        search with a role is sent to the API.
+        """
+        if role is not None and self.client is not None:
+            return self._from_api(title, start_time, end_time, conference_ids, presenter_member_ids, role,
+                                 summary=summary)
+
+        candidates: Optional[set[str]] = None
+        if conference_ids:
+            candidates = {conference_id for conference_id in conference_ids if conference_id in self._conferences}
+            missing = [conference_id for conference_id in conference_ids if conference_id not in candidates]
+            if missing and self.client is not None:
+                self.add_conferences(self.client.search_conference(conference_ids=missing))
+                candidates.update(conference_id for conference_id in missing if conference_id in self._conferences)
+        if presenter_member_ids:
+            candidates = self._narrow(candidates, set().union(*(self._by_presenter.get(member_id, ())
+                                                                for member_id in presenter_member_ids)))
+        if channel_id is not None:
+            candidates = self._narrow(candidates, self._by_channel.get(channel_id, set()))
+        for tag in tags or ():
+            candidates = self._narrow(candidates, self._by_tag.get(tag, set()))
+        if start_time is not None or end_time is not None:
+            low = bisect.bisect_left(self._start_times, (utc_timestamp(start_time),)) if start_time is not None else 0
+            high = (bisect.bisect_right(self._start_times, (utc_timestamp(end_time), chr(0x10FFFF)))
+                    if end_time is not None else len(self._start_times))
+            candidates = self._narrow(candidates, {conference_id for _, conference_id in self._start_times[low:high]})
+
+        conferences = [self._conferences[conference_id]
+                       for conference_id in (candidates if candidates is not None else self._conferences)]
+        if title is not None:
+            needle = title.casefold()
+            conferences = [conference for conference in conferences if needle in conference.title.casefold()]
+        if not conferences and self.search_fallback and self.client is not None and not conference_ids:
+            return self._from_api(title, start_time, end_time, conference_ids, presenter_member_ids, role,
+                                 summary=summary)
+        conferences.sort(key=lambda conference: conference.start_time)
+        return [_summary(conference) for conference in conferences] if summary else conferences
+
+    def _from_api(self, *search, summary: bool) -> list[Conference] | list[ConferenceSummary]:
+        conferences = self.client.search_conference(*search)
+        self.add_conferences(conferences)
+        return [_summary(conference) for conference in conferences] if summary else conferences
+
+    @staticmethod
+    def _narrow(candidates: Optional[set[str]], matches: set[str]) -> set[str]:
+        return set(matches) if candidates is None else candidates & matches
+
+    def get_registrations(self, conference_id: str) -> list[Registration]:
+        if conference_id not in self._registrations and self.client is not None:
+            self.add_registrations(conference_id, self.client.iter_registrations(conference_id))
+        return list(self._registrations.get(conference_id, ()))
+
+    def get_attendees(self, conference_id: str) -> list[Attendee]:
+        if conference_id not in self._attendees and self.client is not None:
+            self.add_attendees(conference_id, self.client.iter_attendees(conference_id))
+        return list(self._attendees.get(conference_id, ()))
+
+    def registrations_for_email(self, email: str) -> list[tuple[str, Registration]]:
+        return list(self._registrations_by_email.get(email.lower(), ()))
+
+    def attendees_for_email(self, email: str) -> list[Attendee]:
+        return list(self._attendees_by_email.get(email.lower(), ()))
@@ -0,0 +1,191 @@
+import bisect
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Any, NamedTuple, Optional, Iterable, TextIO
+
+from bigmarker.hooks import Hook, RequestEvent
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+REQUEST_PHASES = ("connect", "ttfb", "body", "total")
+
+
+class Histogram:
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile from the bucket boundaries, as Prometheus' histogram_quantile does"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip(map(str, self.buckets + (float("inf"),)), self.counts)),
+        }
+
+
+class Counter:
+    def __init__(self):
+        self.value = 0
+
+    def add(self, amount: int = 1):
+        self.value += amount
+
+
+class MetricPoint(NamedTuple):
+    name: str
+    kind: str
+    attributes: dict[str, Any]
+    value: Any
+    timestamp: float
+
+
+class MetricsExporter(ABC):
+    """Receives the collector's points; implement this to forward metrics to another backend"""
+
+    @abstractmethod
+    def export(self, points: list[MetricPoint]):
+        ...
+
+    def shutdown(self):
+        pass
+
+
+class JSONLinesExporter(MetricsExporter):
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+
+    def export(self, points: list[MetricPoint]):
+        for point in points:
+            self.stream.write(json.dumps(point._asdict(), default=str) + "\n")
+        self.stream.flush()
+
+
+class MetricsCollector(Hook):
+    """In-process aggregation of request timings, status codes, retries, bytes and parse/validation time"""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS, exporters: Optional[list[MetricsExporter]] = None):
+        self.buckets = tuple(buckets)
+        self.exporters = exporters or []
+        self.histograms: defaultdict[tuple[str, str], Histogram] = defaultdict(lambda: Histogram(self.buckets))
+        self.counters: defaultdict[tuple[str, str], Counter] = defaultdict(Counter)
+        self._lock = threading.Lock()
+
+    def after_request(self, event: RequestEvent):
+        with self._lock:
+            for phase in REQUEST_PHASES:
+                value = getattr(event, phase)
+                if value is not None:
+                    self.histograms[(event.endpoint, phase)].observe(value)
+            status = "error" if event.status_code is None else str(event.status_code)
+            self.counters[(event.endpoint, f"status.{status}")].add()
+            self.counters[(event.endpoint, "requests")].add()
+            self.counters[(event.endpoint, "retries")].add(event.retries)
+            self.counters[(event.endpoint, "bytes_sent")].add(event.bytes_sent)
+            self.counters[(event.endpoint, "bytes_received")].add(event.bytes_received)
+
+    def on_phase(self, endpoint: str, phase: str, seconds: float, count: int = 1):
+        with self._lock:
+            self.histograms[(endpoint, phase)].observe(seconds)
+            self.counters[(endpoint, f"{phase}.items")].add(count)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        endpoints: defaultdict[str, dict[str, Any]] = defaultdict(dict)
+        with self._lock:
+            for (endpoint, phase), histogram in self.histograms.items():
+                endpoints[endpoint][phase] = histogram.snapshot()
+            for (endpoint, name), counter in self.counters.items():
+                endpoints[endpoint][name] = counter.value
+        return dict(endpoints)
+
+    def points(self) -> list[MetricPoint]:
+        now = time.time()
+        with self._lock:
+            points = [MetricPoint("bigmarker.client.duration", "histogram",
+                                  {"endpoint": endpoint, "phase": phase}, histogram.snapshot(), now)
+                      for (endpoint, phase), histogram in self.histograms.items()]
+            points += [MetricPoint(f"bigmarker.client.{name}", "counter", {"endpoint": endpoint}, counter.value, now)
+                       for (endpoint, name), counter in self.counters.items()]
+        return points
+
+    def export(self):
+        points = self.points()
+        for exporter in self.exporters:
+            exporter.export(points)
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+
+    def shutdown(self):
+        self.export()
+        for exporter in self.exporters:
+            exporter.shutdown()
+
+
+class OpenTelemetryHook(Hook):
+    """Record straight into an OpenTelemetry ``Meter`` (``opentelemetry.metrics.get_meter(...)``)
+
+    Only the meter's ``create_histogram``/``create_counter`` API is used, so opentelemetry stays an optional install.
+    """
+
+    def __init__(self, meter):
+        self._duration = meter.create_histogram("bigmarker.client.duration", unit="s",
+                                                description="BigMarker request phase durations")
+        self._requests = meter.create_counter("bigmarker.client.requests", description="BigMarker requests")
+        self._retries = meter.create_counter("bigmarker.client.retries", description="BigMarker request retries")
+        self._bytes = meter.create_counter("bigmarker.client.bytes", unit="By", description="BigMarker bytes")
+
+    def after_request(self, event: RequestEvent):
+        attributes = {"endpoint": event.endpoint, "method": event.method}
+        for phase in REQUEST_PHASES:
+            value = getattr(event, phase)
+            if value is not None:
+                self._duration.record(value, attributes | {"phase": phase})
+        status = "error" if event.status_code is None else str(event.status_code)
+        self._requests.add(1, attributes | {"status_code": status})
+        if event.retries:
+            self._retries.add(event.retries, attributes)
+        self._bytes.add(event.bytes_sent, attributes | {"direction": "sent"})
+        self._bytes.add(event.bytes_received, attributes | {"direction": "received"})
+
+    def on_phase(self, endpoint: str, phase: str, seconds: float, count: int = 1):
+        self._duration.record(seconds, {"endpoint": endpoint, "phase": phase})
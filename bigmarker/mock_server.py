@@ -0,0 +1,498 @@
+import argparse
+import json
+import math
+import re
+import socket
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Callable, Iterator, Optional
+from urllib.parse import urlsplit, parse_qs
+
+from pydantic import BaseModel, ConfigDict, NonNegativeInt, PositiveInt
+
+FIRST_NAMES = ("Jane", "John", "Maria", "Wei", "Aisha", "Lucas", "Priya", "Omar", "Sofia", "Kenji")
+LAST_NAMES = ("Doe", "Smith", "Garcia", "Chen", "Okafor", "Muller", "Patel", "Haddad", "Rossi", "Tanaka")
+SOURCES = (("linkedin", "www.linkedin.com"), ("newsletter", "mail.example.com"), ("twitter", "t.co"), ("direct", ""))
+TRACKING_CODES = ("q3-launch", "partner", "spring-promo", "")
+TIME_ZONES = ("Central Time (US & Canada)", "Eastern Time (US & Canada)", "London", "Berlin", "Tokyo")
+NOT_FOUND = {"error": "The conference you are requesting is not found."}
+
+
+class MockDataset(BaseModel):
+    """Shape of the synthetic account a ``MockBigMarkerServer`` serves
+
+    Records are generated from their position on request, so a dataset of a million registrants costs nothing until
+    its pages are read. ``registrations`` and ``attendees`` are per conference; checked-in registrations are the
+    first half of each registration list.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    conferences: PositiveInt = 100
+    registrations: NonNegativeInt = 1000
+    attendees: NonNegativeInt = 500
+    per_page: PositiveInt = 25
+    channel_id: str = "mockchannel"
+    start: datetime = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    interval: timedelta = timedelta(hours=6)
+
+    def conference_id(self, index: int) -> str:
+        return f"mock{index:07d}"
+
+    def conference_index(self, conference_id: str) -> Optional[int]:
+        if not re.fullmatch(r"mock\d{7}", conference_id):
+            return None
+        index = int(conference_id[4:])
+        return index if index < self.conferences else None
+
+    def first_starting_at(self, start_time: float) -> int:
+        offset = (start_time - self.start.timestamp()) / self.interval.total_seconds()
+        return min(self.conferences, max(0, math.ceil(offset)))
+
+    def conference(self, index: int) -> dict:
+        conference_id = self.conference_id(index)
+        start = self.start + index * self.interval
+        return {
+            "id": conference_id,
+            "title": f"Mock Webinar {index}",
+            "event_type": "webinar",
+            "language": "en",
+            "meeting_mode": False,
+            "type": "live_webinar",
+            "copy_webinar_id": None,
+            "master_webinar_id": None,
+            "max_attendees": 1000,
+            "purpose": "Synthetic load test data",
+            "start_time": start.isoformat(),
+            "duration": 60,
+            "conference_address": f"https://www.bigmarker.com/{self.channel_id}/{conference_id}",
+            "banner_filter_percentage": "0.3",
+            "custom_event_id": None,
+            "channel_id": self.channel_id,
+            "webcast_mode": "optional",
+            "closed_captions": {"enable_closed_caption": False, "cc_original_language": "en",
+                                "cc_display_language": None},
+            "end_time": (start + timedelta(hours=1)).isoformat(),
+            "moderator_open_time": (start - timedelta(hours=1)).isoformat(),
+            "audience_open_time": (start - timedelta(minutes=15)).isoformat(),
+            "first_admin_enter_time": (start - timedelta(hours=1)).isoformat(),
+            "manual_end_time": (start + timedelta(hours=1)).isoformat(),
+            "dial_in_information": {"dial_in_number": "+1 312-555-0100", "dial_in_id": str(index),
+                                    "dial_in_passcode": "2", "presenter_dial_in_number": "+1 312-555-0101",
+                                    "presenter_dial_in_id": str(index), "presenter_dial_in_passcode": "4"},
+            "time_zone": TIME_ZONES[index % len(TIME_ZONES)],
+            "privacy": "public",
+            "exit_url": None,
+            "enable_registration_email": True,
+            "enable_knock_to_enter": False,
+            "send_reminder_emails_to_presenters": True,
+            "enable_review_emails": False,
+            "can_view_poll_results": True,
+            "enable_ie_safari": True,
+            "enable_twitter": False,
+            "auto_invite_all_channel_members": False,
+            "send_cancellation_email": True,
+            "show_reviews": False,
+            "recording_url": None,
+            "registration_required_to_view_recording": True,
+            "recording_iframe": "",
+            "who_can_watch_recording": "everyone",
+            "show_handout_on_page": True,
+            "background_image_url": None,
+            "fb_open_graph_image_url": None,
+            "agenda_topics": ["Welcome", "Demo", "Q&A"],
+            "preload_files": [],
+            "disclaimer": None,
+            "presenters": [{
+                "presenter_id": f"p{index}",
+                "member_id": f"m{index % 10}",
+                "conference_id": conference_id,
+                "display_name": f"{FIRST_NAMES[index % 10]} {LAST_NAMES[index % 10]}",
+                "display_on_landing_page": True,
+                "first_name": FIRST_NAMES[index % 10],
+                "last_name": LAST_NAMES[index % 10],
+                "email": f"presenter{index % 10}@example.com",
+                "presenter_url": f"https://www.bigmarker.com/presenter/{index % 10}",
+                "presenter_dial_in_number": "+1 312-555-0199",
+                "presenter_dial_in_id": "123",
+                "presenter_dial_in_passcode": "456",
+                "title": None,
+                "bio": None,
+                "can_manage": True,
+                "is_moderator": False,
+                "facebook": None,
+                "twitter": None,
+                "linkedin": None,
+                "website": None,
+            }],
+            "recorded": False,
+            "webinar_stats": {"registrants": self.registrations, "revenue": "0", "total_attendees": self.attendees,
+                              "page_views": self.registrations * 3, "invited": 0},
+            "associated_series": None,
+            "tags": [f"tag{index % 5}"],
+        }
+
+    def registration(self, conference_index: int, index: int) -> dict:
+        first, last = FIRST_NAMES[index % 10], LAST_NAMES[index // 10 % 10]
+        source, referral_domain = SOURCES[index % len(SOURCES)]
+        bmid = f"{conference_index:05x}{index:07x}"
+        return {
+            "email": f"{first}.{last}.{index}@example.com".lower(),
+            "first_name": first,
+            "last_name": last,
+            "enter_url": f"https://www.bigmarker.com/{self.channel_id}/{self.conference_id(conference_index)}"
+                         f"?bmid={bmid}",
+            "bmid": bmid,
+            "referral_domain": referral_domain,
+            "source": source,
+            "tracking_code": TRACKING_CODES[index % len(TRACKING_CODES)],
+            "earned_certificate": index % 7 == 0,
+            "qualified_for_certificate": index % 5 == 0,
+            "qr_code_value": bmid,
+        }
+
+    def attendee(self, conference_index: int, index: int) -> dict:
+        first, last = FIRST_NAMES[index % 10], LAST_NAMES[index // 10 % 10]
+        return {
+            "id": f"{conference_index:05x}{index:07x}",
+            "conference_id": self.conference_id(conference_index),
+            "email": f"{first}.{last}.{index}@example.com".lower(),
+            "first_name": first,
+            "last_name": last,
+        }
+
+
+def _page_body(key: str, total: int, page: int, per_page: int, record: Callable[[int], dict]) -> bytes:
+    start = (page - 1) * per_page
+    return json.dumps({
+        key: [record(index) for index in range(start, min(total, start + per_page))],
+        "current_page": page,
+        "per_page": per_page,
+        "total_pages": max(1, math.ceil(total / per_page)),
+        "total_entries": total,
+    }).encode()
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class MockBigMarkerServer:
+    """Local stand-in for the BigMarker API, serving a synthetic ``MockDataset``
+
+    Covers the endpoints the clients use: conference list, search, get, create, update, associated and recurring
+    sessions, registrations (and checked-in), attendees, register, upload_file/delete_file and
+    add_handout_with_url. Every response waits ``latency`` seconds; with ``rate_limit`` (requests per second)
+    excess requests get a 429 with ``Retry-After``. Use it as a context manager to run it on a background thread, or
+    ``MockBigMarkerServer.subprocess()`` / ``python -m bigmarker.mock_server`` to run it in its own process.
+    """
+
+    def __init__(self,
+                 dataset: Optional[MockDataset] = None,
+                 host: str = "127.0.0.1",
+                 port: int = 0,
+                 latency: float = 0.0,
+                 rate_limit: Optional[float] = None,
+                 page_cache: int = 1024):
+        self.dataset = dataset or MockDataset()
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.requests = 0
+        self._tokens = rate_limit or 0.0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._pages = lru_cache(maxsize=page_cache)(self._render_page)
+        self._httpd = _Server((host, port), self._handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/api/v1"
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def close(self):
+        if self._thread is not None:
+            self._httpd.shutdown()
+        self._httpd.server_close()
+
+    @classmethod
+    @contextmanager
+    def subprocess(cls,
+                   dataset: Optional[MockDataset] = None,
+                   latency: float = 0.0,
+                   rate_limit: Optional[float] = None) -> Iterator[str]:
+        """Run the server in a child process for as long as the context is open and yield its base URL"""
+        dataset = dataset or MockDataset()
+        command = [sys.executable, "-m", "bigmarker.mock_server", "--port", "0", "--latency", str(latency),
+                   "--conferences", str(dataset.conferences), "--registrations", str(dataset.registrations),
+                   "--attendees", str(dataset.attendees), "--per-page", str(dataset.per_page)]
+        if rate_limit is not None:
+            command += ["--rate-limit", str(rate_limit)]
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+        try:
+            yield process.stdout.readline().strip()
+        finally:
+            process.terminate()
+            process.wait()
+
+    def _allow(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            if self.rate_limit is None:
+                return True
+            now = time.monotonic()
+            self._tokens = min(self.rate_limit, self._tokens + (now - self._updated) * self.rate_limit)
+            self._updated = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def _render_page(self,
+                     dataset: MockDataset,
+                     resource: str,
+                     scope: range | tuple,
+                     page: int,
+                     per_page: int) -> bytes:
+        if resource == "conferences":
+            return _page_body("conferences", len(scope), page, per_page,
+                              lambda position: dataset.conference(scope[position]))
+        conference_index, total = scope
+        record = dataset.attendee if resource == "attendees" else dataset.registration
+        return _page_body(resource if resource == "attendees" else "registrations", total, page, per_page,
+                          lambda index: record(conference_index, index))
+
+    def page(self, resource: str, scope: range | tuple, query: dict) -> bytes:
+        """One page of a resource; ``scope`` is the conference indexes, or (conference index, record count)"""
+        page = max(1, int(query.get("page", 1)))
+        per_page = max(1, int(query.get("per_page", self.dataset.per_page)))
+        return self._pages(self.dataset, resource, scope, page, per_page)
+
+    def search(self, form: dict) -> range | tuple:
+        dataset = self.dataset
+        if form.get("conference_ids"):
+            indexes = (dataset.conference_index(conference_id) for conference_id in form["conference_ids"].split(","))
+            indexes = sorted({index for index in indexes if index is not None})
+        else:
+            indexes = range(dataset.conferences)
+        if form.get("start_time"):
+            first = dataset.first_starting_at(datetime.fromisoformat(form["start_time"]).timestamp())
+            indexes = [index for index in indexes if index >= first]
+        if form.get("end_time"):
+            last = dataset.first_starting_at(datetime.fromisoformat(form["end_time"]).timestamp() + 1)
+            indexes = [index for index in indexes if index < last]
+        if form.get("title"):
+            needle = form["title"].casefold()
+            indexes = [index for index in indexes if needle in f"mock webinar {index}"]
+        return indexes if isinstance(indexes, range) else tuple(indexes)
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status: int, body: bytes | dict, headers: Optional[dict] = None):
+                if server.latency:
+                    time.sleep(server.latency)
+                if isinstance(body, dict):
+                    body = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _body(self) -> bytes:
+                length = int(self.headers.get("Content-Length") or 0)
+                return self.rfile.read(length) if length else b""
+
+            def _route(self, method: str):
+                body = self._body()
+                if not server._allow():
+                    return self._send(429, {"error": "Rate limit exceeded"}, {"Retry-After": "1"})
+                url = urlsplit(self.path)
+                path = url.path.removeprefix("/api/v1/").strip("/")
+                query = {key: values[0] for key, values in parse_qs(url.query).items()}
+                for pattern, handler in ROUTES[method]:
+                    match = pattern.fullmatch(path)
+                    if match:
+                        return self._send(*handler(server, body, query, *match.groups()))
+                self._send(404, {"error": "Not found"})
+
+            def do_GET(self):
+                self._route("GET")
+
+            def do_PUT(self):
+                self._route("PUT")
+
+            def do_POST(self):
+                self._route("POST")
+
+        return Handler
+
+
+def _form(body: bytes) -> dict:
+    return {key: values[0] for key, values in parse_qs(body.decode()).items()}
+
+
+def _json(body: bytes) -> dict:
+    return json.loads(body or b"{}")
+
+
+def _list_conferences(server: MockBigMarkerServer, body: bytes, query: dict):
+    first = server.dataset.first_starting_at(float(query.get("start_time", 0)))
+    return 200, server.page("conferences", range(first, server.dataset.conferences), query)
+
+
+def _search_conferences(server: MockBigMarkerServer, body: bytes, query: dict):
+    return 200, server.page("conferences", server.search(_form(body)), query)
+
+
+def _related_conferences(server: MockBigMarkerServer, body: bytes, query: dict, conference_id: str):
+    index = server.dataset.conference_index(conference_id)
+    if index is None:
+        return 404, NOT_FOUND
+    return 200, server.page("conferences", range(index + 1, min(index + 4, server.dataset.conferences)), query)
+
+
+def _registrations(server: MockBigMarkerServer, body: bytes, query: dict, keyword: str, conference_id: str):
+    index = server.dataset.conference_index(conference_id)
+    if index is None:
+        return 404, NOT_FOUND
+    total = server.dataset.registrations // (2 if keyword == "checked_in_registrations" else 1)
+    return 200, server.page("registrations", (index, total), query)
+
+
+def _attendees(server: MockBigMarkerServer, body: bytes, query: dict, conference_id: str):
+    index = server.dataset.conference_index(conference_id)
+    if index is None:
+        return 404, NOT_FOUND
+    return 200, server.page("attendees", (index, server.dataset.attendees), query)
+
+
+def _get_conference(server: MockBigMarkerServer, body: bytes, query: dict, conference_id: str):
+    index = server.dataset.conference_index(conference_id)
+    if index is None:
+        return 404, NOT_FOUND
+    return 200, server.dataset.conference(index)
+
+
+def _login(server: MockBigMarkerServer, body: bytes, query: dict):
+    return 200, {"API-KEY": "mock"}
+
+
+def _create_conference(server: MockBigMarkerServer, body: bytes, query: dict):
+    fields = _json(body)
+    return 201, server.dataset.conference(0) | {key: fields[key] for key in ("title", "channel_id") if key in fields}
+
+
+def _update_conference(server: MockBigMarkerServer, body: bytes, query: dict, conference_id: str):
+    index = server.dataset.conference_index(conference_id)
+    if index is None:
+        return 404, NOT_FOUND
+    fields = _json(body)
+    return 201, server.dataset.conference(index) | {key: fields[key] for key in ("title",) if key in fields}
+
+
+def _register(server: MockBigMarkerServer, body: bytes, query: dict):
+    conference_id = _json(body).get("id", "")
+    if server.dataset.conference_index(conference_id) is None:
+        return 404, NOT_FOUND
+    return 200, {"conference_url": f"https://www.bigmarker.com/{server.dataset.channel_id}/{conference_id}"}
+
+
+def _upload_file(server: MockBigMarkerServer, body: bytes, query: dict, conference_id: str):
+    if server.dataset.conference_index(conference_id) is None:
+        return 404, NOT_FOUND
+    return 201, {"success": "File uploaded", "id": f"{conference_id}-file", "file_type": "pdf"}
+
+
+def _delete_file(server: MockBigMarkerServer, body: bytes, query: dict, conference_id: str, file_id: str):
+    if server.dataset.conference_index(conference_id) is None:
+        return 404, NOT_FOUND
+    return 201, {"success": "File deleted"}
+
+
+def _add_handout(server: MockBigMarkerServer, body: bytes, query: dict, conference_id: str):
+    if server.dataset.conference_index(conference_id) is None:
+        return 404, NOT_FOUND
+    return 201, _json(body) | {"icon_url": "https://www.bigmarker.com/icons/pdf.png"}
+
+
+ROUTES = {
+    "GET": (
+        (re.compile(r"conferences"), _list_conferences),
+        (re.compile(r"conferences/search"), _search_conferences),
+        (re.compile(r"conferences/(?:get_associated_sessions|recurring)/([^/]+)"), _related_conferences),
+        (re.compile(r"conferences/(registrations|checked_in_registrations)/([^/]+)"), _registrations),
+        (re.compile(r"([^/]+)/attendees"), _attendees),
+        (re.compile(r"members/login"), _login),
+        (re.compile(r"conferences/([^/]+)"), _get_conference),
+    ),
+    "POST": (
+        (re.compile(r"conferences"), _create_conference),
+        (re.compile(r"conferences/([^/]+)/add_handout_with_url"), _add_handout),
+    ),
+    "PUT": (
+        (re.compile(r"conferences/register"), _register),
+        (re.compile(r"conferences/([^/]+)/upload_file/delete_file/([^/]+)"), _delete_file),
+        (re.compile(r"conferences/([^/]+)/upload_file"), _upload_file),
+        (re.compile(r"conferences/([^/]+)"), _update_conference),
+    ),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m bigmarker.mock_server",
+                                     description="Serve a synthetic BigMarker API for load and capacity tests.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds to wait before every response")
+    parser.add_argument("--rate-limit", type=float, help="requests per second before answering 429")
+    parser.add_argument("--conferences", type=int, default=100)
+    parser.add_argument("--registrations", type=int, default=1000, help="registrants per conference")
+    parser.add_argument("--attendees", type=int, default=500, help="attendees per conference")
+    parser.add_argument("--per-page", type=int, default=25)
+    args = parser.parse_args(argv)
+
+    dataset = MockDataset(conferences=args.conferences, registrations=args.registrations, attendees=args.attendees,
+                          per_page=args.per_page)
+    server = MockBigMarkerServer(dataset, args.host, args.port, args.latency, args.rate_limit)
+    print(server.base_url, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,9 @@
+from dataclasses import dataclass
+
 from pydantic import BaseModel, EmailStr
 
+from bigmarker.models.fields import Interned
+
 
 class Attendee(BaseModel):
     id: str
@@ -7,3 +11,13 @@ class Attendee(BaseModel):
     email: EmailStr
     first_name: str
     last_name: str
+
+
+@dataclass(slots=True, frozen=True)
+class CompactAttendee:
+    """Slotted ``Attendee`` with an interned ``conference_id``; ``email`` is kept as sent, without EmailStr checks"""
+    id: str
+    conference_id: Interned
+    email: str
+    first_name: str
+    last_name: str
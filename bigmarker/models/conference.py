@@ -1,8 +1,9 @@
 from datetime import datetime
 from typing import Optional, Literal, Any
 
-from pydantic import BaseModel, HttpUrl, EmailStr, NonNegativeInt, field_validator, field_serializer
-from pydantic_extra_types.phone_numbers import PhoneNumber
+from pydantic import BaseModel, HttpUrl, EmailStr, NonNegativeInt, field_serializer
+
+from bigmarker.models.fields import TimeZone, PhoneNumber, DurationMinutes, BannerFilterPercentage
 
 
 class ConferenceClosedCaptions(BaseModel):
@@ -92,151 +93,7 @@ class Conference(BaseModel):
     first_admin_enter_time: datetime
     manual_end_time: datetime
     dial_in_information: ConferenceDialInInformation
-    time_zone: Literal[
-        "International Date Line West",
-        "Midway Island",
-        "American Samoa",
-        "Hawaii",
-        "Alaska",
-        "Pacific Time (US & Canada)",
-        "Tijuana",
-        "Mountain Time (US & Canada)",
-        "Arizona",
-        "Chihuahua",
-        "Mazatlan",
-        "Central Time (US & Canada)",
-        "Saskatchewan",
-        "Guadalajara",
-        "Mexico City",
-        "Monterrey",
-        "Central America",
-        "Eastern Time (US & Canada)",
-        "Indiana (East)",
-        "Bogota",
-        "Lima",
-        "Quito",
-        "Atlantic Time (Canada)",
-        "Caracas",
-        "La Paz",
-        "Santiago",
-        "Newfoundland",
-        "Brasilia",
-        "Buenos Aires",
-        "Georgetown",
-        "Greenland",
-        "Mid-Atlantic",
-        "Azores",
-        "Cape Verde Is.",
-        "Dublin",
-        "Edinburgh",
-        "Lisbon",
-        "London",
-        "Casablanca",
-        "Monrovia",
-        "UTC",
-        "Belgrade",
-        "Bratislava",
-        "Budapest",
-        "Ljubljana",
-        "Prague",
-        "Sarajevo",
-        "Skopje",
-        "Warsaw",
-        "Zagreb",
-        "Brussels",
-        "Copenhagen",
-        "Madrid",
-        "Paris",
-        "Amsterdam",
-        "Berlin",
-        "Bern",
-        "Rome",
-        "Stockholm",
-        "Vienna",
-        "West Central Africa",
-        "Bucharest",
-        "Cairo",
-        "Helsinki",
-        "Kyiv",
-        "Riga",
-        "Sofia",
-        "Tallinn",
-        "Vilnius",
-        "Athens",
-        "Istanbul",
-        "Minsk",
-        "Jerusalem",
-        "Harare",
-        "Pretoria",
-        "Moscow",
-        "St. Petersburg",
-        "Volgograd",
-        "Kuwait",
-        "Riyadh",
-        "Nairobi",
-        "Baghdad",
-        "Tehran",
-        "Abu Dhabi",
-        "Muscat",
-        "Baku",
-        "Tbilisi",
-        "Yerevan",
-        "Kabul",
-        "Ekaterinburg",
-        "Islamabad",
-        "Karachi",
-        "Tashkent",
-        "Chennai",
-        "Kolkata",
-        "Mumbai",
-        "New Delhi",
-        "Kathmandu",
-        "Astana",
-        "Dhaka",
-        "Sri Jayawardenepura",
-        "Almaty",
-        "Novosibirsk",
-        "Rangoon",
-        "Bangkok",
-        "Hanoi",
-        "Jakarta",
-        "Krasnoyarsk",
-        "Beijing",
-        "Chongqing",
-        "Hong Kong",
-        "Urumqi",
-        "Kuala Lumpur",
-        "Singapore",
-        "Taipei",
-        "Perth",
-        "Irkutsk",
-        "Ulaan Bataar",
-        "Seoul",
-        "Osaka",
-        "Sapporo",
-        "Tokyo",
-        "Yakutsk",
-        "Darwin",
-        "Adelaide",
-        "Canberra",
-        "Melbourne",
-        "Sydney",
-        "Brisbane",
-        "Hobart",
-        "Vladivostok",
-        "Guam",
-        "Port Moresby",
-        "Magadan",
-        "Solomon Is.",
-        "New Caledonia",
-        "Fiji",
-        "Kamchatka",
-        "Marshall Is.",
-        "Auckland",
-        "Wellington",
-        "Nuku'alofa",
-        "Tokelau Is.",
-        "Samoa"]
+    time_zone: TimeZone
     privacy: str
     exit_url: Optional[HttpUrl]
     enable_registration_email: bool
@@ -270,6 +127,18 @@ class Conference(BaseModel):
     }
 
 
+class ConferenceSummary(BaseModel):
+    id: str
+    title: str
+    start_time: datetime
+    end_time: Optional[datetime] = None
+    channel_id: Optional[str] = None
+    type: Optional[str] = None
+    duration: Optional[NonNegativeInt] = None
+    time_zone: Optional[str] = None
+    tags: Optional[list[str]] = None
+
+
 class ConferenceCreate(BaseModel):
     channel_id: str
     title: str
@@ -278,160 +147,16 @@ class ConferenceCreate(BaseModel):
     sub_url: Optional[HttpUrl] = None
     enable_dial_in: Optional[bool] = None
     purpose: Optional[str] = None
-    time_zone: Optional[Literal[
-        "International Date Line West",
-        "Midway Island",
-        "American Samoa",
-        "Hawaii",
-        "Alaska",
-        "Pacific Time (US & Canada)",
-        "Tijuana",
-        "Mountain Time (US & Canada)",
-        "Arizona",
-        "Chihuahua",
-        "Mazatlan",
-        "Central Time (US & Canada)",
-        "Saskatchewan",
-        "Guadalajara",
-        "Mexico City",
-        "Monterrey",
-        "Central America",
-        "Eastern Time (US & Canada)",
-        "Indiana (East)",
-        "Bogota",
-        "Lima",
-        "Quito",
-        "Atlantic Time (Canada)",
-        "Caracas",
-        "La Paz",
-        "Santiago",
-        "Newfoundland",
-        "Brasilia",
-        "Buenos Aires",
-        "Georgetown",
-        "Greenland",
-        "Mid-Atlantic",
-        "Azores",
-        "Cape Verde Is.",
-        "Dublin",
-        "Edinburgh",
-        "Lisbon",
-        "London",
-        "Casablanca",
-        "Monrovia",
-        "UTC",
-        "Belgrade",
-        "Bratislava",
-        "Budapest",
-        "Ljubljana",
-        "Prague",
-        "Sarajevo",
-        "Skopje",
-        "Warsaw",
-        "Zagreb",
-        "Brussels",
-        "Copenhagen",
-        "Madrid",
-        "Paris",
-        "Amsterdam",
-        "Berlin",
-        "Bern",
-        "Rome",
-        "Stockholm",
-        "Vienna",
-        "West Central Africa",
-        "Bucharest",
-        "Cairo",
-        "Helsinki",
-        "Kyiv",
-        "Riga",
-        "Sofia",
-        "Tallinn",
-        "Vilnius",
-        "Athens",
-        "Istanbul",
-        "Minsk",
-        "Jerusalem",
-        "Harare",
-        "Pretoria",
-        "Moscow",
-        "St. Petersburg",
-        "Volgograd",
-        "Kuwait",
-        "Riyadh",
-        "Nairobi",
-        "Baghdad",
-        "Tehran",
-        "Abu Dhabi",
-        "Muscat",
-        "Baku",
-        "Tbilisi",
-        "Yerevan",
-        "Kabul",
-        "Ekaterinburg",
-        "Islamabad",
-        "Karachi",
-        "Tashkent",
-        "Chennai",
-        "Kolkata",
-        "Mumbai",
-        "New Delhi",
-        "Kathmandu",
-        "Astana",
-        "Dhaka",
-        "Sri Jayawardenepura",
-        "Almaty",
-        "Novosibirsk",
-        "Rangoon",
-        "Bangkok",
-        "Hanoi",
-        "Jakarta",
-        "Krasnoyarsk",
-        "Beijing",
-        "Chongqing",
-        "Hong Kong",
-        "Urumqi",
-        "Kuala Lumpur",
-        "Singapore",
-        "Taipei",
-        "Perth",
-        "Irkutsk",
-        "Ulaan Bataar",
-        "Seoul",
-        "Osaka",
-        "Sapporo",
-        "Tokyo",
-        "Yakutsk",
-        "Darwin",
-        "Adelaide",
-        "Canberra",
-        "Melbourne",
-        "Sydney",
-        "Brisbane",
-        "Hobart",
-        "Vladivostok",
-        "Guam",
-        "Port Moresby",
-        "Magadan",
-        "Solomon Is.",
-        "New Caledonia",
-        "Fiji",
-        "Kamchatka",
-        "Marshall Is.",
-        "Auckland",
-        "Wellington",
-        "Nuku'alofa",
-        "Tokelau Is.",
-        "Samoa"]] = None
+    time_zone: Optional[TimeZone] = None
     room_logo: Optional[HttpUrl] = None
     conference_logo: Optional[HttpUrl] = None
     apply_conference_logo_to_channel: Optional[bool] = None
     room_sub_title: Optional[str] = None
     schedule_type: Optional[Literal["24_hour_room", "one_time"]] = None
-    start_time: datetime = None
-    recurring_start_times: list[datetime] = None
+    start_time: Optional[datetime] = None
+    recurring_start_times: Optional[list[datetime]] = None
     webcast_mode: Optional[Literal["automatic", "required", "optional"]] = None
-    duration_minutes: Optional[int] = None
+    duration_minutes: Optional[DurationMinutes] = None
     who_can_watch_recording: Optional[
         Literal["everyone", "channel_admin_only", "channel_subscribers", "attendees", "attendees_registrants"]] = None
     presenter_advanced_enter_time: Optional[Literal["60", "120", "180"]] = None
@@ -470,7 +195,7 @@ class ConferenceCreate(BaseModel):
     room_type: Optional[Literal["1", "attendee_as_presenter", "attendee_mic_and_cam"]] = None
     display_language: Optional[str] = None
     show_handout_on_page: Optional[bool] = None
-    banner_filter_percentage: Optional[int] = None
+    banner_filter_percentage: Optional[BannerFilterPercentage] = None
     icon: Optional[HttpUrl] = None
     webinar_tags: Optional[dict[str, str]] = None
 
@@ -479,23 +204,16 @@ class ConferenceCreate(BaseModel):
         "str_strip_whitespace": True
     }
 
-    @field_validator("duration_minutes")
-    def validate_duration_minutes(self, value: int):
-        if 1 <= value <= 720:
-            return value
-        raise ValueError("duration_minutes must be between 1 and 720")
-
-    @field_validator("banner_filter_percentage")
-    def validate_banner_filter_percentage(self, value: int):
-        if 0 <= value <= 0.6:
-            return value
-        return ValueError("banner_filter_percentage must be between 0 and 0.6")
-
     @field_serializer("duration_minutes", "banner_filter_percentage", when_used="json")
     def convert_to_str(self, value: Any) -> str:
         return str(value)
 
 
+class ConferenceUpdate(ConferenceCreate):
+    """Fields of a conference update; a conference keeps its channel, so ``channel_id`` may be left out"""
+    channel_id: Optional[str] = None
+
+
 class FileStatus(BaseModel):
     success: bool
     message: str
@@ -0,0 +1,208 @@
+import sys
+from functools import lru_cache
+from typing import Annotated, Optional
+
+from pydantic import AfterValidator, Field, ValidationInfo, WithJsonSchema
+from pydantic_core import PydanticCustomError
+
+TIME_ZONES: frozenset[str] = frozenset({
+    "International Date Line West",
+    "Midway Island",
+    "American Samoa",
+    "Hawaii",
+    "Alaska",
+    "Pacific Time (US & Canada)",
+    "Tijuana",
+    "Mountain Time (US & Canada)",
+    "Arizona",
+    "Chihuahua",
+    "Mazatlan",
+    "Central Time (US & Canada)",
+    "Saskatchewan",
+    "Guadalajara",
+    "Mexico City",
+    "Monterrey",
+    "Central America",
+    "Eastern Time (US & Canada)",
+    "Indiana (East)",
+    "Bogota",
+    "Lima",
+    "Quito",
+    "Atlantic Time (Canada)",
+    "Caracas",
+    "La Paz",
+    "Santiago",
+    "Newfoundland",
+    "Brasilia",
+    "Buenos Aires",
+    "Georgetown",
+    "Greenland",
+    "Mid-Atlantic",
+    "Azores",
+    "Cape Verde Is.",
+    "Dublin",
+    "Edinburgh",
+    "Lisbon",
+    "London",
+    "Casablanca",
+    "Monrovia",
+    "UTC",
+    "Belgrade",
+    "Bratislava",
+    "Budapest",
+    "Ljubljana",
+    "Prague",
+    "Sarajevo",
+    "Skopje",
+    "Warsaw",
+    "Zagreb",
+    "Brussels",
+    "Copenhagen",
+    "Madrid",
+    "Paris",
+    "Amsterdam",
+    "Berlin",
+    "Bern",
+    "Rome",
+    "Stockholm",
+    "Vienna",
+    "West Central Africa",
+    "Bucharest",
+    "Cairo",
+    "Helsinki",
+    "Kyiv",
+    "Riga",
+    "Sofia",
+    "Tallinn",
+    "Vilnius",
+    "Athens",
+    "Istanbul",
+    "Minsk",
+    "Jerusalem",
+    "Harare",
+    "Pretoria",
+    "Moscow",
+    "St. Petersburg",
+    "Volgograd",
+    "Kuwait",
+    "Riyadh",
+    "Nairobi",
+    "Baghdad",
+    "Tehran",
+    "Abu Dhabi",
+    "Muscat",
+    "Baku",
+    "Tbilisi",
+    "Yerevan",
+    "Kabul",
+    "Ekaterinburg",
+    "Islamabad",
+    "Karachi",
+    "Tashkent",
+    "Chennai",
+    "Kolkata",
+    "Mumbai",
+    "New Delhi",
+    "Kathmandu",
+    "Astana",
+    "Dhaka",
+    "Sri Jayawardenepura",
+    "Almaty",
+    "Novosibirsk",
+    "Rangoon",
+    "Bangkok",
+    "Hanoi",
+    "Jakarta",
+    "Krasnoyarsk",
+    "Beijing",
+    "Chongqing",
+    "Hong Kong",
+    "Urumqi",
+    "Kuala Lumpur",
+    "Singapore",
+    "Taipei",
+    "Perth",
+    "Irkutsk",
+    "Ulaan Bataar",
+    "Seoul",
+    "Osaka",
+    "Sapporo",
+    "Tokyo",
+    "Yakutsk",
+    "Darwin",
+    "Adelaide",
+    "Canberra",
+    "Melbourne",
+    "Sydney",
+    "Brisbane",
+    "Hobart",
+    "Vladivostok",
+    "Guam",
+    "Port Moresby",
+    "Magadan",
+    "Solomon Is.",
+    "New Caledonia",
+    "Fiji",
+    "Kamchatka",
+    "Marshall Is.",
+    "Auckland",
+    "Wellington",
+    "Nuku'alofa",
+    "Tokelau Is.",
+    "Samoa",
+})
+
+
+def validate_time_zone(value: str) -> str:
+    if value not in TIME_ZONES:
+        raise ValueError(f"{value!r} is not a BigMarker time zone")
+    return value
+
+
+TimeZone = Annotated[str,
+                     AfterValidator(validate_time_zone),
+                     WithJsonSchema({"type": "string", "enum": sorted(TIME_ZONES)})]
+
+DurationMinutes = Annotated[int, Field(ge=1, le=720)]
+
+BannerFilterPercentage = Annotated[float, Field(ge=0, le=0.6)]
+
+# Low-cardinality strings repeated across thousands of records share one object
+Interned = Annotated[str, AfterValidator(sys.intern)]
+
+
+RAW_PHONE_NUMBERS = "raw_phone_numbers"
+
+PHONE_NUMBER_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=PHONE_NUMBER_CACHE_SIZE)
+def format_phone_number(value: str) -> Optional[str]:
+    """Parse and normalise to RFC 3966 (as pydantic_extra_types' PhoneNumber does), or None when invalid
+
+    Memoised because a channel's conferences share a handful of dial-in numbers; phonenumbers' metadata tables are
+    only imported the first time a number is parsed.
+    """
+    import phonenumbers
+
+    try:
+        parsed = phonenumbers.parse(value, None)
+    except phonenumbers.NumberParseException:
+        return None
+    if not phonenumbers.is_valid_number(parsed):
+        return None
+    return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.RFC3966)
+
+
+def validate_phone_number(value: str, info: ValidationInfo) -> str:
+    if info.context and info.context.get(RAW_PHONE_NUMBERS):
+        return value
+    formatted = format_phone_number(value)
+    if formatted is None:
+        raise PydanticCustomError('value_error', 'value is not a valid phone number')
+    return formatted
+
+
+PhoneNumber = Annotated[str,
+                        AfterValidator(validate_phone_number),
+                        WithJsonSchema({"type": "string", "format": "phone"})]
@@ -1,8 +1,11 @@
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Any
+from typing import Optional, Any, NamedTuple
 
 from pydantic import BaseModel, HttpUrl, Field, ConfigDict
 
+from bigmarker.models.fields import Interned
+
 
 class Registered(str, Enum):
     registered = 'registered'
@@ -22,6 +25,26 @@ class Registration(BaseModel):
     qr_code_value: str
 
 
+@dataclass(slots=True, frozen=True)
+class CompactRegistration:
+    """Slotted ``Registration`` for conferences with very large registrant lists
+
+    ``enter_url`` stays a plain string and the repeated ``referral_domain``, ``source`` and ``tracking_code`` values
+    are interned, so a record is a fraction of the size of the pydantic model while keeping the same attributes.
+    """
+    email: str
+    first_name: str
+    last_name: str
+    enter_url: str
+    bmid: str
+    referral_domain: Interned
+    source: Interned
+    tracking_code: Interned
+    earned_certificate: bool
+    qualified_for_certificate: bool
+    qr_code_value: str
+
+
 class UserRegistrant(BaseModel):
     conference_id: str = Field(alias='id')
     first_name: str
@@ -30,3 +53,14 @@ class UserRegistrant(BaseModel):
     custom_fields: Optional[dict[str, Any]] = None
     utm_bmcr_source: Optional[str] = None
     custom_user_id: Optional[str] = None
+
+
+class RegistrationResult(NamedTuple):
+    index: int
+    conference_id: str
+    url: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
@@ -0,0 +1,117 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from pydantic import BaseModel, NonNegativeInt, NonNegativeFloat, PositiveFloat
+
+TOKENS, UPDATED, RATE, PAUSED_UNTIL = range(4)
+
+
+class TokenBucket:
+    def __init__(self,
+                 rate: float,
+                 capacity: Optional[float] = None,
+                 adaptive: bool = True,
+                 min_rate: Optional[float] = None,
+                 decrease_factor: float = 0.5,
+                 increase_step: Optional[float] = None):
+        self.max_rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.adaptive = adaptive
+        self.min_rate = min_rate if min_rate is not None else rate / 20
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step if increase_step is not None else rate / 100
+        self._state, self._lock = self._create_state([self.capacity, time.monotonic(), rate, 0.0])
+
+    def _create_state(self, initial: list[float]):
+        return initial, threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self._state[RATE]
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        with self._lock:
+            now = time.monotonic()
+            rate = self._state[RATE]
+            available = min(self.capacity, self._state[TOKENS] + (now - self._state[UPDATED]) * rate)
+            self._state[TOKENS] = available - tokens
+            self._state[UPDATED] = now
+            wait = max(0.0, -self._state[TOKENS] / rate)
+            return max(wait, self._state[PAUSED_UNTIL] - now)
+
+    def acquire(self, tokens: float = 1.0):
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, tokens: float = 1.0):
+        import asyncio
+
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def throttled(self, pause: float = 0.0):
+        with self._lock:
+            self._state[PAUSED_UNTIL] = max(self._state[PAUSED_UNTIL], time.monotonic() + pause)
+            if self.adaptive:
+                self._state[RATE] = max(self.min_rate, self._state[RATE] * self.decrease_factor)
+
+    def succeeded(self):
+        if not self.adaptive or self._state[RATE] >= self.max_rate:
+            return
+        with self._lock:
+            self._state[RATE] = min(self.max_rate, self._state[RATE] + self.increase_step)
+
+
+class SharedTokenBucket(TokenBucket):
+    def _create_state(self, initial: list[float]):
+        import multiprocessing
+
+        state = multiprocessing.Array('d', initial)
+        return state, state.get_lock()
+
+
+class RetryPolicy(BaseModel):
+    max_retries: NonNegativeInt = 3
+    backoff_factor: NonNegativeFloat = 0.5
+    max_backoff: PositiveFloat = 60.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    idempotent_methods: frozenset[str] = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+
+    def should_retry(self, method: str, status_code: Optional[int], attempt: int) -> bool:
+        if attempt >= self.max_retries:
+            return False
+        if status_code == 429:
+            return True
+        if method.upper() not in self.idempotent_methods:
+            return False
+        return status_code is None or status_code in self.retry_statuses
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** attempt)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if self.respect_retry_after and retry_after:
+            delay = max(delay, min(self.max_backoff, self._parse_retry_after(retry_after)))
+        return delay
+
+    @staticmethod
+    def _parse_retry_after(retry_after: str) -> float:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return 0.0
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,50 @@
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """Coalesce identical in-flight reads into one call
+
+    The first caller for a key runs the fetch; callers arriving with the same key before it finishes wait for it and
+    get the very same result (or exception). Nothing is kept once the call completes, so this only collapses
+    concurrent duplicates and is no substitute for a ``ResponseCache``. Shared results are shared objects: callers
+    must not mutate returned lists or models.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}
+        self._tasks: dict[Hashable, Awaitable] = {}
+
+    def do(self, key: Hashable, fetch: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+        if not leader:
+            return call.result()
+        try:
+            call.set_result(fetch())
+        except BaseException as e:
+            call.set_exception(e)
+        finally:
+            with self._lock:
+                del self._calls[key]
+        return call.result()
+
+    async def do_async(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        import asyncio
+
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(fetch())
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        # Shielded so one caller being cancelled does not cancel the fetch the others are waiting on
+        return await asyncio.shield(task)
+
+    def __len__(self) -> int:
+        return len(self._calls) + len(self._tasks)
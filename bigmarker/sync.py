@@ -0,0 +1,127 @@
+import hashlib
+import json
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Literal, NamedTuple, Optional, Iterator
+
+from pydantic import ValidationError
+
+from bigmarker.clients import ConferenceClient
+from bigmarker.models.conference import Conference
+
+WATERMARK = "watermark"
+COMMIT_EVERY = 500
+
+
+def utc_timestamp(value: str | datetime) -> float:
+    """POSIX timestamp of an ISO string or datetime, reading values without an offset as UTC"""
+    if isinstance(value, str):
+        # Python 3.10's fromisoformat does not accept a "Z" suffix
+        value = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith(("Z", "z")) else value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class ConferenceChange(NamedTuple):
+    kind: Literal['added', 'changed', 'removed']
+    conference_id: str
+    conference: Conference
+
+
+class ConferenceSync:
+    """Keep a local SQLite mirror of the account's conferences up to date
+
+    The first run (or ``full=True``) pulls every conference. Later runs only ask the API for conferences starting
+    after the previous run's watermark minus ``lookback``, compare each record's content hash against the stored one
+    and report what was added, changed or removed inside that window. Records that fail ``Conference`` validation
+    are skipped, keeping any earlier stored version, and listed with their errors in ``rejected`` for the last run.
+    """
+
+    def __init__(self,
+                 client: ConferenceClient,
+                 path: str = "bigmarker-sync.sqlite3",
+                 lookback: timedelta = timedelta(days=1)):
+        self.client = client
+        self.lookback = lookback
+        self.rejected: dict[str, ValidationError] = {}
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS conferences ("
+                                 "id TEXT PRIMARY KEY, start_time REAL, hash TEXT NOT NULL, record TEXT NOT NULL)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS conferences_start_time ON conferences (start_time)")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value REAL NOT NULL)")
+        self._connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self._connection.close()
+
+    @property
+    def watermark(self) -> Optional[datetime]:
+        row = self._connection.execute("SELECT value FROM state WHERE key = ?", (WATERMARK,)).fetchone()
+        return datetime.fromtimestamp(row[0]) if row is not None else None
+
+    def iter_changes(self, full: bool = False) -> Iterator[ConferenceChange]:
+        """Fetch the sync window and yield its differences from the store; the watermark only advances once the
+        iterator has been consumed to the end"""
+        run_started = time.time()
+        watermark = None if full else self.watermark
+        since = max(0, int((watermark - self.lookback).timestamp())) if watermark is not None else 0
+        self.rejected = {}
+
+        seen: set[str] = set()
+        records = self.client.iter_conference_records(datetime.fromtimestamp(since) if since else None)
+        for count, record in enumerate(records, 1):
+            seen.add(record['id'])
+            change = self._apply(record)
+            if change is not None:
+                yield change
+            if count % COMMIT_EVERY == 0:
+                self._connection.commit()
+        self._connection.commit()
+
+        stale = self._connection.execute("SELECT id, record FROM conferences WHERE start_time >= ? OR ? = 0",
+                                         (since, since)).fetchall()
+        for conference_id, record in stale:
+            if conference_id not in seen:
+                self._connection.execute("DELETE FROM conferences WHERE id = ?", (conference_id,))
+                yield ConferenceChange('removed', conference_id, Conference(**json.loads(record)))
+
+        self._connection.execute("INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)", (WATERMARK, run_started))
+        self._connection.commit()
+
+    def sync(self, full: bool = False) -> list[ConferenceChange]:
+        return list(self.iter_changes(full))
+
+    def _apply(self, record: dict) -> Optional[ConferenceChange]:
+        serialized = json.dumps(record, sort_keys=True, separators=(',', ':'))
+        digest = hashlib.blake2b(serialized.encode(), digest_size=16).hexdigest()
+        row = self._connection.execute("SELECT hash FROM conferences WHERE id = ?", (record['id'],)).fetchone()
+        if row is not None and row[0] == digest:
+            return None
+        try:
+            conference = Conference(**record)
+        except ValidationError as e:
+            self.rejected[record['id']] = e
+            return None
+        self._connection.execute("INSERT OR REPLACE INTO conferences (id, start_time, hash, record) "
+                                 "VALUES (?, ?, ?, ?)",
+                                 (conference.id, utc_timestamp(conference.start_time), digest, serialized))
+        return ConferenceChange('added' if row is None else 'changed', conference.id, conference)
+
+    def get(self, conference_id: str) -> Optional[Conference]:
+        row = self._connection.execute("SELECT record FROM conferences WHERE id = ?", (conference_id,)).fetchone()
+        return Conference(**json.loads(row[0])) if row is not None else None
+
+    def conferences(self) -> Iterator[Conference]:
+        for (record,) in self._connection.execute("SELECT record FROM conferences ORDER BY start_time"):
+            yield Conference(**json.loads(record))
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM conferences").fetchone()[0]
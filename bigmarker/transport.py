@@ -0,0 +1,139 @@
+import http
+import threading
+import time
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from bigmarker.cassette import CassetteRecorder, Cassette, Replay, ReplayConfig
+from bigmarker.hooks import RequestTimings
+from bigmarker.transport_config import TransportConfig
+
+_active = threading.local()
+
+
+class _TimedConnectionMixin:
+    def connect(self):
+        # Times urllib3's own connect (name resolution, TCP and TLS together), so its address fallback is unchanged
+        timings: Optional[RequestTimings] = getattr(_active, "timings", None)
+        if timings is None:
+            return super().connect()
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            timings.connect = time.perf_counter() - start
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimingHTTPAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+
+class Transport:
+    network_errors = (requests.ConnectionError, requests.Timeout)
+
+    def __init__(self, config: Optional[TransportConfig] = None, adapter: Optional[HTTPAdapter] = None):
+        self.config = config or TransportConfig()
+        self.session = requests.Session()
+        adapter = adapter or TimingHTTPAdapter(pool_connections=self.config.pool_connections,
+                                               pool_maxsize=self.config.pool_maxsize,
+                                               pool_block=self.config.pool_block)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if not self.config.keep_alive:
+            self.session.headers['Connection'] = 'close'
+
+    @property
+    def timeout(self) -> tuple[Optional[float], Optional[float]]:
+        return self.config.connect_timeout, self.config.read_timeout
+
+    def request(self, method: str, path: str, timed: bool = False, **kwargs) -> requests.Response:
+        """Send a request and read its body; ``timed`` attaches connect/ttfb/body ``timings`` to the response"""
+        kwargs.setdefault('timeout', self.timeout)
+        if not timed:
+            return self.session.request(method, self.config.url(path), **kwargs)
+        timings = _active.timings = RequestTimings()
+        try:
+            start = time.perf_counter()
+            res = self.session.request(method, self.config.url(path), stream=True, **kwargs)
+            headers_received = time.perf_counter()
+            timings.ttfb = headers_received - start - (timings.connect or 0.0)
+            res.content
+            timings.body = time.perf_counter() - headers_received
+        finally:
+            _active.timings = None
+        res.timings = timings
+        return res
+
+    def close(self):
+        self.session.close()
+
+
+class RecordingTransport(Transport):
+    """A ``Transport`` that also writes every response to a cassette at ``path`` for ``ReplayTransport``"""
+
+    def __init__(self, path: str, config: Optional[TransportConfig] = None, adapter: Optional[HTTPAdapter] = None):
+        super().__init__(config, adapter)
+        self.recorder = CassetteRecorder(path)
+
+    def request(self, method: str, path: str, timed: bool = False, **kwargs) -> requests.Response:
+        res = super().request(method, path, timed, **kwargs)
+        self.recorder.record(method, path, kwargs, res.status_code, res.headers, res.content)
+        return res
+
+    def close(self):
+        super().close()
+        self.recorder.close()
+
+
+class ReplayTransport:
+    """Serve requests from a recorded cassette, with the latency, throughput and faults set in ``replay``"""
+    network_errors = Transport.network_errors
+
+    def __init__(self,
+                 cassette: str | Cassette,
+                 config: Optional[TransportConfig] = None,
+                 replay: Optional[ReplayConfig] = None):
+        self.config = config or TransportConfig()
+        self.replay = Replay(cassette, replay)
+
+    def request(self, method: str, path: str, timed: bool = False, **kwargs) -> requests.Response:
+        replayed = self.replay.respond(method, path, kwargs)
+        time.sleep(replayed.ttfb + replayed.body)
+        res = requests.Response()
+        res.status_code = replayed.status_code
+        res.reason = http.HTTPStatus(replayed.status_code).phrase
+        res.headers.update(replayed.headers)
+        res.url = self.config.url(path)
+        res.encoding = "utf-8"
+        res._content = replayed.content
+        res.timings = RequestTimings()
+        res.timings.ttfb, res.timings.body = replayed.ttfb, replayed.body
+        return res
+
+    def close(self):
+        self.replay.close()
@@ -0,0 +1,32 @@
+from typing import Optional
+
+from pydantic import BaseModel, PositiveInt, PositiveFloat
+
+
+class TransportConfig(BaseModel):
+    """Connection settings for ``Transport`` (requests) and ``AsyncTransport`` (httpx)
+
+    Not every setting has a counterpart in both HTTP stacks:
+
+    - ``pool_connections`` and ``pool_block`` only apply to ``Transport``. They set how many per-host urllib3
+      pools are kept, and make requests wait for a free connection instead of opening one past ``pool_maxsize``.
+    - ``max_connections`` and ``keepalive_expiry`` only apply to ``AsyncTransport``. urllib3 has no limit across
+      hosts and no idle expiry, so ``Transport`` keeps up to ``pool_maxsize`` connections per host open for as long
+      as the server allows.
+    - ``pool_maxsize`` is the per-host pool size for ``Transport`` and the number of idle keep-alive connections
+      kept by ``AsyncTransport``.
+    """
+    base_url: str = "https://www.bigmarker.com/api/v1"
+    pool_connections: PositiveInt = 10
+    pool_maxsize: PositiveInt = 10
+    pool_block: bool = False
+    max_connections: PositiveInt = 100
+    keep_alive: bool = True
+    keepalive_expiry: Optional[PositiveFloat] = 5.0
+    connect_timeout: Optional[PositiveFloat] = 5.0
+    read_timeout: Optional[PositiveFloat] = 30.0
+
+    def url(self, path: str) -> str:
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{self.base_url.rstrip('/')}/{path.lstrip('/')}"
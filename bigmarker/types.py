@@ -1,3 +1,36 @@
-from .models.conference import *
-from .models.attendees import *
-from .models.registrations import *
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .models.attendees import Attendee
+    from .models.conference import ConferenceClosedCaptions, ConferenceDialInInformation, ConferencePreloadFile, \
+        ConferencePresenter, ConferenceWebinarStats, Conference, ConferenceSummary, ConferenceCreate, \
+        ConferenceUpdate, FileStatus, UploadFileStatus, HandoutUpload, HandoutItem
+    from .models.fields import TimeZone, TIME_ZONES, PhoneNumber
+    from .models.registrations import Registered, Registration, UserRegistrant, RegistrationResult
+
+_MODULES = {
+    ".models.conference": ("ConferenceClosedCaptions", "ConferenceDialInInformation", "ConferencePreloadFile",
+                           "ConferencePresenter", "ConferenceWebinarStats", "Conference", "ConferenceSummary",
+                           "ConferenceCreate", "ConferenceUpdate", "FileStatus", "UploadFileStatus", "HandoutUpload",
+                           "HandoutItem"),
+    ".models.attendees": ("Attendee",),
+    ".models.registrations": ("Registered", "Registration", "UserRegistrant", "RegistrationResult"),
+    ".models.fields": ("TimeZone", "TIME_ZONES", "PhoneNumber"),
+}
+
+_EXPORTS = {name: module for module, names in _MODULES.items() for name in names}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], "bigmarker"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,70 @@
+import time
+from typing import Optional
+
+import pytest
+
+from bigmarker.cassette import CassetteRecorder, ReplayConfig
+from bigmarker.client import BigMarkerClient
+from bigmarker.mock_server import MockBigMarkerServer
+from bigmarker.transport import Transport, ReplayTransport
+from bigmarker.transport_config import TransportConfig
+from .helpers import DATASET
+
+
+@pytest.fixture
+def server():
+    with MockBigMarkerServer(DATASET) as server:
+        yield server
+
+
+@pytest.fixture
+def connect(server):
+    """Build ``BigMarkerClient``s against the mock server, closing them after the test"""
+    clients = []
+
+    def connect(transport: Optional[Transport] = None, **kwargs) -> BigMarkerClient:
+        transport = transport or Transport(TransportConfig(base_url=server.base_url))
+        client = BigMarkerClient(token="test", transport=transport, **kwargs)
+        clients.append(client)
+        return client
+
+    yield connect
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def cassette(tmp_path):
+    """Path to a cassette file; tests write their own responses into it with ``recorder``"""
+    return str(tmp_path / "responses.cassette")
+
+
+@pytest.fixture
+def recorder(cassette):
+    with CassetteRecorder(cassette) as recorder:
+        yield recorder
+
+
+@pytest.fixture
+def replay(cassette):
+    """Build ``BigMarkerClient``s replaying ``cassette``, closing them after the test"""
+    clients = []
+
+    def replay(config: Optional[ReplayConfig] = None, **kwargs) -> BigMarkerClient:
+        client = BigMarkerClient(token="test", transport=ReplayTransport(cassette, replay=config), **kwargs)
+        clients.append(client)
+        return client
+
+    yield replay
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def chicago(monkeypatch):
+    """Run with a local time zone behind UTC, so local and UTC readings of a naive time differ"""
+    monkeypatch.setenv("TZ", "America/Chicago")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
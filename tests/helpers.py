@@ -0,0 +1,19 @@
+import json
+
+from bigmarker.mock_server import MockDataset
+from bigmarker.ratelimit import RetryPolicy
+
+DATASET = MockDataset(conferences=10, registrations=100, attendees=50, per_page=25)
+# No backoff between attempts, so retry tests do not sleep
+NO_BACKOFF = RetryPolicy(backoff_factor=0, jitter=False)
+
+
+def registration_index(registration) -> int:
+    """Position of a mock registration in its conference's list, recovered from its bmid"""
+    return int(registration.bmid[5:], 16)
+
+
+def conference_page(*conferences: dict) -> bytes:
+    """A single page listing ``conferences``, for recording into a cassette"""
+    return json.dumps({"conferences": list(conferences), "current_page": 1, "per_page": 25, "total_pages": 1,
+                       "total_entries": len(conferences)}).encode()
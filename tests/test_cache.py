@@ -0,0 +1,64 @@
+import json
+
+from bigmarker.cache import ResponseCache
+from bigmarker.transport import ReplayTransport
+from .helpers import DATASET
+
+
+class HeaderLog(ReplayTransport):
+    """Replays a cassette and keeps the headers each request was sent with"""
+
+    def __init__(self, cassette: str):
+        super().__init__(cassette)
+        self.sent: list[dict] = []
+
+    def request(self, method: str, path: str, timed: bool = False, **kwargs):
+        self.sent.append(kwargs.get("headers") or {})
+        return super().request(method, path, timed, **kwargs)
+
+
+def test_fresh_entry_is_served_without_a_request(server, connect):
+    client = connect(cache=ResponseCache(ttl=60))
+
+    first = client.get_conference("mock0000002")
+    second = client.get_conference("mock0000002")
+
+    assert second is first
+    assert server.requests == 1
+
+
+def test_update_invalidates_the_cached_conference(server, connect):
+    client = connect(cache=ResponseCache(ttl=60))
+    client.get_conference("mock0000003")
+
+    client.update_conference("mock0000003", title="Renamed")
+    client.get_conference("mock0000003")
+
+    assert server.requests == 3
+
+
+def test_expired_entry_is_fetched_again(server, connect):
+    client = connect(cache=ResponseCache(ttl=0))
+
+    client.get_conference("mock0000002")
+    client.get_conference("mock0000002")
+
+    assert server.requests == 2
+
+
+def test_stale_entry_is_revalidated_with_its_etag(connect, cassette, recorder):
+    body = json.dumps(DATASET.conference(1)).encode()
+    recorder.record("GET", "conferences/mock0000001", {}, 200, {"ETag": '"v1"'}, body)
+    recorder.record("GET", "conferences/mock0000001", {}, 304, {"ETag": '"v1"'}, b"")
+    recorder.close()
+    transport = HeaderLog(cassette)
+    cache = ResponseCache(ttl=0)
+    client = connect(transport, cache=cache)
+
+    first = client.get_conference("mock0000001")
+    second = client.get_conference("mock0000001")
+
+    assert second == first
+    assert "If-None-Match" not in transport.sent[0]
+    assert transport.sent[1]["If-None-Match"] == '"v1"'
+    assert cache.stats.revalidations == 1
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from bigmarker.aio import AsyncBigMarkerClient, AsyncRecordingTransport, AsyncReplayTransport
+from bigmarker.cassette import Cassette, Replay, ReplayConfig, request_key
+from bigmarker.error.cassette import CassetteMissException
+from bigmarker.transport import RecordingTransport
+from bigmarker.transport_config import TransportConfig
+
+
+def test_replay_matches_the_recorded_session(server, connect, cassette, replay):
+    live = connect(RecordingTransport(cassette, TransportConfig(base_url=server.base_url)))
+    conferences = live.get_all_conferences()
+    registrations = live.get_registrations("mock0000001")
+    conference = live.get_conference("mock0000002")
+    live.close()
+    requests = server.requests
+
+    client = replay()
+
+    assert client.get_all_conferences() == conferences
+    assert client.get_registrations("mock0000001") == registrations
+    assert client.get_conference("mock0000002") == conference
+    assert server.requests == requests
+
+
+def test_async_replay_matches_the_recorded_session(server, cassette):
+    async def read(transport):
+        async with AsyncBigMarkerClient(token="test", transport=transport) as client:
+            return await client.get_registrations("mock0000001"), await client.get_conference("mock0000002")
+
+    recorded = asyncio.run(read(AsyncRecordingTransport(cassette, TransportConfig(base_url=server.base_url))))
+    replayed = asyncio.run(read(AsyncReplayTransport(cassette)))
+
+    assert replayed == recorded
+
+
+def test_identical_bodies_are_stored_once(cassette, recorder):
+    for page in range(3):
+        recorder.record("GET", "conferences", {"params": {"page": page}}, 200, {}, b'{"conferences": []}')
+    recorder.close()
+
+    replayed = Cassette(cassette)
+    entries = [replayed.index[request_key("GET", "conferences", {"params": {"page": page}})][0] for page in range(3)]
+
+    assert len(replayed) == 3
+    assert len({entry.offset for entry in entries}) == 1
+    assert replayed.body(entries[0]) == b'{"conferences": []}'
+    replayed.close()
+
+
+def test_credentials_are_not_recorded(cassette, recorder):
+    recorder.record("GET", "members/login", {"data": "email=a@example.com&password=secret"}, 200, {}, b"{}")
+    recorder.record("GET", "conferences/mock0000001", {}, 200, {"Set-Cookie": "session=1", "ETag": '"v1"'}, b"{}")
+    recorder.close()
+
+    replayed = Cassette(cassette)
+    [entry] = replayed.index["GET conferences/mock0000001"]
+
+    assert len(replayed) == 1
+    assert entry.headers == {"ETag": '"v1"'}
+    replayed.close()
+
+
+def test_unrecorded_request_is_a_miss(recorder, replay):
+    recorder.close()
+
+    with pytest.raises(CassetteMissException):
+        replay().get_conference("mock0000001")
+
+
+def test_injected_faults_do_not_skip_recorded_responses(cassette, recorder):
+    for version in range(3):
+        recorder.record("GET", "conferences/mock0000001", {}, 200, {}, f'{{"version": {version}}}'.encode())
+    recorder.close()
+
+    replayed = Replay(cassette, ReplayConfig(error_rate=0.5))
+    responses = [replayed.respond("GET", "conferences/mock0000001", {}) for _ in range(20)]
+    replayed.close()
+
+    assert any(response.status_code != 200 for response in responses[:3])
+    assert [response.content for response in responses if response.status_code == 200][:4] == \
+        [b'{"version": 0}', b'{"version": 1}', b'{"version": 2}', b'{"version": 2}']
@@ -0,0 +1,37 @@
+import asyncio
+
+from bigmarker.aio import AsyncBigMarkerClient
+from bigmarker.aio.transport import AsyncTransport
+from bigmarker.clients.conference import conference_form
+from bigmarker.models.conference import ConferenceCreate, ConferenceUpdate
+from bigmarker.transport_config import TransportConfig
+
+
+def test_form_keeps_only_set_model_fields():
+    arguments = {"self": object(), "conference_id": "mock0000001", "title": "Renamed", "purpose": None,
+                 "banner_filter_percentage": 0.25}
+
+    assert conference_form(ConferenceUpdate, arguments) == {"title": "Renamed", "banner_filter_percentage": "0.25"}
+
+
+def test_create_and_update(connect):
+    client = connect()
+
+    created = client.create_conference("mockchannel", "Launch", banner_filter_percentage=0.5)
+    updated = client.update_conference("mock0000002", title="Renamed")
+
+    assert (created.channel_id, created.title) == ("mockchannel", "Launch")
+    assert (updated.id, updated.title) == ("mock0000002", "Renamed")
+
+
+def test_async_create_and_update(server):
+    async def write():
+        transport = AsyncTransport(TransportConfig(base_url=server.base_url))
+        async with AsyncBigMarkerClient(token="test", transport=transport) as client:
+            return (await client.create_conference("mockchannel", "Launch"),
+                    await client.update_conference("mock0000002", title="Renamed"))
+
+    created, updated = asyncio.run(write())
+
+    assert created.title == "Launch"
+    assert (updated.id, updated.title) == ("mock0000002", "Renamed")
@@ -0,0 +1,52 @@
+import csv
+import io
+from datetime import datetime, timezone
+
+import pytest
+
+from bigmarker.export import ColumnarExport
+from .helpers import DATASET, conference_page
+
+
+def rows(batches) -> list[dict]:
+    output = io.StringIO()
+    batches.to_csv(output)
+    return list(csv.DictReader(io.StringIO(output.getvalue())))
+
+
+def test_registrations_get_a_conference_column(connect):
+    export = ColumnarExport(connect(), columns=["conference_id", "email", "earned_certificate"])
+
+    exported = rows(export.registrations(["mock0000001", "mock0000002"]))
+
+    assert len(exported) == 2 * DATASET.registrations
+    assert list(exported[0]) == ["conference_id", "email", "earned_certificate"]
+    assert {row["conference_id"] for row in exported} == {"mock0000001", "mock0000002"}
+
+
+def test_batches_hold_batch_size_rows(connect):
+    export = ColumnarExport(connect(), batch_size=40, columns=["id", "email"])
+
+    sizes = [len(batch["id"]) for batch in export.attendees(["mock0000001"])]
+
+    assert sizes == [40, 10]
+
+
+def test_conferences_export_summaries(connect):
+    exported = rows(ColumnarExport(connect()).conferences())
+
+    assert [row["id"] for row in exported] == [DATASET.conference_id(index) for index in range(DATASET.conferences)]
+    assert exported[0]["tags"] == '["tag0"]'
+
+
+def test_arrow_timestamps_keep_fractional_seconds(recorder, replay):
+    pa = pytest.importorskip("pyarrow")
+    conference = DATASET.conference(0) | {"start_time": "2024-01-02T03:04:05.250Z"}
+    recorder.record("GET", "conferences", {"params": {"type": "all", "start_time": 0}}, 200, {},
+                    conference_page(conference))
+    recorder.close()
+
+    table = ColumnarExport(replay(), columns=["id", "start_time"]).conferences().to_arrow()
+
+    assert table.schema.field("start_time").type == pa.timestamp("us", tz="UTC")
+    assert table.column("start_time")[0].as_py() == datetime(2024, 1, 2, 3, 4, 5, 250000, tzinfo=timezone.utc)
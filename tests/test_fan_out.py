@@ -0,0 +1,37 @@
+import time
+
+import pytest
+
+from .helpers import DATASET, registration_index
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_fan_out_tags_every_record_with_its_conference(connect, workers):
+    conference_ids = [DATASET.conference_id(index) for index in range(5)]
+
+    rows = connect().get_registrations_for(conference_ids, workers=workers)
+
+    assert len(rows) == 5 * DATASET.registrations
+    for conference_id in conference_ids:
+        records = [registration for row_id, registration in rows if row_id == conference_id]
+        assert sorted(map(registration_index, records)) == list(range(DATASET.registrations))
+        assert all(record.enter_url.path.endswith(conference_id) for record in records)
+
+
+def test_fan_out_covers_attendees(connect):
+    rows = connect().get_attendees_for(["mock0000001", "mock0000002", "mock0000001"])
+
+    assert len(rows) == 2 * DATASET.attendees
+    assert all(attendee.conference_id == conference_id for conference_id, attendee in rows)
+
+
+def test_fan_out_fetches_within_its_window(server, connect):
+    conference_ids = [DATASET.conference_id(index) for index in range(10)]
+    rows = connect().iter_registrations_for(conference_ids, workers=2)
+
+    next(rows)
+    time.sleep(0.2)
+
+    # A paused consumer holds back fetching at the window of twice the workers, plus the page it is reading
+    assert server.requests <= 2 * 2 + 1
+    assert len(list(rows)) == 10 * DATASET.registrations - 1
@@ -0,0 +1,74 @@
+from bigmarker.index import LocalIndex
+from bigmarker.models.conference import Conference
+from bigmarker.sync import ConferenceSync
+from .helpers import DATASET
+
+
+def synced_index(client, tmp_path, **kwargs) -> LocalIndex:
+    index = LocalIndex(client, **kwargs)
+    with ConferenceSync(client, str(tmp_path / "sync.sqlite3")) as sync:
+        sync.sync()
+        index.load(sync)
+    return index
+
+
+def test_lookups_are_answered_locally(server, connect, tmp_path):
+    index = synced_index(connect(), tmp_path)
+    requests = server.requests
+
+    assert index.get_conference("mock0000002").title == "Mock Webinar 2"
+    assert [conference.id for conference in index.search_conference(channel_id="mockchannel", tags=["tag1"])] == \
+           ["mock0000001", "mock0000006"]
+    assert [conference.id for conference in index.search_conference(start_time="2024-01-01T06:00:00Z",
+                                                                     end_time="2024-01-01T12:00:00Z")] == \
+           ["mock0000001", "mock0000002"]
+    assert [conference.id for conference in index.search_conference(presenter_member_ids=["m3"])] == ["mock0000003"]
+    assert server.requests == requests
+
+
+def test_id_misses_fall_back_to_the_api_once(server, connect):
+    index = LocalIndex(connect())
+
+    conference = index.get_conference("mock0000004")
+    assert index.get_conference("mock0000004") is conference
+    assert index.get_conference("mock9999999") is None
+
+    assert "mock0000004" in index
+    assert server.requests == 2
+
+
+def test_unmatched_search_is_answered_locally(server, connect, tmp_path):
+    index = synced_index(connect(), tmp_path)
+    requests = server.requests
+
+    assert index.search_conference(title="no such webinar") == []
+    assert server.requests == requests
+
+
+def test_unmatched_search_can_fall_back_to_the_api(server, connect):
+    index = LocalIndex(connect(), search_fallback=True)
+
+    conferences = index.search_conference(title="Webinar 7")
+
+    assert [conference.id for conference in conferences] == ["mock0000007"]
+    assert "mock0000007" in index
+    assert server.requests == 1
+
+
+def test_people_are_indexed_by_email(connect):
+    index = LocalIndex(connect())
+    index.index_people("mock0000001")
+
+    registration = index.get_registrations("mock0000001")[5]
+    assert index.registrations_for_email(registration.email.upper()) == [("mock0000001", registration)]
+    assert len(index.get_attendees("mock0000001")) == DATASET.attendees
+
+
+def test_naive_start_times_are_indexed_as_utc(chicago):
+    index = LocalIndex()
+    index.add_conference(Conference(**DATASET.conference(0) | {"start_time": "2024-01-01T10:00:00"}))
+
+    assert [conference.id for conference in index.search_conference(start_time="2024-01-01T09:00:00",
+                                                                     end_time="2024-01-01T11:00:00")] == \
+           ["mock0000000"]
+    assert index.search_conference(start_time="2024-01-01T15:00:00", end_time="2024-01-01T17:00:00") == []
@@ -0,0 +1,36 @@
+import asyncio
+
+from bigmarker.aio import AsyncBigMarkerClient
+from bigmarker.aio.transport import AsyncTransport
+from bigmarker.metrics import MetricsCollector
+from bigmarker.transport_config import TransportConfig
+
+
+def phases(collector: MetricsCollector, endpoint: str) -> set[str]:
+    return {phase for (name, phase), histogram in collector.histograms.items() if name == endpoint and histogram.count}
+
+
+def test_request_phases_are_timed(connect):
+    collector = MetricsCollector()
+    client = connect(hooks=[collector])
+
+    client.get_conference("mock0000001")
+    client.get_conference("mock0000002")
+
+    assert {"connect", "ttfb", "body", "total"} <= phases(collector, "conferences/{id}")
+    assert collector.histograms[("conferences/{id}", "total")].count == 2
+    # The second request reuses the first one's connection
+    assert collector.histograms[("conferences/{id}", "connect")].count == 1
+
+
+def test_async_request_phases_are_timed(server):
+    collector = MetricsCollector()
+
+    async def read():
+        transport = AsyncTransport(TransportConfig(base_url=server.base_url))
+        async with AsyncBigMarkerClient(token="test", transport=transport, hooks=[collector]) as client:
+            await client.get_conference("mock0000001")
+
+    asyncio.run(read())
+
+    assert {"connect", "ttfb", "body", "total"} <= phases(collector, "conferences/{id}")
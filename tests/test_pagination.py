@@ -0,0 +1,85 @@
+import asyncio
+import time
+
+import pytest
+
+from bigmarker.aio import AsyncBigMarkerClient
+from bigmarker.aio.transport import AsyncTransport
+from bigmarker.transport import Transport
+from bigmarker.transport_config import TransportConfig
+from .helpers import DATASET, registration_index
+
+
+class SlowSecondPage(Transport):
+    """Holds back page 2 of every listing so later pages finish first"""
+
+    def request(self, method: str, path: str, timed: bool = False, **kwargs):
+        if (kwargs.get("params") or {}).get("page") == 2:
+            time.sleep(0.3)
+        return super().request(method, path, timed, **kwargs)
+
+
+def test_sequential_pages(connect):
+    registrations = connect().get_registrations("mock0000001")
+
+    assert [registration_index(registration) for registration in registrations] == list(range(100))
+
+
+def test_concurrent_pages_keep_page_order(server, connect):
+    client = connect(SlowSecondPage(TransportConfig(base_url=server.base_url)), page_workers=4)
+
+    registrations = client.get_registrations("mock0000001")
+
+    assert [registration_index(registration) for registration in registrations] == list(range(100))
+
+
+def test_unordered_pages_yield_in_completion_order(server, connect):
+    client = connect(SlowSecondPage(TransportConfig(base_url=server.base_url)), page_workers=4, ordered_pages=False)
+
+    positions = [registration_index(registration) for registration in client.get_registrations("mock0000001")]
+
+    assert sorted(positions) == list(range(100))
+    assert positions[:25] == list(range(25))
+    assert positions[-25:] == list(range(25, 50))
+
+
+@pytest.mark.parametrize("ordered_pages", [True, False])
+def test_concurrent_pages_fetch_within_a_window(server, connect, ordered_pages):
+    server.dataset = DATASET.model_copy(update={"registrations": 2000})
+    registrations = connect(page_workers=4, ordered_pages=ordered_pages).iter_registrations("mock0000001")
+
+    for _ in range(30):
+        next(registrations)
+    time.sleep(0.2)
+
+    # The first page, plus a window of twice the page workers in flight or waiting to be read
+    assert server.requests <= 1 + 4 * 2
+    assert len(list(registrations)) == 2000 - 30
+
+
+def test_concurrent_async_pages_fetch_within_a_window(server):
+    server.dataset = DATASET.model_copy(update={"registrations": 2000})
+
+    async def read_then_pause():
+        transport = AsyncTransport(TransportConfig(base_url=server.base_url))
+        async with AsyncBigMarkerClient(token="test", transport=transport, page_workers=4) as client:
+            registrations = client.iter_registrations("mock0000001")
+            for _ in range(30):
+                await anext(registrations)
+            await asyncio.sleep(0.2)
+            requests = server.requests
+            return requests, len([registration async for registration in registrations])
+
+    requests, rest = asyncio.run(read_then_pause())
+
+    assert requests <= 1 + 4 * 2
+    assert rest == 2000 - 30
+
+
+def test_decode_processes_default_to_concurrent_pages(connect):
+    assert connect(decode_processes=2)._page_workers == 3
+
+
+def test_decode_processes_reject_sequential_pages(connect):
+    with pytest.raises(ValueError, match="page_workers=1"):
+        connect(page_workers=1, decode_processes=2)
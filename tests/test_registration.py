@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+from bigmarker.checkpoint import RegistrationCheckpoint
+from bigmarker.models.registrations import UserRegistrant
+
+
+def registrants(count: int, missing_at: int = -1) -> list[UserRegistrant]:
+    return [UserRegistrant(id="mock9999999" if index == missing_at else "mock0000001",
+                           first_name="Jane",
+                           last_name=f"Doe {index}")
+            for index in range(count)]
+
+
+def test_results_are_reported_per_row(connect):
+    results = connect().register_users(registrants(6, missing_at=2), workers=3)
+
+    assert [result.index for result in results] == list(range(6))
+    assert [result.ok for result in results] == [True, True, False, True, True, True]
+    assert results[2].error == "The conference you are requesting is not found."
+    assert results[0].url == "https://www.bigmarker.com/mockchannel/mock0000001"
+
+
+def test_resume_skips_rows_the_checkpoint_completed(server, connect, tmp_path):
+    checkpoint = str(tmp_path / "registrations.jsonl")
+    with open(checkpoint, "w") as file:
+        file.writelines(json.dumps({"index": index, "url": None}) + "\n" for index in range(4))
+
+    results = connect().register_users(registrants(10), checkpoint=checkpoint)
+
+    assert [result.index for result in results] == list(range(4, 10))
+    assert server.requests == 6
+    assert RegistrationCheckpoint(checkpoint).completed == set(range(10))
+
+
+def test_failed_rows_are_retried_on_resume(server, connect, tmp_path):
+    checkpoint = str(tmp_path / "registrations.jsonl")
+    client = connect()
+    client.register_users(registrants(5, missing_at=3), checkpoint=checkpoint)
+
+    rerun = client.register_users(registrants(5), checkpoint=checkpoint)
+
+    assert [(result.index, result.ok) for result in rerun] == [(3, True)]
+    assert server.requests == 6
+
+
+def test_resume_after_a_torn_last_line(server, connect, tmp_path):
+    checkpoint = tmp_path / "registrations.jsonl"
+    checkpoint.write_text("".join(json.dumps({"index": index, "url": None}) + "\n" for index in range(3))
+                          + '{"index": 3, "ur')
+
+    results = connect().register_users(registrants(5), checkpoint=str(checkpoint))
+
+    assert [result.index for result in results] == [3, 4]
+    assert sorted(json.loads(line)["index"] for line in checkpoint.read_text().splitlines()) == [0, 1, 2, 3, 4]
+
+
+def test_resume_after_an_unterminated_last_line(tmp_path):
+    checkpoint = tmp_path / "registrations.jsonl"
+    checkpoint.write_text(json.dumps({"index": 0, "url": None}))
+
+    with RegistrationCheckpoint(str(checkpoint)) as progress:
+        progress.record(1, None)
+
+    assert RegistrationCheckpoint(str(checkpoint)).completed == {0, 1}
+
+
+def test_corruption_before_the_last_line_is_not_skipped(tmp_path):
+    checkpoint = tmp_path / "registrations.jsonl"
+    checkpoint.write_text('{"index": 0, "ur\n' + json.dumps({"index": 1, "url": None}) + "\n")
+
+    with pytest.raises(ValueError):
+        RegistrationCheckpoint(str(checkpoint))
@@ -0,0 +1,67 @@
+import pytest
+
+from bigmarker.cassette import ReplayConfig
+from bigmarker.error.api import RateLimitException
+from bigmarker.ratelimit import RetryPolicy, TokenBucket
+from bigmarker.transport import RecordingTransport
+from bigmarker.transport_config import TransportConfig
+from .helpers import NO_BACKOFF, registration_index
+
+
+@pytest.fixture
+def recorded_registrations(server, connect, cassette):
+    client = connect(RecordingTransport(cassette, TransportConfig(base_url=server.base_url)))
+    client.get_registrations("mock0000001")
+    client.close()
+
+
+def test_rate_limited_pages_are_retried(recorded_registrations, replay):
+    client = replay(ReplayConfig(rate_limit_rate=0.5, retry_after=0, seed=7),
+                    retry=NO_BACKOFF.model_copy(update={"max_retries": 20}))
+
+    registrations = client.get_registrations("mock0000001")
+
+    assert [registration_index(registration) for registration in registrations] == list(range(100))
+
+
+def test_server_errors_are_retried(recorded_registrations, replay):
+    client = replay(ReplayConfig(error_rate=0.5, seed=3), retry=NO_BACKOFF.model_copy(update={"max_retries": 20}))
+
+    assert len(client.get_registrations("mock0000001")) == 100
+
+
+def test_persistent_rate_limit_raises_after_the_last_attempt(recorded_registrations, replay):
+    client = replay(ReplayConfig(rate_limit_rate=1.0, retry_after=0),
+                    retry=NO_BACKOFF.model_copy(update={"max_retries": 2}))
+
+    with pytest.raises(RateLimitException, match="after 3 attempts") as raised:
+        client.get_registrations("mock0000001")
+
+    assert raised.value.status_code == 429
+
+
+def test_rate_limits_slow_the_shared_bucket(recorded_registrations, replay):
+    bucket = TokenBucket(1000)
+    client = replay(ReplayConfig(rate_limit_rate=0.5, retry_after=0, seed=7), rate_limiter=bucket,
+                    retry=NO_BACKOFF.model_copy(update={"max_retries": 20}))
+
+    client.get_registrations("mock0000001")
+
+    assert bucket.rate < bucket.max_rate
+
+
+def test_retry_after_sets_the_backoff():
+    policy = RetryPolicy(backoff_factor=0.1, jitter=False)
+
+    assert policy.backoff(0) == pytest.approx(0.1)
+    assert policy.backoff(0, "2") == 2
+    assert policy.backoff(0, "not a date") == pytest.approx(0.1)
+
+
+def test_non_idempotent_requests_only_retry_rate_limits():
+    policy = RetryPolicy()
+
+    assert policy.should_retry("POST", 429, 0)
+    assert not policy.should_retry("POST", 503, 0)
+    assert policy.should_retry("GET", 503, 0)
+    assert not policy.should_retry("GET", 503, policy.max_retries)
@@ -0,0 +1,48 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from bigmarker.aio import AsyncBigMarkerClient
+from bigmarker.aio.transport import AsyncTransport
+from bigmarker.singleflight import SingleFlight
+from bigmarker.transport_config import TransportConfig
+from .helpers import DATASET
+
+
+def test_concurrent_reads_are_coalesced(server, connect):
+    server.latency = 0.3
+    client = connect(single_flight=SingleFlight())
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: client.get_conference("mock0000004"), range(8)))
+
+    assert server.requests == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_concurrent_async_reads_are_coalesced(server):
+    server.latency = 0.3
+
+    async def read_concurrently():
+        transport = AsyncTransport(TransportConfig(base_url=server.base_url))
+        async with AsyncBigMarkerClient(token="test", transport=transport, single_flight=SingleFlight()) as client:
+            return await asyncio.gather(*(client.get_registrations("mock0000004") for _ in range(8)))
+
+    results = asyncio.run(read_concurrently())
+
+    assert server.requests == DATASET.registrations // DATASET.per_page
+    assert all(result is results[0] for result in results)
+
+
+def test_failures_are_raised_and_not_kept():
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        flight.do("key", fail)
+
+    assert len(flight) == 0
+    assert flight.do("key", lambda: 1) == 1
@@ -0,0 +1,68 @@
+from datetime import datetime, timezone
+
+from bigmarker.mock_server import MockDataset
+from bigmarker.sync import ConferenceSync
+from .helpers import DATASET, conference_page
+
+
+def test_first_run_adds_every_conference(connect, tmp_path):
+    with ConferenceSync(connect(), str(tmp_path / "sync.sqlite3")) as sync:
+        changes = sync.sync()
+
+        assert [change.kind for change in changes] == ["added"] * DATASET.conferences
+        assert len(sync) == DATASET.conferences
+        assert sync.get("mock0000003").title == "Mock Webinar 3"
+        assert sync.watermark is not None
+
+
+def test_full_run_reports_only_differences(server, connect, tmp_path):
+    with ConferenceSync(connect(), str(tmp_path / "sync.sqlite3")) as sync:
+        sync.sync()
+        assert sync.sync(full=True) == []
+
+        # One conference fewer, and every remaining record's stats change
+        server.dataset = MockDataset(conferences=DATASET.conferences - 1, registrations=DATASET.registrations + 1,
+                                     attendees=DATASET.attendees, per_page=DATASET.per_page)
+        changes = sync.sync(full=True)
+
+    kinds = {change.conference_id: change.kind for change in changes}
+    assert kinds.pop(DATASET.conference_id(DATASET.conferences - 1)) == "removed"
+    assert set(kinds.values()) == {"changed"}
+    assert len(kinds) == DATASET.conferences - 1
+
+
+def test_incremental_run_only_reads_after_the_watermark(connect, tmp_path):
+    with ConferenceSync(connect(), str(tmp_path / "sync.sqlite3")) as sync:
+        sync.sync()
+
+        # The mock conferences all started in 2024, long before the watermark's lookback
+        assert sync.sync() == []
+        assert len(sync) == DATASET.conferences
+
+
+def test_invalid_records_are_rejected_and_keep_the_stored_version(cassette, recorder, replay, tmp_path):
+    valid, invalid = DATASET.conference(0), DATASET.conference(1) | {"start_time": "not a time"}
+    params = {"params": {"type": "all", "start_time": 0}}
+    recorder.record("GET", "conferences", params, 200, {}, conference_page(valid, DATASET.conference(1)))
+    recorder.record("GET", "conferences", params, 200, {}, conference_page(valid, invalid))
+    recorder.close()
+
+    with ConferenceSync(replay(), str(tmp_path / "sync.sqlite3")) as sync:
+        sync.sync()
+        changes = sync.sync(full=True)
+
+        assert changes == []
+        assert list(sync.rejected) == ["mock0000001"]
+        assert sync.get("mock0000001").title == "Mock Webinar 1"
+
+
+def test_naive_start_times_are_stored_as_utc(chicago, recorder, replay, tmp_path):
+    recorder.record("GET", "conferences", {"params": {"type": "all", "start_time": 0}}, 200, {},
+                    conference_page(DATASET.conference(0) | {"start_time": "2024-01-01T10:00:00"}))
+    recorder.close()
+
+    with ConferenceSync(replay(), str(tmp_path / "sync.sqlite3")) as sync:
+        sync.sync()
+        [(start_time,)] = sync._connection.execute("SELECT start_time FROM conferences").fetchall()
+
+    assert start_time == datetime(2024, 1, 1, 10, tzinfo=timezone.utc).timestamp()